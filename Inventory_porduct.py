@@ -1,9 +1,20 @@
 import streamlit as st
-from PIL import Image
+from utils.assets import load_asset
 from scripts.data_processing import load_data, validate_data
+from utils.data_processing import history_columns, is_history_column, is_numeric_column
+from utils.excel_reader import read_excel_projected
+from utils.calculations import calculate_scenarios
+from utils.derived_columns import DerivedColumns
+from utils.forecasting import forecast_frame
+from utils.simulation import DEMAND_SCENARIOS, simulate_inventory
+from utils.stock_warnings import evaluate_warnings
+from utils.abc_analysis import abc_classification
+from utils.table_view import render_table
+from utils.file_management import store_upload
+from utils.arima_service import DEFAULT_ORDER, fit_arima, sku_keys
 import pandas as pd
-import plotly.express as px
 import numpy as np
+import uuid
 import os
 
 # --- File Management Setup ---
@@ -18,10 +29,10 @@ st.set_page_config(page_title="Inventory Management Dashboard", layout="wide")
 # App Title
 logo_path = '/Users/aviluvchik/Python Projects/inventory_dashboard/superpharm_logo.png'
 try:
-    logo = Image.open(logo_path)
+    logo = load_asset(logo_path)  # Read once per process
     col1, col2 = st.columns([1, 8])
     col1.image(logo, use_column_width=True)
-except FileNotFoundError:
+except ValueError:
     st.warning("Logo not found. Please upload the logo file.")
     col2 = st.columns([1, 8])[1]
 col2.title("Inventory Management Dashboard")
@@ -45,16 +56,15 @@ if "start" in st.session_state and st.session_state.start:
     uploaded_file = st.sidebar.file_uploader("Upload your Excel file", type=["xlsx"])
 
     if uploaded_file:
-        # Save the uploaded file locally
-        file_path = os.path.join(UPLOAD_DIR, uploaded_file.name)
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        # Store the upload by content; its SHA-256 identifies the dataset in caches
+        if "session_id" not in st.session_state:
+            st.session_state.session_id = uuid.uuid4().hex
+        file_hash, file_path = store_upload(uploaded_file, UPLOAD_DIR, st.session_state.session_id)
         st.sidebar.success(f"File uploaded and saved as {uploaded_file.name}")
 
         # Load and Validate Data
         try:
             def load_data(file):
-                df = pd.read_excel(file)
                 # Rename columns if they match known alternatives
                 column_mappings = {
                     "משפחה": "Category",
@@ -67,7 +77,10 @@ if "start" in st.session_state and st.session_state.start:
                     "חודשי מלאי": "Months of Inventory"
                 }
 
-                df.rename(columns=column_mappings, inplace=True)
+                # Stream only the mapped columns instead of the whole sheet
+                df = read_excel_projected(
+                    file, column_mappings, keep=is_history_column, numeric_columns=is_numeric_column
+                )
 
                 # Add required columns if missing
                 required_columns = ["Item", "Stock Level", "Purchase Price", "Reorder Point"]
@@ -77,7 +90,12 @@ if "start" in st.session_state and st.session_state.start:
 
                 return df
 
-            data = load_data(file_path)
+            # Keep one copy per upload content so derived columns survive reruns
+            if st.session_state.get("derived_key") != file_hash:
+                st.session_state.derived = DerivedColumns(load_data(file_path))
+                st.session_state.derived_key = file_hash
+            derived = st.session_state.derived
+            data = derived.data
             st.sidebar.success("Data loaded successfully!")
 
             # Navigator Dashboard
@@ -85,12 +103,15 @@ if "start" in st.session_state and st.session_state.start:
             tabs = ["Overview", "Detailed Analysis", "Forecasting", "Decision-Making Tools", "Warnings", "Pareto Analysis"]
             selected_tab = st.sidebar.radio("Go to", tabs)
 
+            # Tabs import the chart helpers (and plotly.express) only when opened
             if selected_tab == "Overview":
+                from utils.chart_data import category_bar_chart
+
                 ### New Tab: Overview Tab ###
                 st.write("### Inventory Overview")
                 if "Category" in data.columns:
-                    fig = px.bar(
-                        data, x="Category", y="Stock Level",
+                    fig = category_bar_chart(
+                        data, "Category", "Stock Level",
                         title="Stock Levels by Category",
                         labels={"Category": "Category", "Stock Level": "Stock Level"}
                     )
@@ -99,89 +120,118 @@ if "start" in st.session_state and st.session_state.start:
                     st.error("The required column 'Category' is not available in the uploaded data.")
 
             elif selected_tab == "Detailed Analysis":
+                from utils.chart_data import histogram_chart, item_bar_chart
+
                 ### New Tab: Detailed Inventory Analysis Tab ###
                 st.write("### Detailed Inventory Analysis")
 
                 # Add Reorder Point (ROP) and Economic Order Quantity (EOQ)
                 if "Item" in data.columns and "Stock Level" in data.columns:
                     safety_factor = st.slider("Safety Factor (Z)", 0.0, 3.0, 1.65)
-
-                    # Handle missing or invalid data
-                    data["Lead Time"] = data["Lead Time"].fillna(7).clip(lower=0)  # Replace NaN and avoid negatives
-                    data["Average Daily Demand"] = data["Stock Level"].fillna(0) / 30  # Replace NaN and avoid negatives
-                    data["Lead Time Demand"] = data["Average Daily Demand"] * data["Lead Time"]
-                    data["Safety Stock"] = safety_factor * (
-                        data["Average Daily Demand"] * np.sqrt(data["Lead Time"])
-                    ).fillna(0)  # Replace invalid results with 0
-                    data["Reorder Point"] = data["Lead Time Demand"] + data["Safety Stock"]
-
                     ordering_cost = st.number_input("Ordering Cost per Order", min_value=1, value=100)
                     holding_cost = st.number_input("Holding Cost per Unit", min_value=1, value=10)
 
-                    data["EOQ"] = np.sqrt(
-                        (2 * data["Average Daily Demand"].fillna(0) * ordering_cost) /
-                        holding_cost
-                    ).fillna(0).round(2)
+                    # Only columns that depend on a changed input are recomputed
+                    derived.update(safety_factor=safety_factor, ordering_cost=ordering_cost, holding_cost=holding_cost)
 
                     st.write("### Reorder Point and EOQ")
-                    st.dataframe(data[["Item", "Reorder Point", "EOQ"]])
+                    render_table(data, "reorder", ["Item", "Reorder Point", "EOQ"])
 
-                    fig_rop = px.bar(
-                        data, x="Item", y="Reorder Point",
-                        title="Reorder Points by Item"
+                    fig_rop = item_bar_chart(
+                        data, "Item", "Reorder Point",
+                        title="Reorder Points by Item (Top Items)"
                     )
                     st.plotly_chart(fig_rop, use_container_width=True)
+                    st.plotly_chart(
+                        histogram_chart(data, "Reorder Point", "Reorder Point Distribution"),
+                        use_container_width=True,
+                    )
+
+                    with st.expander("Safety Factor Sensitivity"):
+                        # One broadcast pass covers the whole sweep
+                        sweep = np.round(np.arange(0.0, 3.01, 0.25), 2)
+                        sweep_result = calculate_scenarios(data, sweep, ordering_cost, holding_cost)
+                        st.line_chart(pd.DataFrame({
+                            "Safety Factor": sweep,
+                            "Total Safety Stock": sweep_result[0].sum(axis=1),
+                            "Total Reorder Point": sweep_result[1].sum(axis=1),
+                        }).set_index("Safety Factor"))
                 else:
                     st.error("The required columns for detailed analysis are missing.")
 
             elif selected_tab == "Forecasting":
+                from utils.chart_data import item_bar_chart
+
                 ### New Tab: Forecasting Tab ###
                 st.write("### Forecasting")
                 st.markdown("Below is the forecasting analysis for your inventory data.")
 
-                if "Item" in data.columns and "Stock Level" in data.columns:
-                    models = ["ARIMA", "Prophet", "Linear Regression"] * (len(data) // 3 + 1)
-                    forecasting_results = pd.DataFrame({
-                        "Item": data["Item"],
-                        "Model": models[:len(data)],
-                        "Forecasted Demand": np.random.randint(50, 500, len(data)),
-                    })
-
+                forecasting_results = forecast_frame(data)
+                if "Item" in data.columns and forecasting_results is not None:
                     st.write("### Forecasting Results")
-                    st.dataframe(forecasting_results)
+                    render_table(forecasting_results, "forecast")
 
-                    fig = px.bar(
+                    fig = item_bar_chart(
                         forecasting_results, 
-                        x="Item", 
-                        y="Forecasted Demand", 
+                        "Item", 
+                        "Forecasted Demand", 
                         color="Model", 
                         barmode="group",
                         title="Forecasted Demand by Model"
                     )
                     st.plotly_chart(fig, use_container_width=True)
+
+                    with st.expander("Refine with ARIMA"):
+                        arima_items = st.number_input(
+                            "Items to fit (highest forecast first)", min_value=1, max_value=len(data), value=min(50, len(data))
+                        )
+                        if st.button("Fit ARIMA models"):
+                            top = forecasting_results["Forecasted Demand"].nlargest(int(arima_items)).index
+                            progress_bar = st.progress(0.0, text="Fitting ARIMA models...")
+                            arima_forecast = fit_arima(
+                                sku_keys(data).loc[top].tolist(),
+                                data.loc[top, history_columns(data.columns)].to_numpy(dtype="float64", na_value=np.nan),
+                                progress=lambda done, total: progress_bar.progress(
+                                    done / total, text=f"Fitted {done} of {total} items"
+                                ),
+                            )
+                            st.dataframe(pd.DataFrame({
+                                "Item": data.loc[top, "Item"],
+                                "Model": "ARIMA" + str(DEFAULT_ORDER),
+                                "Forecasted Demand": arima_forecast[:, 0].round(2),
+                            }))
                 else:
-                    st.error("The required columns for forecasting are missing.")
+                    st.error("The required columns for forecasting (item and monthly sales history) are missing.")
 
             elif selected_tab == "Decision-Making Tools":
+                from utils.chart_data import item_bar_chart
+
                 ### New Tab: Decision-Making Tools Tab ###
                 st.write("### Decision-Making Tools")
                 st.markdown("Below is a scenario analysis to help make informed inventory decisions.")
 
                 if "Item" in data.columns and "Stock Level" in data.columns:
-                    scenario_analysis = pd.DataFrame({
-                        "Item": data["Item"],
-                        "Scenario": np.random.choice(["High Demand", "Low Demand", "Normal Demand"], len(data)),
-                        "Adjusted Stock Levels": np.random.randint(10, 500, len(data)),
-                        "Profit Impact": np.random.randint(-1000, 10000, len(data)),
-                    })
+                    n_simulations = st.slider("Simulated demand paths", 100, 10000, 1000, step=100)
+                    demand_cv = st.slider("Demand variability (coefficient of variation)", 0.05, 1.0, 0.3)
+                    # Reorder points feed the stockout probability
+                    derived.update()
+                    scenario_analysis = pd.concat([
+                        simulate_inventory(
+                            data, n_simulations, demand_multiplier=multiplier, demand_cv=demand_cv, seed=0
+                        ).assign(Item=data["Item"], Scenario=scenario)
+                        for scenario, multiplier in DEMAND_SCENARIOS.items()
+                    ]).rename(columns={"Expected Profit": "Profit Impact"})
+                    scenario_analysis = scenario_analysis[
+                        ["Item", "Scenario", "Profit Impact", "Profit Std", "Stockout Probability", "Expected Overstock Cost"]
+                    ]
 
                     st.write("### Scenario Analysis Results")
-                    st.dataframe(scenario_analysis)
+                    render_table(scenario_analysis, "scenarios")
 
-                    fig = px.bar(
+                    fig = item_bar_chart(
                         scenario_analysis, 
-                        x="Item", 
-                        y="Profit Impact", 
+                        "Item", 
+                        "Profit Impact", 
                         color="Scenario", 
                         barmode="group",
                         title="Profit Impact by Scenario"
@@ -197,44 +247,40 @@ if "start" in st.session_state and st.session_state.start:
                     "This tab highlights potential issues in your inventory management system to help you take action proactively."
                 )
 
-                if "Item" in data.columns:
+                if "Item" in data.columns and "Stock Level" in data.columns:
+                    derived.update()  # Warnings compare stock against the reorder point
+                    warning_result = evaluate_warnings(data)
                     warnings = pd.DataFrame({
                         "Item": data["Item"],
-                        "Priority": np.random.choice(["Order Now - Out of Stock", "Delayed Order - Overstock"], len(data)),
-                        "Risk Level": np.random.choice(["High", "Medium", "Low"], len(data)),
+                        "Status": warning_result.status,
+                        "Priority": warning_result.priority,
+                        "Risk Level": warning_result.risk,
                     })
 
                     st.write("### Inventory Warnings Table")
-                    st.dataframe(warnings)
+                    render_table(warnings, "warnings", sort_by="Risk Level")
                 else:
                     st.error("The required columns for warnings are missing.")
 
             elif selected_tab == "Pareto Analysis":
+                from utils.chart_data import item_bar_chart
+
                 ### New Tab: Pareto Analysis Tab ###
                 st.write("### Pareto Analysis (ABC Classification)")
 
                 if "Selling Price" in data.columns and "Stock Level" in data.columns:
-                    # Handle missing data with defaults
-                    data["Selling Price"] = data["Selling Price"].fillna(0)
-                    data["Stock Level"] = data["Stock Level"].fillna(0)
-
-                    # Calculate total value and cumulative percentage
-                    data["Total Value"] = data["Selling Price"] * data["Stock Level"]
-                    data.sort_values("Total Value", ascending=False, inplace=True)
-                    data["Cumulative Percentage"] = (
-                        data["Total Value"].cumsum() / data["Total Value"].sum() * 100
-                    )
-                    data["ABC Classification"] = pd.cut(
-                        data["Cumulative Percentage"],
-                        bins=[0, 80, 95, 100],
-                        labels=["A", "B", "C"]
-                    )
+                    # Total value and cumulative percentage (missing values count as 0)
+                    derived.update(value_column="Selling Price")
+                    data["ABC Classification"] = abc_classification(data, "Selling Price", dataset_key=file_hash)
 
                     st.write("### ABC Classification Table")
-                    st.dataframe(data[["Item", "Total Value", "Cumulative Percentage", "ABC Classification"]])
+                    render_table(
+                        data, "abc", ["Item", "Total Value", "Cumulative Percentage", "ABC Classification"],
+                        sort_by="Total Value", descending=True,
+                    )
 
-                    fig_pareto = px.bar(
-                        data, x="Item", y="Total Value",
+                    fig_pareto = item_bar_chart(
+                        data, "Item", "Total Value",
                         color="ABC Classification",
                         title="Pareto Analysis (ABC Classification)",
                         labels={"Total Value": "Total Value", "ABC Classification": "Class"}
@@ -243,10 +289,10 @@ if "start" in st.session_state and st.session_state.start:
                 else:
                     st.error("The required columns 'Selling Price' and 'Stock Level' are missing.")
 
-            except Exception as e:
-                st.error(f"An error occurred: {e}")
-        else:
-            st.write("Upload an Excel file to begin.")
+        except Exception as e:
+            st.error(f"An error occurred: {e}")
+    else:
+        st.write("Upload an Excel file to begin.")
 
 # Footer
 st.markdown("---")
@@ -1,12 +1,18 @@
 # File: app_la.py
 
 import streamlit as st
-from utils.file_management import save_uploaded_file
-from utils.data_processing import load_and_process_data
+from utils.file_management import store_upload
+from utils.ingest_cache import load_cached_data
+from utils.compact_types import compact_types, memory_report
 from utils.calculations import calculate_reorder_point_and_eoq
+from utils.forecasting import forecast_frame
+from utils.stock_warnings import evaluate_warnings
+from utils.table_view import render_table
+from utils.table_format import RISK_BACKGROUNDS, css_by_category
 from utils.config import UPLOAD_DIR, CLIENT_LOGO
+from utils.assets import load_asset
 import pandas as pd
-import plotly.express as px
+import uuid
 
 # Streamlit App Configuration
 st.set_page_config(page_title="Inventory Management Dashboard", layout="wide")
@@ -37,9 +43,8 @@ if not st.session_state.authenticated:
     st.stop()
 
 # --- App Title ---
-CLIENT_LOGO = "/Users/aviluvchik/Python Projects/inventory_dashboard/uploaded_files/superpharm_logo.png"
 try:
-    st.image(CLIENT_LOGO, use_column_width=False, width=150)
+    st.image(load_asset(CLIENT_LOGO), use_column_width=False, width=150)
 except Exception:
     st.warning("Client logo not found or inaccessible.")
 # --- File Upload ---
@@ -48,9 +53,16 @@ uploaded_file = st.sidebar.file_uploader("Upload your Excel file", type=["xlsx"]
 
 if uploaded_file:
     # Save and process the uploaded file
-    file_path = save_uploaded_file(uploaded_file, UPLOAD_DIR)
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    file_hash, file_path = store_upload(uploaded_file, UPLOAD_DIR, st.session_state.session_id)
     st.sidebar.success(f"File uploaded and saved as {uploaded_file.name}")
-    st.session_state.uploaded_data = load_and_process_data(file_path)
+    if st.session_state.get("uploaded_hash") != file_hash:
+        # Smaller column types for the session copy; the report shows the saving
+        st.session_state.uploaded_data, st.session_state.memory_report = compact_types(
+            load_cached_data(file_path, file_hash)
+        )
+        st.session_state.uploaded_hash = file_hash
 
 # Ensure data is loaded from session state
 if st.session_state.uploaded_data is not None:
@@ -62,18 +74,29 @@ else:
 # --- Calculate Reorder Point and EOQ ---
 try:
     data = calculate_reorder_point_and_eoq(data)
-    data["Forecasted Demand"] = data["Stock Level"] * 1.1  # Forecast demand with a simple multiplier
+    forecasting_results = forecast_frame(data)
+    if forecasting_results is not None:
+        data["Forecasted Demand"] = forecasting_results["Forecasted Demand"]
+    else:
+        data["Forecasted Demand"] = data["Stock Level"] * 1.1  # No sales history: simple multiplier
 except Exception as e:
     st.error(f"Error calculating Reorder Point and EOQ: {e}")
     st.stop()
 
+# Rebuilt on every rerun: the columns assigned above change the session copy's footprint
+with st.sidebar.expander("Memory usage"):
+    st.dataframe(memory_report(data, st.session_state.memory_report), use_container_width=True)
+
 # --- Navigation Tabs ---
 st.sidebar.header("Navigation")
 tabs = ["Overview", "Inventory Insights", "Inventory Tracker", "Financial Analysis (Premium)"]
 selected_tab = st.sidebar.radio("Go to", tabs)
 
 # --- Overview Tab ---
+# Chart tabs import plotly only when opened
 if selected_tab == "Overview":
+    from utils.chart_data import category_bar_chart, category_pie_chart
+
     st.write("### Inventory Overview")
     st.write("#### Key Metrics")
     st.metric("Total Stock", int(data["Stock Level"].sum()))
@@ -81,48 +104,44 @@ if selected_tab == "Overview":
     st.metric("Total Reorder Points", int(data["Reorder Point"].count()))
 
     # Bar Chart
-    fig_bar = px.bar(data, x="Category", y="Stock Level", title="Stock Levels by Category")
+    fig_bar = category_bar_chart(data, "Category", "Stock Level", title="Stock Levels by Category")
     st.plotly_chart(fig_bar, use_container_width=True)
 
     # Pie Chart
-    fig_pie = px.pie(data, values="Stock Level", names="Category", title="Stock Distribution by Category")
+    fig_pie = category_pie_chart(data, "Category", "Stock Level", title="Stock Distribution by Category")
     st.plotly_chart(fig_pie, use_container_width=True)
 
 # --- Inventory Insights Tab (Merged Forecasting and Detailed Analysis) ---
 elif selected_tab == "Inventory Insights":
     st.write("### Inventory Insights")
     # Display combined table
-    st.dataframe(data[["Item", "Stock Level", "Reorder Point", "EOQ", "Forecasted Demand"]])
+    render_table(data, "insights", ["Item", "Stock Level", "Reorder Point", "EOQ", "Forecasted Demand"])
 
 # --- Inventory Tracker Tab ---
 elif selected_tab == "Inventory Tracker":
     st.write("### Inventory Tracker")
 
+    # All rules are evaluated in one pass; sections select rows by position
+    warnings = evaluate_warnings(data)
+    # Stock Level highlight per row, computed once for all sections
+    stock_styles = {"Stock Level": css_by_category(warnings.risk, RISK_BACKGROUNDS)}
+
     # Low Stock
-    low_stock = data[data["Stock Level"] < data["Reorder Point"]]
     st.write("#### Low Stock Warnings (High Priority)")
-    st.dataframe(
-        low_stock.style.applymap(lambda _: "background-color: red;", subset=["Stock Level"])
-    )
+    render_table(data, "low_stock", rows=warnings.positions(risk="High"), cell_styles=stock_styles)
 
     # Overstock
-    overstock = data[data["Stock Level"] > data["Reorder Point"] * 2]
     st.write("#### Overstock Warnings (Medium Priority)")
-    st.dataframe(
-        overstock.style.applymap(lambda _: "background-color: orange;", subset=["Stock Level"])
-    )
+    render_table(data, "overstock", rows=warnings.positions(risk="Medium"), cell_styles=stock_styles)
 
     # Normal Stock
-    normal_stock = data[
-        (data["Stock Level"] >= data["Reorder Point"]) & (data["Stock Level"] <= data["Reorder Point"] * 2)
-    ]
     st.write("#### Normal Stock Levels (Low Priority)")
-    st.dataframe(
-        normal_stock.style.applymap(lambda _: "background-color: green;", subset=["Stock Level"])
-    )
+    render_table(data, "normal_stock", rows=warnings.positions(risk="Low"), cell_styles=stock_styles)
 
 # --- Financial Analysis Tab ---
 elif selected_tab == "Financial Analysis (Premium)":
+    from utils.chart_data import item_bar_chart
+
     st.write("### Financial Analysis")
     st.write("#### Profit Optimization Tool")
 
@@ -140,10 +159,12 @@ elif selected_tab == "Financial Analysis (Premium)":
 
     # Display Results
     st.write("### Simulation Results")
-    st.dataframe(adjusted_data[["Item", "Adjusted Selling Price", "Adjusted Demand", "Adjusted Cost", "Profit"]])
+    render_table(
+        adjusted_data, "simulation", ["Item", "Adjusted Selling Price", "Adjusted Demand", "Adjusted Cost", "Profit"]
+    )
 
     # Profit Visualization
-    fig_simulation = px.bar(adjusted_data, x="Item", y="Profit", title="Profit by Item (After Simulation)")
+    fig_simulation = item_bar_chart(adjusted_data, "Item", "Profit", title="Profit by Top Items (After Simulation)")
     st.plotly_chart(fig_simulation, use_container_width=True)
 
 # --- Footer ---
@@ -1,22 +1,28 @@
 # File: app_la.py
 
 import streamlit as st
-from utils.file_management import save_uploaded_file
-from utils.data_processing import load_and_process_data
-from utils.calculations import calculate_reorder_point_and_eoq
-from utils.config import UPLOAD_DIR, CLIENT_LOGO
-from fpdf import FPDF  # Fix: Import PDF library
+from utils.file_management import store_upload
+from utils.ingest_cache import load_cached_data
+from utils.store_consolidation import load_stores, store_name
+from utils.snapshot_store import (
+    append_snapshot, load_snapshots, previous_snapshot_date, snapshot_date_from_name, snapshot_store_key,
+)
+from utils.compact_types import compact_types
+from utils.derived_columns import DERIVED_RULES, OBSERVED_DEMAND_RULES, DerivedColumns
+from utils.demand_history import MIN_DEMAND_INTERVALS, attach_demand, derive_demand
+from utils.stock_warnings import evaluate_warnings
+from utils.abc_analysis import abc_classification
+from utils.table_view import render_table
+from utils.table_format import RISK_TEXT_COLORS, css_by_category, css_where
+from utils.config import UPLOAD_DIR, CLIENT_LOGO, STORE_COLUMN
+from utils.assets import load_asset
+import datetime
+import hashlib
 import os
+import uuid
 import pandas as pd
-import plotly.express as px
-# Simple Authentication Logic
-import bcrypt
-
-# Predefined users
-users = {
-    "johndoe": bcrypt.hashpw("password123".encode("utf-8"), bcrypt.gensalt()).decode("utf-8"),
-    "janedoe": bcrypt.hashpw("secret456".encode("utf-8"), bcrypt.gensalt()).decode("utf-8"),
-}
+from utils.auth import check_password, issue_token, load_credentials, verify_token
+from utils.instrumentation import Profiler
 
 # Authentication Form
 st.sidebar.title("Login")
@@ -24,159 +30,303 @@ username = st.sidebar.text_input("Username")
 password = st.sidebar.text_input("Password", type="password")
 login_button = st.sidebar.button("Login")
 
-if "authenticated" not in st.session_state:
-    st.session_state.authenticated = False
-
+# bcrypt runs only when the Login button is pressed; later reruns only check the signed token
 if login_button:
-    if username in users and bcrypt.checkpw(password.encode("utf-8"), users[username].encode("utf-8")):
-        st.session_state.authenticated = True
+    if check_password(load_credentials(), username, password):
+        st.session_state.auth_token = issue_token(username)
         st.sidebar.success(f"Welcome {username}!")
     else:
         st.sidebar.error("Invalid username or password.")
 
-if not st.session_state.authenticated:
+if verify_token(st.session_state.get("auth_token")) is None:
     st.stop()
 
 # --- App Title ---
-st.image(CLIENT_LOGO, use_column_width=False, width=150)
+try:
+    st.image(load_asset(CLIENT_LOGO), use_column_width=False, width=150)
+except ValueError:
+    st.warning("Client logo not found or inaccessible.")
 st.title("Inventory Management Dashboard")
 
 # File Upload Section
 st.sidebar.header("Upload Inventory Data")
-uploaded_file = st.sidebar.file_uploader("Upload your Excel file", type=["xlsx"])
+uploaded_files = st.sidebar.file_uploader(
+    "Upload your Excel file (several files are consolidated by store)", type=["xlsx"], accept_multiple_files=True
+)
 
-if not uploaded_file:
+if not uploaded_files:
     st.title("Welcome to the Inventory Management Dashboard!")
     st.write("Please upload an Excel file using the sidebar to get started.")
     st.stop()
 
-# Save the uploaded file
-file_path = save_uploaded_file(uploaded_file, UPLOAD_DIR)
-st.sidebar.success(f"File uploaded and saved as {uploaded_file.name}")
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
 
-# Load and process the data
-try:
-    data = load_and_process_data(file_path)
-    data.columns = data.columns.map(str)  # Fix column name warnings
-    st.write("File successfully processed!")
-    st.dataframe(data.head())
-except Exception as e:
-    st.error(f"Error processing file: {e}")
-    st.stop()
 
-# Calculate Reorder Point and EOQ (Global)
-try:
-    data = calculate_reorder_point_and_eoq(data)
-except Exception as e:
-    st.error(f"Error calculating Reorder Point and EOQ: {e}")
-    st.stop()
+@st.cache_data(max_entries=8, show_spinner="Building PDF report...")
+def financial_pdf(_frame, file_hash, price_adjustment, demand_growth, cost_reduction):
+    """PDF of the financial simulation; the frame is identified by the hash and parameters."""
+    from utils.pdf_report import build_pdf_report
 
-# Navigator Dashboard
-st.sidebar.header("Navigation")
-tabs = ["Overview", "Detailed Analysis", "Forecasting", "Warnings", "Pareto Analysis", "Financial Analysis (Premium)"]
-selected_tab = st.sidebar.radio("Go to", tabs)
-
-if selected_tab == "Overview":
-    st.write("### Inventory Overview")
-    st.write("#### Key Metrics")
-    st.metric("Total Stock", int(data["Stock Level"].sum()))
-    st.metric("Total Categories", int(data["Category"].nunique()))
-    st.metric("Total Reorder Points", int(data["Reorder Point"].count()))
-
-    # Bar Chart
-    fig_bar = px.bar(data, x="Category", y="Stock Level", title="Stock Levels by Category")
-    st.plotly_chart(fig_bar, use_container_width=True)
-
-    # Pie Chart
-    fig_pie = px.pie(data, values="Stock Level", names="Category", title="Stock Distribution by Category")
-    st.plotly_chart(fig_pie, use_container_width=True)
-
-elif selected_tab == "Detailed Analysis":
-    st.write("### Detailed Inventory Analysis")
-    st.dataframe(data[["Item", "Reorder Point", "EOQ"]])
-
-elif selected_tab == "Forecasting":
-    st.write("### Forecasting")
-    data["Forecasted Demand"] = data["Stock Level"] * 1.1
-    st.dataframe(data[["Item", "Stock Level", "Forecasted Demand"]])
-
-elif selected_tab == "Warnings":
-    st.write("### Warnings and Risks")
-
-    # Low Stock Warnings
-    low_stock = data[data["Stock Level"] < data["Reorder Point"]]
-    st.write("#### Low Stock Warnings")
-    st.dataframe(low_stock.style.applymap(lambda v: "color: red;" if v else "", subset=["Stock Level"]))
-
-    # Overstock Warnings
-    overstock = data[data["Stock Level"] > data["Reorder Point"] * 2]
-    st.write("#### Overstock Warnings")
-    st.dataframe(overstock.style.applymap(lambda v: "color: orange;" if v else "", subset=["Stock Level"]))
-
-elif selected_tab == "Pareto Analysis":
-    st.write("### Pareto Analysis (ABC Classification)")
-    data["Total Value"] = data["Stock Level"] * data["Purchase Price"]
-    data.sort_values("Total Value", ascending=False, inplace=True)
-    data["Cumulative Percentage"] = (
-        data["Total Value"].cumsum() / data["Total Value"].sum() * 100
-    )
-    data["ABC Classification"] = pd.cut(
-        data["Cumulative Percentage"], bins=[0, 80, 95, 100], labels=["A", "B", "C"]
-    )
-    st.dataframe(data[["Item", "Total Value", "Cumulative Percentage", "ABC Classification"]])
-
-elif selected_tab == "Financial Analysis (Premium)":
-    st.write("### Financial Analysis")
-    st.write("#### Profit Optimization Tool")
-
-    # User Inputs
-    price_adjustment = st.slider("Adjust Selling Price (%)", 80, 150, 100)
-    demand_growth = st.slider("Expected Demand Growth (%)", -20, 50, 10)
-    cost_reduction = st.slider("Cost Reduction (%)", 0, 20, 0)
-
-    # Simulate Adjustments
-    adjusted_data = data.copy()
-    adjusted_data["Adjusted Selling Price"] = adjusted_data["Selling Price"] * (price_adjustment / 100)
-    adjusted_data["Adjusted Demand"] = adjusted_data["Stock Level"] * (1 + demand_growth / 100)
-    adjusted_data["Adjusted Cost"] = adjusted_data["Purchase Price"] * (1 - cost_reduction / 100)
-    adjusted_data["Profit"] = (adjusted_data["Adjusted Selling Price"] - adjusted_data["Adjusted Cost"]) * adjusted_data["Adjusted Demand"]
-
-    # Display Results
-    st.write("### Simulation Results")
-    st.dataframe(adjusted_data[["Item", "Adjusted Selling Price", "Adjusted Demand", "Adjusted Cost", "Profit"]])
-
-    # Profit Visualization
-    fig_simulation = px.bar(adjusted_data, x="Item", y="Profit", title="Profit by Item (After Simulation)")
-    st.plotly_chart(fig_simulation, use_container_width=True)
-
-    # Export to Excel
-    st.download_button(
-        label="Download Excel Report",
-        data=adjusted_data.to_csv(index=False).encode("utf-8"),
-        file_name="financial_analysis.csv",
-        mime="text/csv",
+    return build_pdf_report(
+        _frame, ["Item", "Adjusted Selling Price", "Adjusted Demand", "Adjusted Cost", "Profit"],
+        title="Financial Analysis Report",
     )
 
-    # Export to PDF
-    from fpdf import FPDF
-
-    def generate_pdf(dataframe):
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        pdf.cell(200, 10, txt="Financial Analysis Report", ln=True, align="C")
-        for index, row in dataframe.iterrows():
-            # Sanitize data to prevent encoding errors
-            sanitized_row = {k: str(v).encode("latin1", "replace").decode("latin1") for k, v in row.to_dict().items()}
-            pdf.cell(200, 10, txt=str(sanitized_row), ln=True, align="L")
-        return pdf.output(dest="S").encode("latin1")
-
-    st.download_button(
-        label="Download PDF Report",
-        data=generate_pdf(adjusted_data),
-        file_name="financial_analysis.pdf",
-        mime="application/pdf",
-    )
+
+@st.cache_data(max_entries=8, show_spinner="Building Excel report...")
+def financial_xlsx(_data, _frame, file_hash, price_adjustment, demand_growth, cost_reduction):
+    """Final_Results-style workbook with the analysis sheets and the financial simulation."""
+    from utils.excel_export import export_workbook, final_results_sheets
+
+    abc = abc_classification(_data, "Purchase Price", dataset_key=file_hash)
+    sheets = final_results_sheets(_data, evaluate_warnings(_data), abc, _frame)
+    path = export_workbook(sheets)
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(path)
+
+
+# Per-stage timings of this run, shown in the sidebar and appended to the performance log
+perf = Profiler(enabled=st.sidebar.checkbox("Record performance"), context={"session": st.session_state.session_id})
+perf_panel = st.sidebar.expander("Performance")
+
+try:
+    # Save the uploaded file
+    with perf.stage("upload"):
+        stored = [store_upload(f, UPLOAD_DIR, st.session_state.session_id) for f in uploaded_files]
+    if len(stored) == 1:
+        file_hash, file_path = stored[0]
+    else:
+        # The consolidated dataset is identified by the hashes of its workbooks, in order
+        file_hash = hashlib.sha256("".join(h for h, _ in stored).encode("utf-8")).hexdigest()
+    st.sidebar.success(f"Files uploaded and saved: {', '.join(f.name for f in uploaded_files)}")
+
+    # Load and process the data (once per uploaded file; reruns reuse the session copy)
+    try:
+        if st.session_state.get("derived_key") != file_hash:
+            with perf.stage("load"):
+                if len(stored) == 1:
+                    data = load_cached_data(file_path, file_hash)
+                else:
+                    data = load_stores([p for _, p in stored], names=[store_name(f.name) for f in uploaded_files])
+                data.columns = data.columns.map(str)  # Fix column name warnings
+                data["Stock Level"] = data["Stock Level"].fillna(0).clip(lower=0)
+                data["Lead Time"] = data["Lead Time"].fillna(7).clip(lower=0)
+            with perf.stage("compact"):
+                data, st.session_state.memory_report = compact_types(data)
+
+            # Keep a dated history of every store's upload for period-over-period comparisons;
+            # monthly files of one store share a history under the file name without its date.
+            # Re-uploading a store's latest workbook (e.g. an undated file on a later day)
+            # records no new snapshot, so it is not read as a period without sales.
+            st.session_state.snapshots = []
+            with perf.stage("snapshots"):
+                for f, (upload_hash, _) in zip(uploaded_files, stored):
+                    label = store_name(f.name)
+                    rows = data if len(stored) == 1 else data[data[STORE_COLUMN] == label]
+                    store = snapshot_store_key(label)
+                    snapshot_date = snapshot_date_from_name(label) or datetime.date.today()
+                    try:
+                        snapshot_date = append_snapshot(rows, store, snapshot_date, content_hash=upload_hash)
+                        st.session_state.snapshots.append((store, snapshot_date, label))
+                    except ValueError as e:
+                        st.warning(f"Snapshot of {label} was not saved: {e}")
+
+            # Measure demand from the stores' snapshot history where items have enough of it
+            rules = DERIVED_RULES
+            with perf.stage("demand"):
+                history = load_snapshots(stores=[s[0] for s in st.session_state.snapshots], columns=["Item", "Stock Level"])
+                if history["Snapshot Date"].nunique() > 1:
+                    demand = derive_demand(history)
+                    if (demand["Intervals"] >= MIN_DEMAND_INTERVALS).any():
+                        attach_demand(data, demand, store_key=snapshot_store_key)
+                        rules = OBSERVED_DEMAND_RULES
+            st.session_state.derived = DerivedColumns(data, rules, params={"value_column": "Purchase Price"})
+            st.session_state.derived_key = file_hash
+        derived = st.session_state.derived
+        data = derived.data
+        st.write("File successfully processed!")
+        st.dataframe(data.head())
+        with st.sidebar.expander("Memory usage"):
+            st.dataframe(st.session_state.memory_report, use_container_width=True)
+    except Exception as e:
+        st.error(f"Error processing file: {e}")
+        st.stop()
+
+    # Calculate Reorder Point and EOQ (Global); only stale columns are recomputed
+    try:
+        with perf.stage("rop_eoq"):
+            derived.update()
+    except Exception as e:
+        st.error(f"Error calculating Reorder Point and EOQ: {e}")
+        st.stop()
+
+
+    # Navigator Dashboard
+    st.sidebar.header("Navigation")
+    tabs = ["Overview", "Detailed Analysis", "Forecasting", "Warnings", "Pareto Analysis", "Financial Analysis (Premium)"]
+    selected_tab = st.sidebar.radio("Go to", tabs)
+
+    # Consolidated uploads lead every table with the Store column so it can be filtered on
+    store_columns = [STORE_COLUMN] if STORE_COLUMN in data.columns else []
+
+    # Tabs import plotly only when opened; the report builders import fpdf and xlsxwriter on first use
+    if selected_tab == "Overview":
+        from utils.chart_data import category_bar_chart, category_pie_chart
+
+        st.write("### Inventory Overview")
+        st.write("#### Key Metrics")
+        st.metric("Total Stock", int(data["Stock Level"].sum()))
+        st.metric("Total Categories", int(data["Category"].nunique()))
+        st.metric("Total Reorder Points", int(data["Reorder Point"].count()))
+
+        # Bar Chart
+        with perf.stage("charts"):
+            fig_bar = category_bar_chart(data, "Category", "Stock Level", title="Stock Levels by Category")
+            st.plotly_chart(fig_bar, use_container_width=True)
+
+            # Pie Chart
+            fig_pie = category_pie_chart(data, "Category", "Stock Level", title="Stock Distribution by Category")
+            st.plotly_chart(fig_pie, use_container_width=True)
+
+            # Per-store view of consolidated uploads
+            if STORE_COLUMN in data.columns:
+                st.metric("Total Stores", int(data[STORE_COLUMN].nunique()))
+                fig_store = category_bar_chart(data, STORE_COLUMN, "Stock Level", title="Stock Levels by Store")
+                st.plotly_chart(fig_store, use_container_width=True)
+
+        # Compare each store with its previous snapshot
+        for store, snapshot_date, label in st.session_state.get("snapshots", []):
+            previous = previous_snapshot_date(store, snapshot_date)
+            if previous is not None:
+                before = load_snapshots(stores=[store], start=previous, end=previous, columns=["Stock Level"])
+                current = data if STORE_COLUMN not in data.columns else data[data[STORE_COLUMN] == label]
+                total = current["Stock Level"].sum()
+                st.metric(
+                    f"Stock at {store} ({snapshot_date:%d.%m.%Y})", f"{total:,.0f}",
+                    delta=f"{total - before['Stock Level'].sum():,.0f} vs {previous:%d.%m.%Y}",
+                )
+
+    elif selected_tab == "Detailed Analysis":
+        st.write("### Detailed Inventory Analysis")
+        with perf.stage("table"):
+            render_table(data, "reorder", store_columns + ["Item", "Reorder Point", "EOQ"])
+
+    elif selected_tab == "Forecasting":
+        from utils.forecasting import forecast_frame
+
+        st.write("### Forecasting")
+        with perf.stage("forecast"):
+            forecasting_results = forecast_frame(data)
+        if forecasting_results is not None:
+            data["Forecast Model"] = forecasting_results["Model"]
+            data["Forecasted Demand"] = forecasting_results["Forecasted Demand"]
+            with perf.stage("table"):
+                render_table(data, "forecast", store_columns + ["Item", "Stock Level", "Forecast Model", "Forecasted Demand"])
+        else:
+            st.error("The uploaded file has no monthly sales history to forecast from.")
+
+    elif selected_tab == "Warnings":
+        st.write("### Warnings and Risks")
+
+        # All rules are evaluated in one pass; sections select rows by position
+        with perf.stage("warnings"):
+            warnings = evaluate_warnings(data)
+        # Colour non-zero stock levels by risk, computed once as whole-column arrays
+        stock_styles = {
+            "Stock Level": css_where(data["Stock Level"].to_numpy() != 0, css_by_category(warnings.risk, RISK_TEXT_COLORS))
+        }
+
+        # Low Stock Warnings (out of stock or below the reorder point)
+        with perf.stage("table"):
+            st.write("#### Low Stock Warnings")
+            render_table(data, "low_stock", rows=warnings.positions(risk="High"), cell_styles=stock_styles)
+
+            # Overstock Warnings
+            st.write("#### Overstock Warnings")
+            render_table(data, "overstock", rows=warnings.positions(status="Overstock"), cell_styles=stock_styles)
+
+    elif selected_tab == "Pareto Analysis":
+        st.write("### Pareto Analysis (ABC Classification)")
+        # Total Value and Cumulative Percentage are kept current by the derived-column graph
+        with perf.stage("abc"):
+            data["ABC Classification"] = abc_classification(data, "Purchase Price", dataset_key=file_hash)
+        with perf.stage("table"):
+            render_table(
+                data, "abc", store_columns + ["Item", "Total Value", "Cumulative Percentage", "ABC Classification"],
+                sort_by="Total Value", descending=True,
+            )
+
+    elif selected_tab == "Financial Analysis (Premium)":
+        from utils.chart_data import item_bar_chart
+
+        st.write("### Financial Analysis")
+        st.write("#### Profit Optimization Tool")
+
+        # User Inputs
+        price_adjustment = st.slider("Adjust Selling Price (%)", 80, 150, 100)
+        demand_growth = st.slider("Expected Demand Growth (%)", -20, 50, 10)
+        cost_reduction = st.slider("Cost Reduction (%)", 0, 20, 0)
+
+        # Simulate Adjustments
+        adjusted_data = data.copy()
+        adjusted_data["Adjusted Selling Price"] = adjusted_data["Selling Price"] * (price_adjustment / 100)
+        adjusted_data["Adjusted Demand"] = adjusted_data["Stock Level"] * (1 + demand_growth / 100)
+        adjusted_data["Adjusted Cost"] = adjusted_data["Purchase Price"] * (1 - cost_reduction / 100)
+        adjusted_data["Profit"] = (adjusted_data["Adjusted Selling Price"] - adjusted_data["Adjusted Cost"]) * adjusted_data["Adjusted Demand"]
+
+        # Display Results
+        st.write("### Simulation Results")
+        with perf.stage("table"):
+            render_table(
+                adjusted_data, "simulation",
+                store_columns + ["Item", "Adjusted Selling Price", "Adjusted Demand", "Adjusted Cost", "Profit"],
+            )
+
+        # Profit Visualization
+        with perf.stage("charts"):
+            fig_simulation = item_bar_chart(adjusted_data, "Item", "Profit", title="Profit by Top Items (After Simulation)")
+            st.plotly_chart(fig_simulation, use_container_width=True)
+
+        # Reports are cached per dataset and parameters
+        report_key = (file_hash, price_adjustment, demand_growth, cost_reduction)
+
+        # Export to Excel, streamed to a temp file only when requested
+        if st.button("Prepare Excel Report"):
+            with perf.stage("xlsx_export"):
+                st.session_state["xlsx_report"] = (report_key, financial_xlsx(data, adjusted_data, *report_key))
+        prepared = st.session_state.get("xlsx_report")
+        if prepared is not None and prepared[0] == report_key:
+            st.download_button(
+                label="Download Excel Report",
+                data=prepared[1],
+                file_name="financial_analysis.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            )
+
+        # Export to PDF, built only when requested
+        if st.button("Prepare PDF Report"):
+            with perf.stage("pdf_export"):
+                st.session_state["pdf_report"] = (report_key, financial_pdf(adjusted_data, *report_key))
+        prepared = st.session_state.get("pdf_report")
+        if prepared is not None and prepared[0] == report_key:
+            st.download_button(
+                label="Download PDF Report",
+                data=prepared[1],
+                file_name="financial_analysis.pdf",
+                mime="application/pdf",
+            )
+finally:
+    # Stage timings of this run, kept when the run ends early through st.stop()
+    perf.close()
+    if perf.records:
+        with perf_panel:
+            st.dataframe(perf.frame(), use_container_width=True)
+        perf.flush()
+
 # Footer
 st.markdown("---")
 st.markdown("**Powered by SG Consulting | Created by Drishti.com Consulting**")
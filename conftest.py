@@ -0,0 +1,2 @@
+# File: conftest.py
+# Puts the repository root on sys.path so tests import utils.* and scripts.* like the apps do
@@ -1,10 +1,12 @@
 # main.py
 import streamlit as st
-from PIL import Image
+from utils.assets import load_asset
 from scripts.data_processing import load_data, validate_data
 from scripts.inventory_analysis import calculate_inventory_metrics
+from utils.forecasting import forecast_frame
+from utils.simulation import DEMAND_SCENARIOS, simulate_inventory
+from utils.table_view import render_table
 import pandas as pd
-import plotly.express as px
 import numpy as np
 
 # Streamlit App Configuration
@@ -12,7 +14,7 @@ st.set_page_config(page_title="Inventory Management Dashboard", layout="wide")
 
 # App Title
 logo_path = '/Users/aviluvchik/Python Projects/inventory_dashboard/superpharm_logo.png'
-logo = Image.open(logo_path)
+logo = load_asset(logo_path)  # Read once per process
 col1, col2 = st.columns([1, 8])
 col1.image(logo, use_column_width=True)
 col2.title("Inventory Management Dashboard")
@@ -72,12 +74,15 @@ if "start" in st.session_state and st.session_state.start:
             tabs = ["Overview", "Detailed Analysis", "Forecasting", "Decision-Making Tools", "Warnings"]
             selected_tab = st.sidebar.radio("Go to", tabs)
 
+            # Tabs import the chart helpers (and plotly.express) only when opened
             if selected_tab == "Overview":
+                from utils.chart_data import category_bar_chart
+
                 ### New Tab: Overview Tab ###
                 st.write("### Inventory Overview")
                 if "Category" in data.columns:
-                    fig = px.bar(
-                        data, x="Category", y="Stock Level",
+                    fig = category_bar_chart(
+                        data, "Category", "Stock Level",
                         title="Stock Levels by Category",
                         labels={"Category": "Category", "Stock Level": "Stock Level"}
                     )
@@ -86,12 +91,14 @@ if "start" in st.session_state and st.session_state.start:
                     st.error("The required column 'Category' is not available in the uploaded data.")
 
             elif selected_tab == "Detailed Analysis":
+                from utils.chart_data import item_bar_chart
+
                 ### New Tab: Detailed Inventory Analysis Tab ###
                 st.write("### Detailed Inventory Analysis")
                 if "Item" in data.columns and "Stock Level" in data.columns:
-                    fig = px.histogram(
-                        data, x="Item", y="Stock Level",
-                        title="Stock Levels by Item",
+                    fig = item_bar_chart(
+                        data, "Item", "Stock Level",
+                        title="Stock Levels by Item (Top Items)",
                         labels={"Item": "Item", "Stock Level": "Stock Level"}
                     )
                     st.plotly_chart(fig, use_container_width=True)
@@ -99,49 +106,55 @@ if "start" in st.session_state and st.session_state.start:
                     st.error("The required columns for detailed analysis are missing.")
 
             elif selected_tab == "Forecasting":
+                from utils.chart_data import item_bar_chart
+
                 ### New Tab: Forecasting Tab ###
                 st.write("### Forecasting")
                 st.markdown("Below is the forecasting analysis for your inventory data.")
 
-                models = ["ARIMA", "Prophet", "Linear Regression"] * (len(data) // 3 + 1)
-                forecasting_results = pd.DataFrame({
-                    "Item": data["Item"],
-                    "Model": models[:len(data)],
-                    "Forecasted Demand": np.random.randint(50, 500, len(data)),
-                })
-
-                st.write("### Forecasting Results")
-                st.dataframe(forecasting_results)
-
-                fig = px.bar(
-                    forecasting_results, 
-                    x="Item", 
-                    y="Forecasted Demand", 
-                    color="Model", 
-                    barmode="group",
-                    title="Forecasted Demand by Model"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                forecasting_results = forecast_frame(data)
+                if "Item" in data.columns and forecasting_results is not None:
+                    st.write("### Forecasting Results")
+                    render_table(forecasting_results, "forecast")
+
+                    fig = item_bar_chart(
+                        forecasting_results, 
+                        "Item", 
+                        "Forecasted Demand", 
+                        color="Model", 
+                        barmode="group",
+                        title="Forecasted Demand by Model"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.error("The required columns for forecasting (item and monthly sales history) are missing.")
 
             elif selected_tab == "Decision-Making Tools":
+                from utils.chart_data import item_bar_chart
+
                 ### New Tab: Decision-Making Tools Tab ###
                 st.write("### Decision-Making Tools")
                 st.markdown("Below is a scenario analysis to help make informed inventory decisions.")
 
-                scenario_analysis = pd.DataFrame({
-                    "Item": data["Item"],
-                    "Scenario": np.random.choice(["High Demand", "Low Demand", "Normal Demand"], len(data)),
-                    "Adjusted Stock Levels": np.random.randint(10, 500, len(data)),
-                    "Profit Impact": np.random.randint(-1000, 10000, len(data)),
-                })
+                n_simulations = st.slider("Simulated demand paths", 100, 10000, 1000, step=100)
+                demand_cv = st.slider("Demand variability (coefficient of variation)", 0.05, 1.0, 0.3)
+                scenario_analysis = pd.concat([
+                    simulate_inventory(
+                        data, n_simulations, demand_multiplier=multiplier, demand_cv=demand_cv, seed=0
+                    ).assign(Item=data["Item"], Scenario=scenario)
+                    for scenario, multiplier in DEMAND_SCENARIOS.items()
+                ]).rename(columns={"Expected Profit": "Profit Impact"})
+                scenario_analysis = scenario_analysis[
+                    ["Item", "Scenario", "Profit Impact", "Profit Std", "Stockout Probability", "Expected Overstock Cost"]
+                ]
 
                 st.write("### Scenario Analysis Results")
-                st.dataframe(scenario_analysis)
+                render_table(scenario_analysis, "scenarios")
 
-                fig = px.bar(
+                fig = item_bar_chart(
                     scenario_analysis, 
-                    x="Item", 
-                    y="Profit Impact", 
+                    "Item", 
+                    "Profit Impact", 
                     color="Scenario", 
                     barmode="group",
                     title="Profit Impact by Scenario"
@@ -160,13 +173,13 @@ if "start" in st.session_state and st.session_state.start:
                 ).round(2)
 
                 st.write("### Adjusted Profit Analysis")
-                st.dataframe(adjusted_data[["Item", "Selling Price", "Profit Potential"]])
+                render_table(adjusted_data, "profit", ["Item", "Selling Price", "Profit Potential"])
 
-                fig_adjusted = px.bar(
+                fig_adjusted = item_bar_chart(
                     adjusted_data, 
-                    x="Item", 
-                    y="Profit Potential", 
-                    title="Adjusted Profit Potential"
+                    "Item", 
+                    "Profit Potential", 
+                    title="Adjusted Profit Potential (Top Items)"
                 )
                 st.plotly_chart(fig_adjusted, use_container_width=True)
 
@@ -184,7 +197,7 @@ if "start" in st.session_state and st.session_state.start:
                 })
 
                 st.write("### Inventory Warnings Table")
-                st.dataframe(warnings)
+                render_table(warnings, "warnings")
 
         except Exception as e:
             st.error(f"An error occurred: {e}")
@@ -0,0 +1,122 @@
+# File: scripts/batch_analysis.py
+"""Run the inventory analysis over a directory of workbooks without the dashboard.
+
+Usage (from the repository root):
+    python -m scripts.batch_analysis <input_dir> [-o results] [-j 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils.abc_analysis import abc_classification
+from utils.data_processing import load_and_process_data
+from utils.derived_columns import DerivedColumns
+from utils.excel_export import export_workbook, final_results_sheets
+from utils.forecasting import forecast_frame
+from utils.stock_warnings import evaluate_warnings
+from utils.store_consolidation import discover_workbooks, store_name
+
+STAGES = ("load", "derived", "forecast", "warnings", "abc", "export")
+
+
+def output_names(paths):
+    """Result file stem per workbook; names found in several directories get the directory as a prefix."""
+    stems = [store_name(p) for p in paths]
+    return [
+        f"{os.path.basename(os.path.dirname(os.path.abspath(p)))}_{stem}" if stems.count(stem) > 1 else stem
+        for p, stem in zip(paths, stems)
+    ]
+
+
+def analyse_workbook(path, output_path, value_column="Selling Price"):
+    """Run the full pipeline on one workbook and return its row count and stage timings."""
+    timings = {}
+    start = time.perf_counter()
+
+    def lap(stage):
+        nonlocal start
+        now = time.perf_counter()
+        timings[stage] = now - start
+        start = now
+
+    data = load_and_process_data(path)  # Reads and renames the mapped columns in one pass
+    data["Stock Level"] = data["Stock Level"].fillna(0).clip(lower=0)
+    data["Lead Time"] = data["Lead Time"].fillna(7).clip(lower=0)
+    lap("load")
+    # ROP/EOQ, Total Value and Cumulative Percentage, as the dashboard derives them
+    DerivedColumns(data, params={"value_column": value_column}).update()
+    lap("derived")
+    forecast = forecast_frame(data)
+    if forecast is not None:
+        data["Forecast Model"] = forecast["Model"]
+        data["Forecasted Demand"] = forecast["Forecasted Demand"]
+    lap("forecast")
+    warnings = evaluate_warnings(data)
+    lap("warnings")
+    abc = abc_classification(data, value_column)
+    lap("abc")
+    export_workbook(final_results_sheets(data, warnings, abc), output_path)
+    lap("export")
+    return {"file": path, "rows": len(data), "output": output_path, "timings": timings}
+
+
+def run_batch(paths, output_dir, max_workers=None, value_column="Selling Price"):
+    """Analyse every workbook in its own worker process; failures are reported, not raised."""
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(analyse_workbook, path, os.path.join(output_dir, f"{name}_Final_Results.xlsx"), value_column): path
+            for path, name in zip(paths, output_names(paths))
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({"file": futures[future], "error": str(e)})
+    return sorted(results, key=lambda r: r["file"])
+
+
+def print_report(results, elapsed):
+    name_width = max([len(r["file"]) for r in results] + [4])
+    print(f"{'File':<{name_width}}  {'Rows':>9}  " + "  ".join(f"{s:>8}" for s in STAGES) + f"  {'Total':>8}")
+    for r in results:
+        name = r["file"]
+        if "error" in r:
+            print(f"{name:<{name_width}}  FAILED: {r['error']}")
+            continue
+        stages = "  ".join(f"{r['timings'][s]:>7.2f}s" for s in STAGES)
+        print(f"{name:<{name_width}}  {r['rows']:>9,}  {stages}  {sum(r['timings'].values()):>7.2f}s")
+
+    done = [r for r in results if "error" not in r]
+    rows = sum(r["rows"] for r in done)
+    print(
+        f"\n{len(done)}/{len(results)} files, {rows:,} rows in {elapsed:.2f}s "
+        f"({len(done) / elapsed:.2f} files/s, {rows / elapsed:,.0f} rows/s)"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch inventory analysis over a directory of Excel workbooks.")
+    parser.add_argument("input_dir", nargs="+", help="Directories containing .xlsx workbooks")
+    parser.add_argument("-o", "--output-dir", default="results", help="Where to write the result workbooks")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--value-column", default="Selling Price", help="Price column used for ABC classification")
+    args = parser.parse_args(argv)
+
+    paths = discover_workbooks(*args.input_dir)
+    if not paths:
+        print("No .xlsx workbooks found.", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = run_batch(paths, args.output_dir, args.workers, args.value_column)
+    print_report(results, time.perf_counter() - start)
+    return 0 if all("error" not in r for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# File: scripts/benchmark.py
+"""Time each stage of the analysis pipeline on synthetic workbooks and save the results as JSON.
+
+Usage (from the repository root):
+    python -m scripts.benchmark [--sizes 1000 100000 1000000] [-o benchmark_results.json]
+
+Workbooks are generated once per size and seed (see scripts.generate_inventory)
+and reused by later runs. Compare the JSON files of two commits to spot regressions.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+from scripts.generate_inventory import generate_workbook, workbook_path
+from utils.abc_analysis import abc_classification
+from utils.calculations import calculate_reorder_point_and_eoq
+from utils.chart_data import category_bar_chart, histogram_chart, item_bar_chart
+from utils.data_processing import COLUMN_MAPPINGS, is_history_column, is_numeric_column
+from utils.excel_export import export_workbook, final_results_sheets
+from utils.excel_reader import read_excel_projected
+from utils.pdf_report import build_pdf_report
+from utils.stock_warnings import evaluate_warnings
+
+DEFAULT_SIZES = [1000, 100_000, 1_000_000]
+
+# Rows rendered in the PDF stage; a full 1M-row PDF would be ~20k pages
+PDF_MAX_ROWS = 10_000
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def benchmark_workbook(path, pdf_max_rows=PDF_MAX_ROWS):
+    """Run every stage once on one workbook and return {stage: seconds}."""
+    timings = {}
+
+    def timed(stage, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    # Parse with the Hebrew headers kept, so renaming is timed on its own
+    identity = {source: source for source in COLUMN_MAPPINGS}
+    hebrew_numeric = {source for source, name in COLUMN_MAPPINGS.items() if is_numeric_column(name)}
+    data = timed(
+        "excel_parse", read_excel_projected, path, identity,
+        keep=is_history_column, numeric_columns=lambda c: c in hebrew_numeric or is_history_column(c),
+    )
+    data = timed("rename", data.rename, columns=COLUMN_MAPPINGS)
+    data = timed("rop_eoq", calculate_reorder_point_and_eoq, data)
+    abc = timed("abc", abc_classification, data, "Selling Price")
+    warnings = timed("warnings", evaluate_warnings, data)
+
+    def build_charts():
+        for fig in (
+            item_bar_chart(data, "Item", "Stock Level", title="Stock"),
+            category_bar_chart(data, "Category", "Stock Level", title="Stock by Category"),
+            histogram_chart(data, "Reorder Point", title="Reorder Points"),
+        ):
+            fig.to_json()  # Include the serialization Streamlit does
+
+    timed("charts", build_charts)
+    timed(
+        "pdf_export", build_pdf_report, data.head(pdf_max_rows),
+        ["Item", "Category", "Stock Level", "Reorder Point", "EOQ"], title="Benchmark",
+    )
+    timed("csv_export", data.to_csv, index=False)
+    fd, xlsx_path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        timed("xlsx_export", export_workbook, final_results_sheets(data, warnings, abc), xlsx_path)
+    finally:
+        os.remove(xlsx_path)
+    return len(data), timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stage-by-stage benchmark of the inventory pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Rows per synthetic workbook")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", default="uploaded_files/synthetic", help="Where generated workbooks are kept")
+    parser.add_argument("--pdf-max-rows", type=int, default=PDF_MAX_ROWS)
+    parser.add_argument("-o", "--output", default="benchmark_results.json")
+    args = parser.parse_args(argv)
+
+    results = []
+    for rows in args.sizes:
+        path = workbook_path(rows, args.seed, args.data_dir)
+        if not os.path.exists(path):
+            print(f"Generating {path} ...")
+            generate_workbook(rows, path, args.seed)
+        n, timings = benchmark_workbook(path, args.pdf_max_rows)
+        results.append({"rows": n, "workbook_bytes": os.path.getsize(path), "seconds": timings})
+        print(f"{rows:>9,} rows: " + ", ".join(f"{stage} {t:.3f}s" for stage, t in timings.items()))
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "pdf_max_rows": args.pdf_max_rows,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
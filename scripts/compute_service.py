@@ -0,0 +1,237 @@
+# File: scripts/compute_service.py
+"""Local HTTP service returning reorder points and EOQ for posted item rows.
+
+Usage (from the repository root):
+    python -m scripts.compute_service [--port 8765]
+
+POST /rop-eoq with either
+  * application/json: a list of rows, or {"items": [...], "safety_factor": ...}
+  * application/vnd.apache.arrow.stream: an Arrow IPC stream, parameters in the query string
+Rows need a numeric "Stock Level" and may have "Lead Time" (default 7 days).
+The response has the same format and columns as the request, with the input
+values used and the calculated columns appended. Values that are not finite
+are returned as null in JSON responses.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from aiohttp import web
+
+from utils.calculations import calculate_reorder_point_and_eoq
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+# Parameters a request may set, with the defaults of calculate_reorder_point_and_eoq
+PARAMETERS = {"safety_factor": 1.65, "ordering_cost": 100.0, "holding_cost": 10.0}
+
+# Every request is cast to this schema before it joins a batch
+INPUT_SCHEMA = pa.schema([("Stock Level", pa.float64()), ("Lead Time", pa.float64())])
+
+# Columns calculated for every row and appended to the caller's own columns
+RESULT_COLUMNS = ["Average Daily Demand", "Lead Time Demand", "Safety Stock", "Reorder Point", "EOQ"]
+
+# How long the first request of a batch waits for others to join it
+MAX_WAIT_MS = 5
+
+# A batch is closed early once it holds this many rows
+MAX_BATCH_ROWS = 200_000
+
+
+def input_table(table):
+    """Cast a request's rows to INPUT_SCHEMA; raises ValueError for missing or non-numeric inputs."""
+    if "Stock Level" not in table.column_names:
+        raise ValueError("Missing required column: Stock Level")
+    columns = []
+    for field in INPUT_SCHEMA:
+        if field.name not in table.column_names:
+            columns.append(pa.nulls(table.num_rows, field.type))
+            continue
+        try:
+            columns.append(table[field.name].cast(field.type))
+        except pa.ArrowException as e:
+            raise ValueError(f"Column {field.name} is not numeric: {e}")
+    return pa.Table.from_arrays(columns, schema=INPUT_SCHEMA)
+
+
+def calculate_table(inputs, params):
+    """Inputs used and calculated columns for an INPUT_SCHEMA table, as an Arrow table."""
+    data = calculate_reorder_point_and_eoq(inputs.to_pandas(), **params)
+    return pa.Table.from_pandas(data[INPUT_SCHEMA.names + RESULT_COLUMNS], preserve_index=False)
+
+
+def response_table(table, result):
+    """The caller's own columns with the inputs used, followed by the calculated columns."""
+    for name in INPUT_SCHEMA.names + RESULT_COLUMNS:
+        if name in table.column_names:
+            table = table.set_column(table.column_names.index(name), name, result[name])
+        else:
+            table = table.append_column(name, result[name])
+    return table
+
+
+def _finite_or_null(table):
+    """Replace NaN and infinity with null in float columns, which JSON cannot represent."""
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type):
+            column = table.column(i)
+            table = table.set_column(i, field, pc.if_else(pc.is_finite(column), column, None))
+    return table
+
+
+class MicroBatcher:
+    """Coalesce concurrent requests into one vectorized calculation per parameter set.
+
+    The first queued request opens a batch; requests arriving within
+    max_wait_ms join it. Each parameter set in the batch is calculated once
+    over the concatenated rows, and every request gets back its own slice.
+    """
+
+    def __init__(self, max_wait_ms=MAX_WAIT_MS, max_batch_rows=MAX_BATCH_ROWS):
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch_rows = max_batch_rows
+        self.queue = asyncio.Queue()
+        self.batches = 0
+        self.requests = 0
+
+    async def submit(self, table, params):
+        """Queue an INPUT_SCHEMA table and wait for its calculated rows."""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((table, params, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            rows = batch[0][0].num_rows
+            deadline = loop.time() + self.max_wait
+            while rows < self.max_batch_rows:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+                rows += batch[-1][0].num_rows
+
+            groups = {}
+            for entry in batch:
+                groups.setdefault(tuple(sorted(entry[1].items())), []).append(entry)
+            for key, entries in groups.items():
+                # Run off the event loop so new requests keep queueing meanwhile
+                await loop.run_in_executor(None, self._calculate, entries, dict(key))
+            self.batches += 1
+            self.requests += len(batch)
+
+    @staticmethod
+    def _calculate(entries, params):
+        try:
+            combined = pa.concat_tables([e[0] for e in entries])
+            result = calculate_table(combined, params)
+            offset = 0
+            for table, _, future in entries:
+                _resolve(future, result.slice(offset, table.num_rows))
+                offset += table.num_rows
+        except Exception as e:
+            for _, _, future in entries:
+                _resolve(future, ValueError(f"Error calculating Reorder Point and EOQ: {e}"))
+
+
+def _resolve(future, value):
+    """Set a future's result or exception from the worker thread."""
+    loop = future.get_loop()
+    if isinstance(value, Exception):
+        loop.call_soon_threadsafe(lambda: future.done() or future.set_exception(value))
+    else:
+        loop.call_soon_threadsafe(lambda: future.done() or future.set_result(value))
+
+
+def _parse_params(source):
+    params = {}
+    for name, default in PARAMETERS.items():
+        try:
+            params[name] = float(source.get(name, default))
+        except (TypeError, ValueError):
+            raise ValueError(f"Parameter {name} must be a number")
+    if not all(map(math.isfinite, params.values())):
+        raise ValueError("Parameters must be finite numbers")
+    if params["holding_cost"] <= 0:
+        raise ValueError("holding_cost must be positive")
+    if params["ordering_cost"] < 0 or params["safety_factor"] < 0:
+        raise ValueError("ordering_cost and safety_factor must not be negative")
+    return params
+
+
+async def handle_rop_eoq(request):
+    try:
+        if request.content_type == ARROW_STREAM:
+            table = pa.ipc.open_stream(await request.read()).read_all()
+            params = _parse_params(request.query)
+        else:
+            body = await request.json()
+            rows = body.get("items", []) if isinstance(body, dict) else body
+            params = _parse_params(body if isinstance(body, dict) else request.query)
+            table = pa.Table.from_pylist(rows)
+        inputs = input_table(table)
+    except Exception as e:
+        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+
+    try:
+        result = response_table(table, await request.app[BATCHER].submit(inputs, params))
+    except ValueError as e:
+        return web.json_response({"error": str(e)}, status=422)
+
+    if request.content_type == ARROW_STREAM:
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, result.schema) as writer:
+            writer.write_table(result)
+        return web.Response(body=sink.getvalue().to_pybytes(), content_type=ARROW_STREAM)
+    return web.Response(
+        text=json.dumps(_finite_or_null(result).to_pylist(), default=str), content_type="application/json"
+    )
+
+
+async def handle_health(request):
+    batcher = request.app[BATCHER]
+    return web.json_response({"status": "ok", "requests": batcher.requests, "batches": batcher.batches})
+
+
+BATCHER = web.AppKey("batcher", MicroBatcher)
+BATCHER_TASK = web.AppKey("batcher_task", asyncio.Task)
+
+
+def create_app(max_wait_ms=MAX_WAIT_MS, max_batch_rows=MAX_BATCH_ROWS):
+    app = web.Application(client_max_size=256 * 1024 * 1024)
+    app[BATCHER] = MicroBatcher(max_wait_ms, max_batch_rows)
+
+    async def start_batcher(app):
+        app[BATCHER_TASK] = asyncio.create_task(app[BATCHER].run())
+
+    async def stop_batcher(app):
+        app[BATCHER_TASK].cancel()
+
+    app.on_startup.append(start_batcher)
+    app.on_cleanup.append(stop_batcher)
+    app.router.add_post("/rop-eoq", handle_rop_eoq)
+    app.router.add_get("/health", handle_health)
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local reorder point / EOQ service with request batching.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS, help="Batching window per request")
+    parser.add_argument("--max-batch-rows", type=int, default=MAX_BATCH_ROWS)
+    args = parser.parse_args(argv)
+    web.run_app(create_app(args.max_wait_ms, args.max_batch_rows), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
-import pandas as pd
+from utils.data_processing import COLUMN_MAPPINGS, NUMERIC_COLUMNS
+from utils.excel_reader import read_excel_projected
 
 def load_data(file):
-    """Load Excel file and return a DataFrame."""
-    return pd.read_excel(file)
+    """Load Excel file and return a DataFrame with the dashboard columns."""
+    required_columns = ["Item", "Category", "Stock Level", "Reorder Point", "Lead Time"]
+    return read_excel_projected(file, COLUMN_MAPPINGS, keep=required_columns, numeric_columns=NUMERIC_COLUMNS)
 
 def validate_data(data):
     """Validate data to ensure required columns are present."""
@@ -0,0 +1,96 @@
+# File: scripts/generate_inventory.py
+"""Write seeded synthetic inventory workbooks laid out like the store exports.
+
+Usage (from the repository root):
+    python -m scripts.generate_inventory 1000 100000 [-o uploaded_files/synthetic] [--seed 0]
+"""
+
+import argparse
+import datetime
+import os
+
+import numpy as np
+import xlsxwriter
+
+# Source headers in the order of the store exports; None marks the monthly sales block
+HEADERS = [
+    "קוד פריט", "ברקוד", "משפחה", "ספק", "תאור פריט", "עלות פריט", "מחיר מכירה", "מלאי נוכחי",
+    "זמן אספקה בימים", "מקדם בטחון (בין 0 ל-1)", "עלות הוצאת הזמנה", "מקדם אלפא למעריכית",
+    "ריבית", "חודשי מלאי", "מלאי בדרך", None,
+]
+
+FAMILIES = ["TOM", "טיפוח", "תינוקות", "היגיינה", "קוסמטיקה", "תרופות", "ויטמינים", "בישום", "שיער", "ניקיון"]
+SUPPLIERS = ["DPL", "Ontex", "עלבד", "שטראוס", "סנו", "P&G", "יוניליוור", "דיפלומט"]
+PRODUCTS = ["מגבונים", "שמפו", "קרם ידיים", "משחת שיניים", "חיתולים", "סבון", "דאודורנט", "ויטמין C"]
+
+HISTORY_MONTHS = 12
+
+# Rows generated and written per block
+BLOCK_ROWS = 50_000
+
+
+def workbook_path(rows, seed, output_dir):
+    return os.path.join(output_dir, f"synthetic_{rows}_seed{seed}.xlsx")
+
+
+def _block(rng, start, size):
+    """Columns of one block of synthetic items; demand drives stock and sales history."""
+    family = rng.integers(0, len(FAMILIES), size)
+    cost = np.round(rng.lognormal(2.0, 0.8, size), 2)
+    demand = rng.gamma(0.8, 400, size)  # Monthly units, heavy-tailed like real assortments
+    seasonality = 1 + 0.2 * np.sin(np.arange(HISTORY_MONTHS) / 12 * 2 * np.pi)
+    history = rng.poisson(demand[:, None] * seasonality[None, :])
+    products = np.array(PRODUCTS, dtype=object)[rng.integers(0, len(PRODUCTS), size)]
+    return [
+        7290000000000 + np.arange(start, start + size),
+        [None] * size,
+        np.array(FAMILIES, dtype=object)[family],
+        np.array(SUPPLIERS, dtype=object)[rng.integers(0, len(SUPPLIERS), size)],
+        [f"{p} {i}" for p, i in zip(products, range(start, start + size))],
+        cost,
+        np.round(cost * rng.uniform(1.2, 3.0, size), 1),
+        rng.poisson(demand * rng.uniform(0.2, 3.0, size)),
+        rng.choice([7, 14, 21, 30], size),
+        np.full(size, 0.2),
+        np.full(size, 500),
+        np.full(size, 0.2),
+        np.full(size, 0.15),
+        rng.integers(1, 4, size),
+        rng.poisson(demand / 2),
+    ] + [history[:, m] for m in range(HISTORY_MONTHS)]
+
+
+def generate_workbook(rows, path, seed=0, block_rows=BLOCK_ROWS):
+    """Write a workbook of rows synthetic items to path; the same seed gives the same file."""
+    rng = np.random.default_rng(seed)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    workbook.set_properties({"created": datetime.datetime(2024, 1, 1)})  # Fixed so files are byte-identical per seed
+    sheet = workbook.add_worksheet()
+    month_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+    for col, header in enumerate(HEADERS[:-1]):
+        sheet.write_string(0, col, header)
+    for m in range(HISTORY_MONTHS):
+        sheet.write_datetime(0, len(HEADERS) - 1 + m, datetime.datetime(2023, m + 1, 1), month_format)
+
+    for start in range(0, rows, block_rows):
+        size = min(block_rows, rows - start)
+        columns = [c.tolist() if isinstance(c, np.ndarray) else c for c in _block(rng, start, size)]
+        for offset, row in enumerate(zip(*columns)):
+            sheet.write_row(start + offset + 1, 0, row)
+    workbook.close()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic inventory workbooks with Hebrew headers.")
+    parser.add_argument("rows", type=int, nargs="+", help="Row counts, one workbook each")
+    parser.add_argument("-o", "--output-dir", default="uploaded_files/synthetic")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    for rows in args.rows:
+        print(generate_workbook(rows, workbook_path(rows, args.seed, args.output_dir), args.seed))
+
+
+if __name__ == "__main__":
+    main()
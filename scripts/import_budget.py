@@ -0,0 +1,76 @@
+# File: scripts/import_budget.py
+"""Measure the cold import time of the dashboards against a budget.
+
+Usage (from the repository root):
+    python -m scripts.import_budget [app_la_v01.py main.py ...] [--budget 2.0] [--repeat 3]
+
+Each app's module-level imports are run in a fresh interpreter, so nothing is
+cached between measurements. The check fails (exit code 1) when the median
+time is over budget or when a module meant to load lazily (LAZY_MODULES) is
+imported at startup.
+"""
+
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_APPS = ["app_la_v01.py", "app_la.py", "main.py", "main_app.py", "Inventory_porduct.py"]
+
+# Seconds allowed for an app's startup imports (median of the runs)
+IMPORT_BUDGET_S = 2.0
+
+# Modules that only the tabs and report builders that need them may import
+# (Streamlit itself loads PIL and plotly.graph_objects, so those are not listed)
+LAZY_MODULES = ("plotly.express", "fpdf", "statsmodels", "bcrypt", "xlsxwriter")
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+{imports}
+print(json.dumps({{"seconds": time.perf_counter() - start, "modules": sorted(sys.modules)}}))
+"""
+
+
+def startup_imports(path):
+    """Source of the import statements at the top level of a script, in order."""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def measure(path, repeat=3):
+    """Median cold import time of a script's startup imports and the modules they load."""
+    code = _CHILD.format(imports="\n".join(startup_imports(path)))
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"Error importing the modules of {path}: {result.stderr.strip()}")
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(r["seconds"] for r in runs), set(runs[-1]["modules"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check dashboard startup imports against a time budget.")
+    parser.add_argument("apps", nargs="*", default=DEFAULT_APPS, help="Streamlit scripts to check")
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_S, help="Seconds allowed per app")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per app")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for app in args.apps:
+        seconds, modules = measure(app, args.repeat)
+        eager = sorted(m for m in LAZY_MODULES if m in modules)
+        ok = seconds <= args.budget and not eager
+        failed |= not ok
+        print(f"{app:<20} {seconds:6.3f}s / {args.budget:.3f}s  {'ok' if ok else 'FAILED'}")
+        if eager:
+            print(f"    imported at startup: {', '.join(eager)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
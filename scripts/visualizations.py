@@ -1,13 +1,13 @@
-import plotly.express as px
+from utils.chart_data import category_bar_chart, category_pie_chart, item_bar_chart
 
 def create_overview_charts(data):
     """Generate overview charts for inventory metrics."""
-    fig1 = px.bar(data, x="Category", y="Stock Level", title="Stock Levels by Category")
-    fig2 = px.pie(data, values="Stock Level", names="Category", title="Stock Distribution by Category")
+    fig1 = category_bar_chart(data, "Category", "Stock Level", title="Stock Levels by Category")
+    fig2 = category_pie_chart(data, "Category", "Stock Level", title="Stock Distribution by Category")
     return [fig1, fig2]
 
 def create_inventory_analysis(data):
     """Generate detailed inventory analysis charts."""
-    fig1 = px.bar(data, x="Item", y="Overstock", title="Overstock Analysis")
-    fig2 = px.bar(data, x="Item", y="Understock", title="Understock Analysis")
+    fig1 = item_bar_chart(data, "Item", "Overstock", title="Overstock Analysis (Top Items)")
+    fig2 = item_bar_chart(data, "Item", "Understock", title="Understock Analysis (Top Items)")
     return [fig1, fig2]
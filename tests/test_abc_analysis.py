@@ -0,0 +1,37 @@
+# File: tests/test_abc_analysis.py
+
+import numpy as np
+import pandas as pd
+
+from utils.abc_analysis import abc_classification, abc_codes
+
+
+def _sorted_codes(values, thresholds=(80, 95)):
+    """Reference classification with a full sort."""
+    v = np.nan_to_num(np.asarray(values, dtype="float64")).clip(min=0)
+    order = np.argsort(-v, kind="stable")
+    percentage = np.cumsum(v[order]) / v.sum() * 100
+    codes = np.empty(len(v), dtype="int8")
+    codes[order] = np.searchsorted(thresholds, percentage, side="left")
+    return codes
+
+
+def test_codes_match_a_full_sort():
+    rng = np.random.default_rng(0)
+    for values in (rng.pareto(1.2, 50_000), rng.uniform(0, 1, 20_000), rng.pareto(1.5, 500)):
+        np.testing.assert_array_equal(abc_codes(values), _sorted_codes(values))
+
+
+def test_missing_negative_and_zero_values():
+    assert abc_codes([np.nan, -5, 70, 30]).tolist() == [2, 2, 0, 2]
+    assert abc_codes([0, 0]).tolist() == [-1, -1]
+    assert abc_codes([]).tolist() == []
+
+
+def test_cached_codes_are_keyed_by_dataset():
+    first = pd.DataFrame({"Stock Level": [5, 20, 70, 5], "Selling Price": [1.0] * 4})
+    second = pd.DataFrame({"Stock Level": [85, 10, 5], "Selling Price": [1.0] * 3})
+    assert list(abc_classification(first, dataset_key="hash-1")) == ["B", "B", "A", "C"]
+    assert list(abc_classification(second, dataset_key="hash-2")) == ["B", "B", "C"]
+    # A stale entry of the wrong length is recomputed rather than returned
+    assert list(abc_classification(second, dataset_key="hash-1")) == ["B", "B", "C"]
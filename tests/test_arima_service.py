@@ -0,0 +1,36 @@
+# File: tests/test_arima_service.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.arima_service import fit_arima, sku_keys
+
+
+def test_sku_keys_number_repeated_items():
+    data = pd.DataFrame({"Category": ["A", "A", "B", "A"], "Item": ["x", "x", "x", "y"]})
+    assert sku_keys(data).tolist() == ["A|x", "A|x#2", "B|x", "A|y"]
+    assert sku_keys(data, columns=("Item",)).tolist() == ["x", "x#2", "x#3", "y"]
+
+
+def test_duplicate_items_get_their_own_forecasts(tmp_path):
+    rng = np.random.default_rng(0)
+    months = np.arange(24)
+    histories = np.vstack([10 + months, 200 - 3 * months, 50 + rng.normal(0, 2, 24)])
+    data = pd.DataFrame({"Category": ["A", "A", "A"], "Item": ["dup", "dup", "other"]})
+
+    forecasts = fit_arima(sku_keys(data).tolist(), histories, cache_dir=tmp_path, max_workers=1)
+    assert np.isfinite(forecasts).all()
+    assert forecasts[0, 0] > 30 and forecasts[1, 0] < 140  # Each row follows its own trend
+
+    # A second run reuses every cached fit for the same rows
+    calls = []
+    again = fit_arima(sku_keys(data).tolist(), histories, cache_dir=tmp_path, max_workers=1,
+                      progress=lambda done, total: calls.append(done))
+    assert calls == [3]
+    np.testing.assert_allclose(again, forecasts)
+
+
+def test_repeated_keys_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="unique"):
+        fit_arima(["a", "a"], np.ones((2, 12)), cache_dir=tmp_path, max_workers=1)
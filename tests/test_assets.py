@@ -0,0 +1,23 @@
+# File: tests/test_assets.py
+
+import pytest
+
+from utils.assets import load_asset
+
+
+def test_asset_is_read_once_per_process(tmp_path):
+    logo = tmp_path / "logo.png"
+    logo.write_bytes(b"first")
+    load_asset.cache_clear()
+
+    assert load_asset(str(logo)) == b"first"
+    logo.write_bytes(b"second")
+    assert load_asset(str(logo)) == b"first"
+
+    info = load_asset.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_missing_asset_raises_value_error(tmp_path):
+    with pytest.raises(ValueError, match="Error loading asset"):
+        load_asset(str(tmp_path / "missing.png"))
@@ -0,0 +1,67 @@
+# File: tests/test_auth.py
+
+import json
+
+import pytest
+
+from utils import auth
+from utils.config import SESSION_SECRET_ENV
+
+
+@pytest.fixture
+def credentials(tmp_path):
+    path = str(tmp_path / "credentials.json")
+    auth.add_user("dana", "s3cret", path)
+    yield path
+    auth.load_credentials.cache_clear()
+
+
+def test_added_user_can_log_in(credentials):
+    users = auth.load_credentials(credentials)
+
+    assert auth.check_password(users, "dana", "s3cret")
+    assert not auth.check_password(users, "dana", "wrong")
+    assert not auth.check_password(users, "nobody", "s3cret")
+
+
+def test_credential_file_stores_hashes_only(credentials):
+    with open(credentials, encoding="utf-8") as f:
+        stored = json.load(f)
+
+    assert list(stored) == ["dana"]
+    assert "s3cret" not in stored["dana"]
+
+
+def test_adding_a_user_refreshes_the_cached_credentials(credentials):
+    auth.load_credentials(credentials)
+    auth.add_user("omer", "pass", credentials)
+
+    assert set(auth.load_credentials(credentials)) == {"dana", "omer"}
+
+
+def test_missing_credential_file_raises_value_error(tmp_path):
+    with pytest.raises(ValueError, match="Error loading credentials"):
+        auth.load_credentials(str(tmp_path / "missing.json"))
+
+
+def test_token_round_trip():
+    assert auth.verify_token(auth.issue_token("dana")) == "dana"
+
+
+def test_expired_tampered_or_malformed_tokens_are_rejected():
+    token = auth.issue_token("dana")
+    payload, signature = token.rsplit("|", 1)
+
+    assert auth.verify_token(auth.issue_token("dana", ttl=-10)) is None
+    assert auth.verify_token(payload.replace("dana", "admin") + "|" + signature) is None
+    assert auth.verify_token("dana") is None
+    assert auth.verify_token("") is None
+    assert auth.verify_token(None) is None
+
+
+def test_tokens_depend_on_the_configured_secret(monkeypatch):
+    monkeypatch.setenv(SESSION_SECRET_ENV, "first")
+    token = auth.issue_token("dana")
+
+    monkeypatch.setenv(SESSION_SECRET_ENV, "second")
+    assert auth.verify_token(token) is None
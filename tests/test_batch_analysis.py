@@ -0,0 +1,30 @@
+# File: tests/test_batch_analysis.py
+
+import pandas as pd
+
+from scripts.batch_analysis import STAGES, analyse_workbook, output_names
+from scripts.generate_inventory import generate_workbook
+from utils.excel_export import ABC_COLUMNS, DETAILED_COLUMNS
+
+
+def test_result_workbook_has_the_dashboard_sheets(tmp_path):
+    source = generate_workbook(300, str(tmp_path / "store.xlsx"), seed=1)
+    output = str(tmp_path / "store_Final_Results.xlsx")
+
+    result = analyse_workbook(source, output, value_column="Purchase Price")
+    assert result["rows"] == 300
+    assert list(result["timings"]) == list(STAGES)
+
+    sheets = pd.read_excel(output, sheet_name=None)
+    assert list(sheets) == ["Detailed Analysis", "Warnings", "ABC"]
+    assert list(sheets["Detailed Analysis"].columns) == DETAILED_COLUMNS
+    assert list(sheets["ABC"].columns) == ABC_COLUMNS + ["ABC Classification"]
+    abc = sheets["ABC"]
+    assert abc["Total Value"].notna().all()
+    assert abc["Cumulative Percentage"].max() == 100
+    assert set(abc["ABC Classification"]) == {"A", "B", "C"}
+
+
+def test_output_names_are_unique_across_directories():
+    paths = ["north/2024.xlsx", "south/2024.xlsx", "south/other.xlsx"]
+    assert output_names(paths) == ["north_2024", "south_2024", "other"]
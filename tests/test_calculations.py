@@ -0,0 +1,54 @@
+# File: tests/test_calculations.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.calculations import (
+    SCENARIO_METRICS,
+    calculate_reorder_point_and_eoq,
+    calculate_scenarios,
+    scenario_grid,
+)
+
+
+def _inventory():
+    return pd.DataFrame({"Stock Level": [300.0, np.nan, -30.0, 60.0], "Lead Time": [4.0, 9.0, 1.0, np.nan]})
+
+
+def test_reorder_point_and_eoq():
+    data = calculate_reorder_point_and_eoq(_inventory(), safety_factor=2, ordering_cost=50, holding_cost=4)
+
+    assert data["Stock Level"].tolist() == [300.0, 0.0, 0.0, 60.0]
+    assert data["Lead Time"].tolist() == [4.0, 9.0, 1.0, 7.0]
+    assert data.loc[0, "Average Daily Demand"] == 10.0
+    assert data.loc[0, "Lead Time Demand"] == 40.0
+    assert data.loc[0, "Safety Stock"] == 40.0  # 2 * sqrt(4) * 10
+    assert data.loc[0, "Reorder Point"] == 80.0
+    assert data.loc[0, "EOQ"] == pytest.approx(np.sqrt(2 * 10 * 50 / 4))
+
+
+def test_missing_column_raises_value_error():
+    with pytest.raises(ValueError, match="Error calculating Reorder Point and EOQ"):
+        calculate_reorder_point_and_eoq(pd.DataFrame({"Stock Level": [1.0]}))
+
+
+def test_scenario_grid_is_a_full_cross_product():
+    safety, ordering, holding = scenario_grid([1.0, 2.0], [50.0, 100.0, 150.0], 10.0)
+
+    assert len(safety) == len(ordering) == len(holding) == 6
+    assert set(zip(safety, ordering)) == {(s, o) for s in (1.0, 2.0) for o in (50.0, 100.0, 150.0)}
+
+
+def test_scenarios_match_the_single_parameter_calculation():
+    data = _inventory()
+    safety, ordering, holding = scenario_grid([1.65, 2.0], [100.0, 75.0], [10.0, 4.0])
+
+    result = calculate_scenarios(data, safety, ordering, holding, dtype=np.float64)
+
+    assert result.shape == (len(SCENARIO_METRICS), 8, len(data))
+    assert data["Stock Level"].isna().any()  # The frame is left untouched
+    for s in range(8):
+        expected = calculate_reorder_point_and_eoq(_inventory(), safety[s], ordering[s], holding[s])
+        for m, metric in enumerate(SCENARIO_METRICS):
+            np.testing.assert_allclose(result[m, s], expected[metric])
@@ -0,0 +1,72 @@
+# File: tests/test_chart_data.py
+
+import numpy as np
+import pandas as pd
+
+from utils.chart_data import binned_counts, category_rollup, item_bar_chart, top_items
+
+
+def _items(n=100):
+    return pd.DataFrame({
+        "Item": [f"item {i}" for i in range(n)],
+        "Profit": np.arange(n, dtype="float64") - 10,
+        "Category": ["A", "B"] * (n // 2),
+    })
+
+
+def test_rows_outside_the_top_n_become_one_other_row():
+    data = _items()
+
+    frame = top_items(data, "Item", "Profit", n=5)
+
+    assert len(frame) == 6
+    assert frame["Item"].tolist()[:5] == [f"item {i}" for i in (99, 98, 97, 96, 95)]
+    assert frame["Item"].iloc[-1] == "Other (95 items)"
+    assert frame["Profit"].sum() == data["Profit"].sum()
+
+
+def test_large_negative_values_rank_by_magnitude():
+    data = pd.DataFrame({"Item": ["a", "b", "c"], "Profit": [1.0, -50.0, 2.0]})
+
+    frame = top_items(data, "Item", "Profit", n=2)
+
+    assert set(frame["Item"][:2]) == {"b", "c"}
+    assert frame["Profit"].sum() == data["Profit"].sum()
+
+
+def test_other_is_split_by_color():
+    data = _items()
+
+    frame = top_items(data, "Item", "Profit", n=10, color="Category")
+
+    other = frame[frame["Item"].str.startswith("Other")]
+    assert sorted(other["Category"]) == ["A", "B"]
+    assert frame.groupby("Category")["Profit"].sum().to_dict() == data.groupby("Category")["Profit"].sum().to_dict()
+
+
+def test_small_frames_are_only_sorted():
+    data = _items(4)
+
+    assert top_items(data, "Item", "Profit", n=10)["Item"].tolist() == ["item 3", "item 2", "item 1", "item 0"]
+
+
+def test_category_rollup_sums_per_category():
+    rollup = category_rollup(_items(), "Category", "Profit", n=1)
+
+    assert rollup["Category"].tolist() == ["B", "Other (1 items)"]
+    assert rollup["Profit"].sum() == _items()["Profit"].sum()
+
+
+def test_binned_counts_skip_missing_values():
+    data = pd.DataFrame({"Stock Level": [0.0, 1.0, 2.0, 3.0, np.nan, np.inf]})
+
+    frame = binned_counts(data, "Stock Level", bins=3)
+
+    assert frame["Items"].tolist() == [1, 1, 2]
+    assert frame["Range"].iloc[0] == "0.00 - 1.00"
+
+
+def test_item_bar_chart_plots_the_aggregated_rows():
+    figure = item_bar_chart(_items(), "Item", "Profit", title="Profit", n=5)
+
+    assert len(figure.data[0].x) == 6
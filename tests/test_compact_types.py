@@ -0,0 +1,54 @@
+# File: tests/test_compact_types.py
+
+import numpy as np
+import pandas as pd
+
+from utils.compact_types import compact_column, compact_types, memory_report
+
+
+def test_small_integers_stay_wide_enough_for_arithmetic():
+    stock = compact_column(pd.Series([1, 200, 300], dtype="int64"))
+    history = compact_column(pd.Series([30000.0, 30000.0, 1.0]))
+
+    assert stock.dtype == np.int32
+    assert history.dtype == np.int32
+    assert (stock * 200).tolist() == [200, 40000, 60000]
+    assert history.sum() == 60001
+
+
+def test_large_whole_numbers_keep_int64():
+    values = compact_column(pd.Series([0.0, 2.0 ** 40]))
+
+    assert values.dtype == np.int64
+    assert values.iloc[1] == 2 ** 40
+
+
+def test_fractions_and_missing_values_are_not_made_integers():
+    assert compact_column(pd.Series([0.5, 1.25])).dtype == np.float32
+    assert compact_column(pd.Series([1.0, np.nan])).dtype == np.float32
+    assert compact_column(pd.Series([0.1, 0.2])).dtype == np.float64
+
+
+def test_compact_types_reports_each_column_and_total():
+    df = pd.DataFrame({"Stock Level": [1.0, 2.0] * 50, "Category": ["A", "B"] * 50})
+
+    df, report = compact_types(df)
+
+    assert df["Category"].dtype == "category"
+    assert report.loc["Stock Level", "After dtype"] == "int32"
+    assert report.loc["Total", "After bytes"] < report.loc["Total", "Before bytes"]
+
+
+def test_memory_report_follows_columns_assigned_later():
+    df, report = compact_types(pd.DataFrame({"Stock Level": [1.0, 2.0] * 50}))
+    df["Forecasted Demand"] = df["Stock Level"] * 1.1
+    df["Stock Level"] = df["Stock Level"].astype("float64")
+
+    current = memory_report(df, report)
+
+    assert current.loc["Stock Level", "Before dtype"] == "float64"
+    assert current.loc["Stock Level", "After dtype"] == "float64"
+    assert current.loc["Forecasted Demand", "Before dtype"] == ""
+    assert np.isnan(current.loc["Forecasted Demand", "Before bytes"])
+    assert current.loc["Total", "After bytes"] == df.memory_usage(index=False, deep=True).sum()
+    assert current.loc["Total", "Before bytes"] == report.loc["Total", "Before bytes"]
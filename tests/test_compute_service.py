@@ -0,0 +1,79 @@
+# File: tests/test_compute_service.py
+
+import asyncio
+
+import pyarrow as pa
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from scripts.compute_service import create_app
+
+
+async def _post_together(*bodies, max_wait_ms=50):
+    """POST the JSON bodies concurrently so they share one micro-batch."""
+    client = TestClient(TestServer(create_app(max_wait_ms=max_wait_ms)))
+    await client.start_server()
+    try:
+        responses = await asyncio.gather(*(client.post("/rop-eoq", json=body) for body in bodies))
+        results = [(r.status, await r.json()) for r in responses]
+        health = await (await client.get("/health")).json()
+        return results, health
+    finally:
+        await client.close()
+
+
+def test_malformed_request_does_not_fail_its_batch():
+    good = [{"Stock Level": 300, "Lead Time": 10}]
+    bad = [{"Item": "A", "Category": "X", "Stock Level": "abc"}]
+    (good_result, bad_result), _ = asyncio.run(_post_together(good, bad))
+
+    assert bad_result[0] == 400
+    status, rows = good_result
+    assert status == 200
+    assert rows[0]["Reorder Point"] == pytest.approx(10 * 10 + 1.65 * 10 ** 0.5 * 10)
+
+
+def test_responses_only_carry_the_callers_columns():
+    numeric = [{"Stock Level": 30}]
+    labelled = [{"Item": "A", "Category": "X", "Stock Level": 60, "Lead Time": 5}] * 3
+    ((_, numeric_rows), (_, labelled_rows)), health = asyncio.run(_post_together(numeric, labelled))
+
+    assert health["batches"] == 1
+    assert len(numeric_rows) == 1 and len(labelled_rows) == 3
+    assert "Item" not in numeric_rows[0] and "Category" not in numeric_rows[0]
+    assert numeric_rows[0]["Lead Time"] == 7
+    assert labelled_rows[0]["Item"] == "A" and labelled_rows[0]["Average Daily Demand"] == 2
+
+
+def test_invalid_parameters_are_rejected():
+    (result,), _ = asyncio.run(_post_together({"items": [{"Stock Level": 30}], "holding_cost": 0}))
+    assert result[0] == 400
+    assert "holding_cost" in result[1]["error"]
+
+
+def test_non_finite_values_become_null_in_json():
+    (result,), _ = asyncio.run(_post_together([{"Stock Level": 30, "Lead Time": float("inf")}]))
+    assert result[0] == 200
+    assert result[1][0]["Reorder Point"] is None
+
+
+def test_arrow_stream_round_trip():
+    async def post():
+        client = TestClient(TestServer(create_app()))
+        await client.start_server()
+        try:
+            table = pa.table({"Item": ["A", "B"], "Stock Level": [30, 60]})
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            response = await client.post(
+                "/rop-eoq?holding_cost=5", data=sink.getvalue().to_pybytes(),
+                headers={"Content-Type": "application/vnd.apache.arrow.stream"},
+            )
+            return pa.ipc.open_stream(await response.read()).read_all()
+        finally:
+            await client.close()
+
+    result = asyncio.run(post())
+    assert result.column_names[:3] == ["Item", "Stock Level", "Lead Time"]
+    assert result["EOQ"].to_pylist() == pytest.approx([(2 * 1 * 100 / 5) ** 0.5, (2 * 2 * 100 / 5) ** 0.5])
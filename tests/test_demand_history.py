@@ -0,0 +1,111 @@
+# File: tests/test_demand_history.py
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.demand_history import attach_demand, derive_demand
+from utils.derived_columns import DERIVED_RULES, OBSERVED_DEMAND_RULES, DerivedColumns
+from utils.snapshot_store import append_snapshot, load_snapshots, snapshot_date_from_name, snapshot_store_key
+
+
+def _snapshots(rows):
+    return pd.DataFrame(rows, columns=["Store", "Item", "Snapshot Date", "Stock Level"]).assign(
+        **{"Snapshot Date": lambda f: pd.to_datetime(f["Snapshot Date"])}
+    )
+
+
+def test_consumption_per_day_and_spread():
+    demand = derive_demand(_snapshots([
+        ("S", "A", "2024-01-01", 100), ("S", "A", "2024-01-11", 80), ("S", "A", "2024-01-21", 40),
+        ("S", "B", "2024-01-01", 50), ("S", "B", "2024-01-11", 70),  # Restocked: interval skipped
+        ("S", "C", "2024-01-01", 0), ("S", "C", "2024-01-11", 0),  # Out of stock: censored
+    ])).set_index("Item")
+
+    assert demand.loc["A", "Observed Daily Demand"] == pytest.approx(3.0)
+    assert demand.loc["A", "Intervals"] == 2
+    assert demand.loc["A", "Daily Demand Variance"] == pytest.approx((10 * 1 + 10 * 1) / 1)
+    assert np.isnan(demand.loc["B", "Observed Daily Demand"])
+    assert np.isnan(demand.loc["C", "Observed Daily Demand"])
+
+
+def test_receipts_are_added_back():
+    snapshots = _snapshots([("S", "A", "2024-01-01", 50), ("S", "A", "2024-01-11", 70)]).assign(Received=[0, 40])
+    demand = derive_demand(snapshots, receipts_column="Received")
+    assert demand["Observed Daily Demand"].tolist() == [2.0]
+
+
+def test_observed_demand_replaces_the_estimate_for_monthly_uploads(tmp_path):
+    may, june, july = "קובץ לטעינה 23.5.2024", "קובץ לטעינה 23.6.2024", "קובץ לטעינה 23.7.2024"
+    for name, stock in ((may, [152.0, 60.0]), (june, [90.0, 30.0]), (july, [30.0, 60.0])):
+        frame = pd.DataFrame({"Item": ["A", "B"], "Stock Level": stock})
+        append_snapshot(frame, snapshot_store_key(name), snapshot_date_from_name(name), tmp_path)
+
+    # The July upload, consolidated with another store so rows carry the file label
+    data = pd.DataFrame({
+        "Store": [july, july, "Other 23.7.2024"], "Item": ["A", "B", "A"],
+        "Stock Level": [30.0, 60.0, 45.0], "Lead Time": [7.0, 7.0, 7.0],
+    })
+    history = load_snapshots(stores=[snapshot_store_key(july)], columns=["Item", "Stock Level"], snapshot_dir=tmp_path)
+    assert history["Snapshot Date"].nunique() == 3
+    attach_demand(data, derive_demand(history), store_key=snapshot_store_key)
+
+    observed = DerivedColumns(data.copy(), OBSERVED_DEMAND_RULES)
+    observed.update()
+    estimated = DerivedColumns(data.copy(), DERIVED_RULES)
+    estimated.update()
+
+    # A sold 2 a day in both months; B was restocked in July, leaving one interval
+    # (too few to replace the estimate), and the other store has no history
+    assert observed.data["Average Daily Demand"].tolist() == pytest.approx([2.0, 2.0, 1.5])
+    assert estimated.data["Average Daily Demand"].tolist() == pytest.approx([1.0, 2.0, 1.5])
+    assert observed.data.loc[0, "Reorder Point"] != estimated.data.loc[0, "Reorder Point"]
+
+
+def _uploads(tmp_path, uploads):
+    for snapshot_date, stock in uploads:
+        frame = pd.DataFrame({"Item": ["A", "B"], "Stock Level": stock})
+        append_snapshot(frame, "S", snapshot_date, tmp_path)
+    return load_snapshots(columns=["Item", "Stock Level"], snapshot_dir=tmp_path)
+
+
+def test_identical_snapshots_are_not_zero_demand(tmp_path):
+    # The same undated workbook uploaded on two days
+    history = _uploads(tmp_path, [
+        (datetime.date(2026, 10, 1), [90.0, 30.0]), (datetime.date(2026, 10, 17), [90.0, 30.0]),
+    ])
+    demand = derive_demand(history)
+    assert demand["Intervals"].tolist() == [0, 0]
+    assert demand["Observed Daily Demand"].isna().all()
+
+    data = pd.DataFrame({"Store": ["S", "S"], "Item": ["A", "B"], "Stock Level": [90.0, 30.0], "Lead Time": [7.0, 7.0]})
+    attach_demand(data, demand)
+    observed = DerivedColumns(data, OBSERVED_DEMAND_RULES)
+    observed.update()
+    assert observed.data["Average Daily Demand"].tolist() == pytest.approx([3.0, 1.0])
+    assert (observed.data["Reorder Point"] > 0).all()
+
+
+def test_a_repeated_snapshot_extends_the_interval(tmp_path):
+    history = _uploads(tmp_path, [
+        (datetime.date(2024, 1, 1), [100.0, 50.0]), (datetime.date(2024, 1, 11), [100.0, 50.0]),
+        (datetime.date(2024, 1, 21), [60.0, 30.0]), (datetime.date(2024, 1, 31), [40.0, 30.0]),
+    ])
+    demand = derive_demand(history).set_index("Item")
+
+    assert demand["Snapshots"].tolist() == [3, 3]
+    assert demand.loc["A", "Observed Daily Demand"] == pytest.approx(60 / 30)
+    assert demand.loc["B", "Observed Daily Demand"] == pytest.approx(20 / 30)
+
+
+def test_items_with_too_few_intervals_keep_the_estimate():
+    demand = pd.DataFrame({"Item": ["A", "B"], "Intervals": [1, 2], "Observed Daily Demand": [5.0, 4.0],
+                           "Daily Demand Std": [np.nan, 1.0]})
+    data = attach_demand(pd.DataFrame({"Item": ["A", "B", "C"]}), demand)
+
+    assert np.isnan(data.loc[0, "Observed Daily Demand"])
+    assert data["Observed Daily Demand"].tolist()[1] == 4.0
+    assert np.isnan(data.loc[2, "Observed Daily Demand"])
+    assert attach_demand(data, demand, min_intervals=1)["Observed Daily Demand"].tolist()[0] == 5.0
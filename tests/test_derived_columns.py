@@ -0,0 +1,36 @@
+# File: tests/test_derived_columns.py
+
+import pandas as pd
+import pytest
+
+from utils.calculations import calculate_reorder_point_and_eoq
+from utils.derived_columns import DerivedColumns
+
+
+def _data():
+    return pd.DataFrame({
+        "Stock Level": [300.0, 60.0, None], "Lead Time": [10.0, None, 4.0], "Selling Price": [2.0, 5.0, 1.0],
+    })
+
+
+def test_matches_the_full_calculation():
+    derived = DerivedColumns(_data())
+    derived.update()
+    expected = calculate_reorder_point_and_eoq(_data())
+    for col in ("Average Daily Demand", "Safety Stock", "Reorder Point", "EOQ"):
+        assert derived.data[col].tolist() == pytest.approx(expected[col].tolist())
+
+
+def test_only_stale_columns_are_recomputed():
+    derived = DerivedColumns(_data())
+    assert len(derived.update()) == 7
+    assert derived.update() == []
+    assert derived.update(holding_cost=20) == ["EOQ"]
+
+    derived.data["Stock Level"] = [600.0, 60.0, 0.0]
+    derived.invalidate("Stock Level")
+    assert derived.update() == [
+        "Average Daily Demand", "Lead Time Demand", "Safety Stock", "Reorder Point", "EOQ",
+        "Total Value", "Cumulative Percentage",
+    ]
+    assert derived.data.loc[0, "Average Daily Demand"] == 20
@@ -0,0 +1,76 @@
+# File: tests/test_excel_reader.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from utils.excel_reader import read_excel_projected
+
+MAPPINGS = {"תאור פריט": "Item", "מלאי נוכחי": "Stock Level"}
+
+
+def _workbook(path, rows):
+    wb = Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+    return str(path)
+
+
+def test_keeps_only_mapped_and_kept_columns_renamed(tmp_path):
+    path = _workbook(tmp_path / "stock.xlsx", [
+        ["תאור פריט", "הערות", "מלאי נוכחי", "1", "2"],
+        ["bolt", "ignored", 5, 1, 2],
+        ["nut", "ignored", "n/a", None, 4],
+    ])
+
+    df = read_excel_projected(path, MAPPINGS, keep={"1", "2"}, numeric_columns={"Stock Level", "1", "2"})
+
+    assert df.columns.tolist() == ["Item", "Stock Level", "1", "2"]
+    assert df["Item"].tolist() == ["bolt", "nut"]
+    assert df["Stock Level"].dtype == np.float64
+    assert df["Stock Level"].tolist()[0] == 5.0
+    assert np.isnan(df.loc[1, "Stock Level"])  # Text in a numeric column becomes NaN
+    assert np.isnan(df.loc[1, "1"])
+
+
+def test_blank_rows_are_skipped_across_chunks(tmp_path):
+    rows = [["תאור פריט", "מלאי נוכחי"]]
+    for i in range(7):
+        rows.append([f"item {i}", i])
+        rows.append([None, None])
+    path = _workbook(tmp_path / "stock.xlsx", rows)
+
+    df = read_excel_projected(path, MAPPINGS, numeric_columns=lambda name: name == "Stock Level", chunk_size=3)
+
+    assert df["Item"].tolist() == [f"item {i}" for i in range(7)]
+    assert df["Stock Level"].tolist() == [float(i) for i in range(7)]
+
+
+def test_empty_sheet_gives_the_mapped_columns(tmp_path):
+    path = _workbook(tmp_path / "empty.xlsx", [])
+
+    df = read_excel_projected(path, MAPPINGS)
+
+    assert df.empty
+    assert df.columns.tolist() == ["Item", "Stock Level"]
+
+
+def test_unreadable_file_raises_value_error(tmp_path):
+    path = tmp_path / "broken.xlsx"
+    path.write_bytes(b"not a workbook")
+
+    with pytest.raises(ValueError, match="Error opening Excel file"):
+        read_excel_projected(str(path), MAPPINGS)
+
+
+def test_matches_pandas_on_the_sample_workbook():
+    path = "data/sample_inventory_data.xlsx"
+    expected = pd.read_excel(path)
+
+    df = read_excel_projected(path, {}, keep=lambda name: True)
+
+    assert df.columns.tolist() == [str(c) for c in expected.columns]
+    assert len(df) == len(expected.dropna(how="all"))
@@ -0,0 +1,53 @@
+# File: tests/test_file_management.py
+
+import io
+import os
+
+from utils.file_management import load_index, prune_index, resolve_upload, store_upload
+
+
+class _Upload(io.BytesIO):
+    """Stand-in for Streamlit's UploadedFile: a named in-memory buffer."""
+
+    def __init__(self, name, content):
+        super().__init__(content)
+        self.name = name
+
+
+def test_identical_uploads_share_one_blob(tmp_path):
+    first_hash, first_path = store_upload(_Upload("a.xlsx", b"same"), str(tmp_path), "s1")
+    second_hash, second_path = store_upload(_Upload("b.xlsx", b"same"), str(tmp_path), "s2")
+    assert first_hash == second_hash and first_path == second_path
+    assert os.listdir(tmp_path / "blobs") == [os.path.basename(first_path)]
+    assert load_index(str(tmp_path))["blobs"][first_hash]["names"] == ["a.xlsx", "b.xlsx"]
+    assert resolve_upload(str(tmp_path), "s2", "b.xlsx") == first_path
+    assert resolve_upload(str(tmp_path), "s3", "b.xlsx") is None
+
+
+def test_sessions_expire_and_are_capped(tmp_path):
+    for i in range(5):
+        store_upload(_Upload("a.xlsx", b"x%d" % i), str(tmp_path), f"s{i}")
+    index = load_index(str(tmp_path))
+    for i, session in enumerate(index["sessions"].values()):
+        session["updated"] = 1000 + i
+
+    assert prune_index(index, now=1000 + 10, ttl=100, max_sessions=3)
+    assert sorted(index["sessions"]) == ["s2", "s3", "s4"]
+    assert prune_index(index, now=1000 + 103.5, ttl=100)
+    assert sorted(index["sessions"]) == ["s4"]
+    assert not prune_index(index, now=1000 + 104, ttl=100)
+
+
+def test_deleted_blobs_are_pruned_with_their_sessions(tmp_path):
+    kept_hash, _ = store_upload(_Upload("kept.xlsx", b"kept"), str(tmp_path), "s1")
+    _, removed_path = store_upload(_Upload("old.xlsx", b"old"), str(tmp_path), "s1")
+    os.remove(removed_path)
+
+    store_upload(_Upload("new.xlsx", b"new"), str(tmp_path), "s2")  # Any write prunes the index
+    index = load_index(str(tmp_path))
+    assert len(index["blobs"]) == 2 and kept_hash in index["blobs"]
+    assert index["sessions"]["s1"]["files"] == {"kept.xlsx": kept_hash}
+
+    os.remove(index["blobs"][kept_hash]["path"])
+    store_upload(_Upload("other.xlsx", b"other"), str(tmp_path), "s2")
+    assert "s1" not in load_index(str(tmp_path))["sessions"]
@@ -0,0 +1,73 @@
+# File: tests/test_forecasting.py
+
+import numpy as np
+import pandas as pd
+
+from utils.data_processing import history_columns
+from utils.forecasting import (
+    FORECAST_MODELS,
+    forecast_demand,
+    forecast_frame,
+    holt_smoothing,
+    holt_winters_smoothing,
+    simple_smoothing,
+)
+
+
+def test_simple_smoothing_of_a_flat_series_has_no_error():
+    forecast, mse = simple_smoothing([[5.0] * 6], horizon=2)
+
+    assert forecast.tolist() == [[5.0, 5.0]]
+    assert mse.tolist() == [0.0]
+
+
+def test_holt_follows_a_linear_trend():
+    forecast, mse = holt_smoothing([np.arange(1.0, 13.0)], horizon=2)
+
+    np.testing.assert_allclose(forecast, [[13.0, 14.0]])
+    np.testing.assert_allclose(mse, [0.0], atol=1e-12)
+
+
+def test_holt_winters_needs_two_seasons():
+    assert holt_winters_smoothing(np.ones((1, 23))) == (None, None)
+
+
+def test_score_from_limits_the_scored_periods():
+    history = [[100.0] + [1.0] * 23]
+
+    _, full = simple_smoothing(history)
+    _, late = simple_smoothing(history, score_from=12)
+
+    assert late[0] < full[0]
+
+
+def test_models_are_compared_on_the_same_periods():
+    # SES scored over the first season as well as the second would be judged on
+    # more periods than Holt-Winters, and picked for this seasonal series
+    history = np.array([[0.0, 40.0] * 6 + [10.0, 30.0] * 6])
+
+    _, model_index = forecast_demand(history)
+
+    _, ses = simple_smoothing(history, score_from=12)
+    _, holt = holt_smoothing(history, score_from=12)
+    _, seasonal = holt_winters_smoothing(history)
+    assert model_index.tolist() == [int(np.argmin([ses[0], holt[0], seasonal[0]]))]
+    assert FORECAST_MODELS[model_index[0]] == "Holt-Winters"
+
+
+def test_forecast_frame_picks_a_model_per_item():
+    months = [str(m) for m in range(1, 25)]
+    data = pd.DataFrame([np.full(24, 4.0), np.tile([0.0, 20.0], 12)], columns=months)
+    data.insert(0, "Item", ["flat", "seasonal"])
+
+    result = forecast_frame(data)
+
+    assert result["Item"].tolist() == ["flat", "seasonal"]
+    assert set(result["Model"]) <= set(FORECAST_MODELS)
+    assert result.loc[0, "Forecasted Demand"] == 4.0
+
+
+def test_history_headers_are_dates_or_periods_1_to_24():
+    columns = ["Item", "1", "24", "25", "0", "100", "2023-01-01 00:00:00", "2023-02-01"]
+
+    assert history_columns(columns) == ["1", "24", "2023-01-01 00:00:00", "2023-02-01"]
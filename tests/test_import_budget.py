@@ -0,0 +1,51 @@
+# File: tests/test_import_budget.py
+
+from scripts.import_budget import main, measure, startup_imports
+
+APP = '''
+import json
+from utils.config import UPLOAD_DIR
+
+if tab == "Charts":
+    import plotly.express as px
+
+def report():
+    from fpdf import FPDF
+'''
+
+
+def test_startup_imports_are_the_top_level_ones(tmp_path):
+    app = tmp_path / "app.py"
+    app.write_text(APP, encoding="utf-8")
+
+    assert startup_imports(str(app)) == ["import json", "from utils.config import UPLOAD_DIR"]
+
+
+def test_tab_imports_stay_out_of_startup(tmp_path):
+    app = tmp_path / "app.py"
+    app.write_text("import json\n", encoding="utf-8")
+
+    seconds, modules = measure(str(app), repeat=1)
+
+    assert seconds >= 0
+    assert "json" in modules and "plotly.express" not in modules
+
+
+def test_eager_lazy_module_fails_the_check(tmp_path, capsys):
+    app = tmp_path / "eager.py"
+    app.write_text("import json\nimport plotly.express as px\n", encoding="utf-8")
+
+    _, modules = measure(str(app), repeat=1)
+    assert "plotly.express" in modules
+
+    assert main([str(app), "--repeat", "1", "--budget", "60"]) == 1
+    output = capsys.readouterr().out
+    assert "FAILED" in output and "imported at startup: plotly.express" in output
+
+
+def test_slow_startup_fails_the_budget(tmp_path):
+    app = tmp_path / "app.py"
+    app.write_text("import json\n", encoding="utf-8")
+
+    assert main([str(app), "--repeat", "1", "--budget", "60"]) == 0
+    assert main([str(app), "--repeat", "1", "--budget", "0"]) == 1
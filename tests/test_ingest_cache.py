@@ -0,0 +1,78 @@
+# File: tests/test_ingest_cache.py
+
+import io
+import os
+
+import pandas as pd
+
+from utils import ingest_cache
+from utils.ingest_cache import cache_path, content_hash, evict, load_cached_data
+
+
+def _workbook(path, stock):
+    pd.DataFrame({
+        "תאור פריט": ["bolt", "nut"],
+        "מלאי נוכחי": stock,
+        "1": [3, 4],
+    }).to_excel(path, index=False)
+    return str(path)
+
+
+def test_content_hash_is_the_same_for_bytes_buffers_and_files(tmp_path):
+    path = tmp_path / "upload.bin"
+    path.write_bytes(b"inventory")
+
+    assert content_hash(b"inventory") == content_hash(io.BytesIO(b"inventory")) == content_hash(str(path))
+    assert content_hash(b"inventory") != content_hash(b"inventory2")
+
+
+def test_second_load_reads_the_parquet_copy(tmp_path, monkeypatch):
+    path = _workbook(tmp_path / "stock.xlsx", [5, 6])
+    cache_dir = str(tmp_path / "cache")
+
+    first = load_cached_data(path, cache_dir=cache_dir)
+    assert os.path.exists(cache_path(content_hash(path), cache_dir))
+
+    def fail(_):
+        raise AssertionError("workbook parsed again")
+
+    monkeypatch.setattr(ingest_cache, "load_and_process_data", fail)
+    second = load_cached_data(path, cache_dir=cache_dir)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert second["Stock Level"].dtype == "float64"
+    assert second["Item"].tolist() == ["bolt", "nut"]
+
+
+def test_corrupt_entry_is_rebuilt(tmp_path):
+    path = _workbook(tmp_path / "stock.xlsx", [5, 6])
+    cache_dir = str(tmp_path / "cache")
+    entry = cache_path(content_hash(path), cache_dir)
+    os.makedirs(cache_dir)
+    with open(entry, "wb") as f:
+        f.write(b"not parquet")
+
+    df = load_cached_data(path, cache_dir=cache_dir)
+
+    assert df["Stock Level"].tolist() == [5.0, 6.0]
+    pd.testing.assert_frame_equal(pd.read_parquet(entry), df)
+
+
+def test_changing_the_mapping_changes_the_cache_path(monkeypatch):
+    before = cache_path("abc", "cache")
+    monkeypatch.setattr(ingest_cache, "CACHE_VERSION", ingest_cache.CACHE_VERSION + 1)
+
+    assert cache_path("abc", "cache") != before
+
+
+def test_evict_removes_least_recently_used_first(tmp_path):
+    for age, name in enumerate(["new", "mid", "old"]):
+        entry = tmp_path / f"{name}.parquet"
+        entry.write_bytes(b"x" * 100)
+        os.utime(entry, (1000 - age * 100, 1000 - age * 100))
+    (tmp_path / "notes.txt").write_bytes(b"x" * 1000)
+
+    assert evict(str(tmp_path), max_bytes=150) == 2
+    assert sorted(os.listdir(tmp_path)) == ["new.parquet", "notes.txt"]
+    assert evict(str(tmp_path / "missing"), max_bytes=0) == 0
+
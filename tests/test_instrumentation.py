@@ -0,0 +1,57 @@
+# File: tests/test_instrumentation.py
+
+import json
+import math
+import tracemalloc
+
+from utils.instrumentation import Profiler
+
+
+def test_nested_stages_report_their_peaks(tmp_path):
+    log = tmp_path / "perf.jsonl"
+    profiler = Profiler(enabled=True, log_path=str(log), context={"session": "s"}, trace_memory=True)
+    try:
+        with profiler.stage("outer"):
+            block = bytearray(20_000_000)
+            with profiler.stage("inner"):
+                bytearray(50_000_000)  # Allocated and freed inside the stage
+            del block
+    finally:
+        profiler.close()
+
+    records = {r["stage"]: r for r in profiler.records}
+    assert records["outer/inner"]["peak_mb"] >= 50
+    assert records["outer"]["peak_mb"] >= 70
+    profiler.flush()
+    lines = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [line["stage"] for line in lines] == ["outer/inner", "outer"]
+    assert lines[0]["session"] == "s"
+
+
+def test_other_sessions_do_not_stop_tracing():
+    was_tracing = tracemalloc.is_tracing()
+    recording = Profiler(enabled=True, trace_memory=True)
+    other = Profiler(enabled=True, trace_memory=True)
+    Profiler(enabled=False).close()  # A session with recording off
+    other.close()
+    try:
+        assert tracemalloc.is_tracing()
+        with recording.stage("allocate"):
+            bytearray(80_000_000)  # Allocated and freed inside the stage
+        assert recording.records[0]["peak_mb"] >= 80
+    finally:
+        recording.close()
+    assert tracemalloc.is_tracing() == was_tracing
+
+
+def test_disabled_and_untraced_profilers():
+    disabled = Profiler(enabled=False)
+    with disabled.stage("x"):
+        pass
+    assert disabled.records == []
+
+    untraced = Profiler(enabled=True, trace_memory=False)
+    with untraced.stage("x"):
+        pass
+    untraced.close()
+    assert math.isnan(untraced.records[0]["peak_mb"])
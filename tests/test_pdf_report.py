@@ -0,0 +1,48 @@
+# File: tests/test_pdf_report.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.pdf_report import _format_column, build_pdf_report, find_unicode_font
+
+
+def _hebrew_items(n):
+    return pd.DataFrame({
+        "Item": [f"פריט {i}" for i in range(n)],
+        "Category": ["משפחה א", None] * (n // 2),
+        "Stock Level": np.arange(n, dtype="int64") * 1000,
+        "Profit": np.linspace(-5, 5, n),
+    })
+
+
+@pytest.mark.parametrize("font_path", [None, "missing.ttf"])
+def test_hebrew_frame_over_several_batches(font_path):
+    data = _hebrew_items(130)
+
+    pdf = build_pdf_report(data, title="דוח מלאי", batch_rows=50, font_path=font_path)
+
+    assert pdf.startswith(b"%PDF")
+    assert pdf.count(b"/Type /Page\n") > 1  # Several pages, each with the header row
+
+
+def test_columns_select_what_is_printed():
+    data = _hebrew_items(4)
+
+    assert build_pdf_report(data, columns=["Item", "Profit"]).startswith(b"%PDF")
+    with pytest.raises(ValueError, match="Error building PDF report"):
+        build_pdf_report(data, columns=["Nope"])
+
+
+def test_format_column():
+    assert _format_column(np.array([1234, 5])) == ["1,234", "5"]
+    assert _format_column(np.array([1234.5, np.nan])) == ["1,234.50", ""]
+    assert _format_column(np.array(["a", None, pd.NA], dtype=object)) == ["a", "", ""]
+
+
+def test_find_unicode_font_skips_missing_paths(tmp_path):
+    font = tmp_path / "font.ttf"
+    font.write_bytes(b"")
+
+    assert find_unicode_font(["", str(tmp_path / "none.ttf"), str(font)]) == str(font)
+    assert find_unicode_font([str(tmp_path / "none.ttf")]) is None
@@ -0,0 +1,58 @@
+# File: tests/test_simulation.py
+
+import numpy as np
+import pandas as pd
+
+from utils.simulation import simulate_inventory
+
+
+def _items():
+    return pd.DataFrame({
+        "Stock Level": [300.0, 60.0, 0.0],
+        "Lead Time": [10.0, 5.0, 7.0],
+        "Purchase Price": [2.0, 5.0, 1.0],
+        "Selling Price": [3.0, 9.0, 2.0],
+    }, index=["a", "b", "c"])
+
+
+def test_same_seed_gives_the_same_result():
+    first = simulate_inventory(_items(), n_simulations=500, seed=7)
+    again = simulate_inventory(_items(), n_simulations=500, seed=7)
+    other = simulate_inventory(_items(), n_simulations=500, seed=8)
+
+    pd.testing.assert_frame_equal(first, again)
+    assert not first.equals(other)
+    assert first.index.tolist() == ["a", "b", "c"]
+
+
+def test_chunking_does_not_change_the_totals():
+    whole = simulate_inventory(_items(), n_simulations=400, seed=1)
+    chunked = simulate_inventory(_items(), n_simulations=400, seed=1, chunk_bytes=6 * 8 * 3 * 64)
+
+    # Chunks draw the same stream in a different shape, so only the statistics agree
+    np.testing.assert_allclose(chunked["Expected Profit"], whole["Expected Profit"], rtol=0.1)
+
+
+def test_stockouts_become_likelier_as_the_reorder_point_falls():
+    probabilities = []
+    for reorder_point in (200.0, 100.0, 50.0, 10.0):
+        data = _items().assign(**{"Reorder Point": reorder_point})
+        result = simulate_inventory(data, n_simulations=2000, seed=3)
+        probabilities.append(result.loc["a", "Stockout Probability"])
+
+    assert probabilities == sorted(probabilities)
+    assert probabilities[0] < 0.05 < probabilities[-1]
+
+
+def test_items_without_stock_have_no_demand_or_profit():
+    result = simulate_inventory(_items(), n_simulations=200, seed=0)
+
+    assert result.loc["c"].tolist() == [0.0, 0.0, 0.0, 0.0]
+    assert (result["Stockout Probability"].between(0, 1)).all()
+
+
+def test_missing_columns_fall_back_to_defaults():
+    result = simulate_inventory(pd.DataFrame({"Stock Level": [30.0, np.nan]}), n_simulations=100, seed=0)
+
+    assert result["Expected Profit"].tolist() == [0.0, 0.0]  # No prices: no margin and no holding cost
+    assert result.loc[1, "Stockout Probability"] == 0.0
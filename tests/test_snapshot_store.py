@@ -0,0 +1,74 @@
+# File: tests/test_snapshot_store.py
+
+import datetime
+
+import pandas as pd
+
+from utils.snapshot_store import (
+    append_snapshot, latest_snapshot, list_snapshots, load_snapshots, previous_snapshot_date, snapshot_date_from_name,
+    snapshot_store_key,
+)
+from utils.store_consolidation import store_name
+
+
+def _items(stock):
+    return pd.DataFrame({
+        "Item": ["B", "A", "C"], "Category": ["X", "X", "Y"], "Stock Level": stock,
+        "Purchase Price": [1.0, 2.0, 3.0], "Selling Price": [2.0, 4.0, 6.0], "Lead Time": [7, 7, 14],
+    })
+
+
+def test_monthly_files_of_one_store_share_a_history(tmp_path):
+    june, july = (store_name(f"uploads/קובץ לטעינה {d}.xlsx") for d in ("23.6.2024", "23.7.2024"))
+    assert snapshot_store_key(june) == snapshot_store_key(july) == "קובץ לטעינה"
+
+    for name, stock in ((june, [10, 20, 30]), (july, [5, 15, 30])):
+        append_snapshot(_items(stock), snapshot_store_key(name), snapshot_date_from_name(name), tmp_path)
+
+    store = snapshot_store_key(july)
+    assert previous_snapshot_date(store, datetime.date(2024, 7, 23), tmp_path) == datetime.date(2024, 6, 23)
+    assert list_snapshots(tmp_path)["Store"].tolist() == [store, store]
+
+    history = load_snapshots(stores=[store], columns=["Item", "Stock Level"], snapshot_dir=tmp_path)
+    assert len(history) == 6
+    june_rows = history[history["Snapshot Date"] == pd.Timestamp(2024, 6, 23)]
+    assert june_rows["Item"].tolist() == ["A", "B", "C"]  # Partitions are sorted by Item
+    assert june_rows["Stock Level"].tolist() == [20.0, 10.0, 30.0]
+
+
+def test_rewriting_a_date_replaces_its_partition(tmp_path):
+    append_snapshot(_items([1, 2, 3]), "S", datetime.date(2024, 1, 1), tmp_path)
+    append_snapshot(_items([4, 5, 6]), "S", datetime.date(2024, 1, 1), tmp_path)
+    history = load_snapshots(stores=["S"], items=["C"], snapshot_dir=tmp_path)
+    assert history["Stock Level"].tolist() == [6.0]
+
+
+def test_names_without_a_year_take_the_latest_past_date():
+    january = datetime.date(2025, 1, 10)
+    assert snapshot_date_from_name("12.12 פלרם", today=january) == datetime.date(2024, 12, 12)
+    assert snapshot_date_from_name("5.1 פלרם", today=january) == datetime.date(2025, 1, 5)
+    assert snapshot_date_from_name("store 1.2.24") == datetime.date(2024, 2, 1)
+    assert snapshot_date_from_name("31.2.2024") is None
+    assert snapshot_date_from_name("Main store") is None
+
+
+def test_reuploading_the_latest_workbook_adds_no_snapshot(tmp_path):
+    first, later = datetime.date(2026, 10, 1), datetime.date(2026, 10, 17)
+    assert append_snapshot(_items([1, 2, 3]), "S", first, tmp_path, content_hash="aaa") == first
+    assert latest_snapshot("S", tmp_path) == (first, "aaa")
+
+    # The same undated file uploaded again later is recorded under its first date
+    assert append_snapshot(_items([1, 2, 3]), "S", later, tmp_path, content_hash="aaa") == first
+    assert list_snapshots(tmp_path)["Snapshot Date"].tolist() == [first]
+
+    assert append_snapshot(_items([0, 2, 3]), "S", later, tmp_path, content_hash="bbb") == later
+    assert latest_snapshot("S", tmp_path) == (later, "bbb")
+    assert latest_snapshot("other", tmp_path) is None
+
+
+def test_snapshots_without_a_hash_are_always_written(tmp_path):
+    append_snapshot(_items([1, 2, 3]), "S", datetime.date(2024, 1, 1), tmp_path)
+    append_snapshot(_items([1, 2, 3]), "S", datetime.date(2024, 2, 1), tmp_path)
+
+    assert latest_snapshot("S", tmp_path) == (datetime.date(2024, 2, 1), None)
+    assert len(list_snapshots(tmp_path)) == 2
@@ -0,0 +1,53 @@
+# File: tests/test_stock_warnings.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.stock_warnings import WarningRule, evaluate_warnings
+
+
+def _items():
+    return pd.DataFrame({
+        "Item": ["out", "low", "normal", "over", "missing", "no rop"],
+        "Stock Level": [0.0, 5.0, 15.0, 50.0, np.nan, 10.0],
+        "Reorder Point": [10.0, 10.0, 10.0, 10.0, 10.0, np.nan],
+    })
+
+
+def test_each_item_gets_the_first_matching_rule():
+    warnings = evaluate_warnings(_items())
+
+    assert list(warnings.status) == ["Out of Stock", "Low Stock", "Normal", "Overstock", "Normal", "Normal"]
+    assert list(warnings.risk) == ["High", "High", "Low", "Medium", "Low", "Low"]
+    assert list(warnings.priority) == [
+        "Order Now - Out of Stock", "Order Now - Below Reorder Point", "No Action",
+        "Delayed Order - Overstock", "No Action", "No Action",
+    ]
+
+
+def test_positions_select_by_status_and_risk():
+    warnings = evaluate_warnings(_items())
+
+    assert warnings.positions(risk="High").tolist() == [0, 1]
+    assert warnings.positions(status="Overstock").tolist() == [3]
+    assert warnings.positions(status="Low Stock", risk="High").tolist() == [1]
+    assert warnings.positions(status="Normal", risk="High").tolist() == []
+    assert len(warnings.positions()) == 6
+    assert warnings.counts().to_dict() == {"Out of Stock": 1, "Low Stock": 1, "Overstock": 1, "Normal": 3}
+
+
+def test_overstock_factor_moves_the_threshold():
+    assert evaluate_warnings(_items(), overstock_factor=6.0).positions(status="Overstock").tolist() == []
+
+
+def test_custom_rules():
+    rules = [WarningRule("Dead Stock", "Medium", "Review", lambda c, p: c["Sales"] == 0)]
+    data = pd.DataFrame({"Sales": [0.0, 3.0]})
+
+    assert list(evaluate_warnings(data, rules).status) == ["Dead Stock", "Normal"]
+
+
+def test_missing_column_raises_value_error():
+    with pytest.raises(ValueError, match="Error evaluating warnings"):
+        evaluate_warnings(pd.DataFrame({"Stock Level": [1.0]}))
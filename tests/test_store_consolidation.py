@@ -0,0 +1,55 @@
+# File: tests/test_store_consolidation.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.forecasting import forecast_frame
+from utils.ingest_cache import load_cached_data
+from utils.config import STORE_COLUMN
+from utils.store_consolidation import discover_workbooks, load_stores, store_name
+
+
+def _workbook(path, periods, seed):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        "תאור פריט": [f"item {i}" for i in range(40)],
+        "משפחה": rng.choice(["A", "B"], 40),
+        "מלאי נוכחי": rng.integers(0, 500, 40),
+        "זמן אספקה בימים": 7,
+    })
+    for period in periods:
+        frame[period] = rng.poisson(rng.gamma(1.0, 50, 40))
+    frame.to_excel(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def stores(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # The Parquet cache lives under the working directory
+    numbered = _workbook(tmp_path / "north.xlsx", [str(i) for i in range(1, 25)], 0)
+    dated = _workbook(tmp_path / "south.xlsx", list(pd.date_range("2023-01-01", periods=12, freq="MS")), 1)
+    return [numbered, dated]
+
+
+def test_stores_are_tagged_in_order(stores):
+    data = load_stores(stores, max_workers=1)
+    assert data[STORE_COLUMN].tolist() == ["north"] * 40 + ["south"] * 40
+    assert isinstance(data[STORE_COLUMN].dtype, pd.CategoricalDtype)
+    assert discover_workbooks(str(stores[0].rsplit("/", 1)[0])) == stores
+
+
+def test_names_must_be_unique(stores):
+    with pytest.raises(ValueError, match="unique"):
+        load_stores(stores, names=["same", "same"], max_workers=1)
+
+
+def test_consolidated_forecasts_match_per_store_forecasts(stores):
+    data = load_stores(stores, max_workers=1)
+    assert len([c for c in data.columns if c.isdigit() or c.startswith("2023")]) == 36
+
+    separate = pd.concat([forecast_frame(load_cached_data(p)) for p in stores], ignore_index=True)
+    combined = forecast_frame(data)
+    assert combined["Forecasted Demand"].tolist() == separate["Forecasted Demand"].tolist()
+    assert combined["Model"].tolist() == separate["Model"].tolist()
+    assert store_name(stores[1]) == "south"
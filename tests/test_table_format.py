@@ -0,0 +1,34 @@
+# File: tests/test_table_format.py
+
+import numpy as np
+import pandas as pd
+
+from utils.table_format import RISK_TEXT_COLORS, css_by_category, css_where, style_page
+
+
+def test_css_where_uses_a_scalar_or_a_per_row_array():
+    mask = np.array([True, False, True])
+
+    assert css_where(mask, "color: red;").tolist() == ["color: red;", "", "color: red;"]
+    assert css_where(mask, np.array(["a", "b", "c"], dtype=object)).tolist() == ["a", "", "c"]
+    assert css_where(mask, "x").shape == (3,)
+
+
+def test_css_by_category_looks_up_each_row():
+    risk = pd.Categorical(["High", "Low", None, "Medium", "High"], categories=["High", "Medium", "Low"])
+
+    css = css_by_category(risk, RISK_TEXT_COLORS)
+
+    assert css.shape == (5,)
+    assert css.tolist() == ["color: red;", "", "", "color: orange;", "color: red;"]
+
+
+def test_style_page_applies_the_rows_of_the_page():
+    data = pd.DataFrame({"Item": ["a", "b", "c", "d"], "Stock Level": [0, 5, 50, 1]})
+    styles = {"Stock Level": np.array([f"width: {i}px;" for i in range(4)], dtype=object), "Missing": [""] * 4}
+    positions = np.array([2, 0])
+
+    html = style_page(data.iloc[positions], positions, styles).to_html()
+
+    assert "width: 2px" in html and "width: 0px" in html
+    assert "width: 1px" not in html and "width: 3px" not in html
@@ -0,0 +1,76 @@
+# File: utils/abc_analysis.py
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+ABC_LABELS = ["A", "B", "C"]
+
+# Upper cumulative-percentage bounds of classes A and B; the rest is C
+ABC_THRESHOLDS = (80, 95)
+
+# The first attempt orders only the top 1/TOP_BLOCK_FRACTION of items
+TOP_BLOCK_FRACTION = 8
+
+# Results kept per (dataset, value column, thresholds), most recent last
+_CACHE = OrderedDict()
+_CACHE_SIZE = 16
+
+
+def abc_codes(values, thresholds=ABC_THRESHOLDS):
+    """Return ABC class codes (0=A, 1=B, 2=C) aligned to the original order.
+
+    Only the most valuable items are ordered: argpartition selects a top
+    block, which is sorted and accumulated. If the block covers the last
+    threshold everything outside it is class C; otherwise all items are
+    sorted.
+    Missing and negative values count as zero; if the total is zero every
+    code is -1 (unclassified).
+    """
+    v = np.nan_to_num(np.asarray(values, dtype="float64")).clip(min=0)
+    n = len(v)
+    total = v.sum()
+    if n == 0 or total <= 0:
+        return np.full(n, -1, dtype="int8")
+
+    codes = np.full(n, len(thresholds), dtype="int8")
+    target = total * thresholds[-1] / 100
+    negated = -v
+    top = None
+    k = max(1024, n // TOP_BLOCK_FRACTION)
+    if k < n:
+        top = np.argpartition(negated, k - 1)[:k]
+        top = top[np.argsort(negated[top])]
+        cumulative = np.cumsum(v[top])
+        if cumulative[-1] < target:
+            top = None  # Value is spread too evenly; order everything
+    if top is None:
+        top = np.argsort(negated)
+        cumulative = np.cumsum(v[top])
+
+    percentage = cumulative / total * 100
+    codes[top] = np.searchsorted(np.asarray(thresholds, dtype="float64"), percentage, side="left")
+    return codes
+
+
+def abc_classification(data, value_column="Selling Price", dataset_key=None, thresholds=ABC_THRESHOLDS):
+    """ABC class of every item by Stock Level x value_column, as a Categorical.
+
+    The frame is neither sorted nor copied. With a dataset_key (e.g. the
+    upload's content hash, never just its name) the codes are cached, so
+    switching tabs or revisiting the value definition does not recompute them.
+    """
+    key = (dataset_key, value_column, tuple(thresholds))
+    codes = _CACHE.get(key) if dataset_key is not None else None
+    if codes is None or len(codes) != len(data):
+        stock = data["Stock Level"].to_numpy(dtype="float64", na_value=np.nan)
+        price = data[value_column].to_numpy(dtype="float64", na_value=np.nan)
+        codes = abc_codes(stock * price, thresholds)
+        if dataset_key is not None:
+            _CACHE[key] = codes
+            while len(_CACHE) > _CACHE_SIZE:
+                _CACHE.popitem(last=False)
+    else:
+        _CACHE.move_to_end(key)
+    return pd.Categorical.from_codes(codes, ABC_LABELS[:len(thresholds) + 1])
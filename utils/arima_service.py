@@ -0,0 +1,145 @@
+# File: utils/arima_service.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from utils.config import MODEL_CACHE_DIR
+
+DEFAULT_ORDER = (1, 1, 1)
+
+# SKUs sent to a worker per task; large enough to amortize process overhead
+CHUNK_SIZE = 50
+
+
+def history_hash(history):
+    """Hash a single SKU's sales history so changed histories are refitted."""
+    y = np.ascontiguousarray(np.nan_to_num(np.asarray(history, dtype="float64")))
+    return hashlib.sha1(y.tobytes()).hexdigest()
+
+
+def sku_keys(data, columns=("Category", "Item")):
+    """Unique model-cache key per row: the columns joined by "|", with "#2", "#3"... for repeats.
+
+    Workbooks list some item names more than once; numbering repeats in row
+    order keeps each row's fitted model separate.
+    """
+    present = [c for c in columns if c in data.columns]
+    if not present:
+        raise ValueError("Error building SKU keys: none of the key columns is present")
+    keys = data[present[0]].astype("string").fillna("")
+    for col in present[1:]:
+        keys = keys + "|" + data[col].astype("string").fillna("")
+    occurrence = keys.groupby(keys, sort=False).cumcount()
+    return keys.where(occurrence == 0, keys + "#" + (occurrence + 1).astype(str))
+
+
+def _connect(cache_dir):
+    os.makedirs(cache_dir, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(cache_dir, "arima.sqlite"))
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS fits ("
+        " sku TEXT, model_order TEXT, history_hash TEXT, params TEXT, forecast TEXT,"
+        " PRIMARY KEY (sku, model_order))"
+    )
+    return conn
+
+
+def _fit_chunk(chunk, order, horizon):
+    """Fit ARIMA to each (row, history, start_params) in a worker process."""
+    from statsmodels.tsa.arima.model import ARIMA
+
+    results = []
+    for row, y, start_params in chunk:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                model = ARIMA(y, order=order)
+                if start_params is not None and len(start_params) != len(model.param_names):
+                    start_params = None
+                fitted = model.fit(start_params=start_params)
+            forecast = np.clip(fitted.forecast(horizon), 0, None)
+            results.append((row, np.asarray(fitted.params).tolist(), forecast.tolist()))
+        except Exception:
+            results.append((row, None, [float("nan")] * horizon))
+    return results
+
+
+def fit_arima(skus, histories, order=DEFAULT_ORDER, horizon=1, cache_dir=MODEL_CACHE_DIR,
+              max_workers=None, chunk_size=CHUNK_SIZE, progress=None):
+    """Fit one ARIMA model per SKU across a process pool and return the forecasts.
+
+    skus are unique item identifiers (see sku_keys) and histories the matching rows of an
+    (n_items, n_periods) sales array. Fitted parameters are stored in
+    cache_dir keyed by SKU and model order: an unchanged history reuses the
+    stored forecast without refitting, and a changed one is refitted starting
+    from the stored parameters. progress, if given, is called as
+    progress(done, total) while fits complete. Returns an (n_items, horizon)
+    array; SKUs whose fit fails are NaN.
+    """
+    histories = np.nan_to_num(np.asarray(histories, dtype="float64"))
+    order_key = json.dumps(list(order))
+    total = len(skus)
+    forecasts = np.full((total, horizon), np.nan)
+    skus = [str(sku) for sku in skus]
+    if len(set(skus)) != total:
+        raise ValueError("Error fitting ARIMA: SKU identifiers must be unique")
+
+    conn = _connect(cache_dir)
+    try:
+        stored = {
+            sku: (h, json.loads(params), json.loads(forecast))
+            for sku, h, params, forecast in conn.execute(
+                "SELECT sku, history_hash, params, forecast FROM fits WHERE model_order = ?", (order_key,)
+            )
+        }
+
+        jobs = []
+        hashes = {}
+        for i, sku in enumerate(skus):
+            hashes[sku] = history_hash(histories[i])
+            previous = stored.get(sku)
+            if previous is not None and previous[0] == hashes[sku] and len(previous[2]) >= horizon:
+                forecasts[i] = previous[2][:horizon]
+            else:
+                jobs.append((i, histories[i], previous[1] if previous else None))
+
+        done = total - len(jobs)
+        if progress:
+            progress(done, total)
+
+        chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+
+        def record(results):
+            rows = []
+            for i, params, forecast in results:
+                forecasts[i] = forecast
+                if params is not None:
+                    sku = skus[i]
+                    rows.append((sku, order_key, hashes[sku], json.dumps(params), json.dumps(forecast)))
+            conn.executemany("INSERT OR REPLACE INTO fits VALUES (?, ?, ?, ?, ?)", rows)
+            conn.commit()
+
+        if len(chunks) <= 1 or max_workers == 1:
+            # Not worth starting worker processes
+            for chunk in chunks:
+                record(_fit_chunk(chunk, order, horizon))
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {pool.submit(_fit_chunk, chunk, order, horizon): len(chunk) for chunk in chunks}
+                for future in as_completed(futures):
+                    record(future.result())
+                    done += futures[future]
+                    if progress:
+                        progress(done, total)
+    finally:
+        conn.close()
+    return forecasts
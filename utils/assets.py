@@ -0,0 +1,13 @@
+# File: utils/assets.py
+
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def load_asset(path):
+    """Return the bytes of a static file such as the client logo, read once per process."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except Exception as e:
+        raise ValueError(f"Error loading asset {path}: {e}")
@@ -0,0 +1,91 @@
+# File: utils/auth.py
+
+import functools
+import getpass
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sys
+import time
+
+from utils.config import CREDENTIALS_FILE, SESSION_SECRET_ENV, SESSION_TTL
+
+# Signing key used when SESSION_SECRET_ENV is unset; tokens then last as long as the process
+_PROCESS_SECRET = secrets.token_bytes(32)
+
+
+@functools.lru_cache(maxsize=None)
+def load_credentials(path=CREDENTIALS_FILE):
+    """Return {username: bcrypt hash} from the credential file, read once per process."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return {user: hashed.encode("utf-8") for user, hashed in json.load(f).items()}
+    except Exception as e:
+        raise ValueError(f"Error loading credentials: {e}")
+
+
+def hash_password(password):
+    """bcrypt hash of a password, as stored in the credential file."""
+    import bcrypt
+
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def check_password(credentials, username, password):
+    """Check a login against the stored hash; bcrypt runs only here, once per login."""
+    import bcrypt
+
+    hashed = credentials.get(username)
+    return hashed is not None and bcrypt.checkpw(password.encode("utf-8"), hashed)
+
+
+def _secret():
+    secret = os.environ.get(SESSION_SECRET_ENV)
+    return secret.encode("utf-8") if secret else _PROCESS_SECRET
+
+
+def _sign(payload):
+    return hmac.new(_secret(), payload.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def issue_token(username, ttl=SESSION_TTL):
+    """Signed session token of the form "<username>|<expiry>|<signature>"."""
+    payload = f"{username}|{int(time.time()) + ttl}"
+    return f"{payload}|{_sign(payload)}"
+
+
+def verify_token(token):
+    """Return the username of a valid, unexpired token, otherwise None."""
+    if not token:
+        return None
+    try:
+        payload, signature = token.rsplit("|", 1)
+        username, expires = payload.rsplit("|", 1)
+        if not hmac.compare_digest(signature, _sign(payload)) or int(expires) < time.time():
+            return None
+        return username
+    except ValueError:
+        return None
+
+
+def add_user(username, password, path=CREDENTIALS_FILE):
+    """Add or replace a user in the credential file."""
+    users = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            users = json.load(f)
+    users[username] = hash_password(password)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(users, f, indent=2)
+        f.write("\n")
+    load_credentials.cache_clear()
+
+
+if __name__ == "__main__":
+    # Usage (from the repository root): python -m utils.auth <username>
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python -m utils.auth <username>")
+    add_user(sys.argv[1], getpass.getpass("Password: "))
+    print(f"Saved credentials for {sys.argv[1]} to {CREDENTIALS_FILE}")
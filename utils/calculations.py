@@ -17,4 +17,43 @@ def calculate_reorder_point_and_eoq(data, safety_factor=1.65, ordering_cost=100,
 
         return data
     except Exception as e:
-        raise ValueError(f"Error calculating Reorder Point and EOQ: {e}")
\ No newline at end of file
+        raise ValueError(f"Error calculating Reorder Point and EOQ: {e}")
+
+# Metric axis of the array returned by calculate_scenarios
+SCENARIO_METRICS = ("Safety Stock", "Reorder Point", "EOQ")
+
+def scenario_grid(safety_factors, ordering_costs, holding_costs):
+    """Expand parameter values into flat arrays covering every combination."""
+    grids = np.meshgrid(
+        np.atleast_1d(safety_factors), np.atleast_1d(ordering_costs), np.atleast_1d(holding_costs),
+        indexing="ij",
+    )
+    return [g.ravel() for g in grids]
+
+def calculate_scenarios(data, safety_factors, ordering_costs, holding_costs, dtype=np.float32):
+    """Calculate Safety Stock, Reorder Point and EOQ for many parameter sets at once.
+
+    The parameter arrays are broadcast against each other, giving S scenarios
+    (use scenario_grid for a full cross product). Returns an array of shape
+    (3, S, n_items) ordered as SCENARIO_METRICS. The DataFrame is not modified.
+    """
+    try:
+        stock = np.nan_to_num(data["Stock Level"].to_numpy(dtype="float64", na_value=np.nan), nan=0.0).clip(min=0)
+        lead_time = np.nan_to_num(data["Lead Time"].to_numpy(dtype="float64", na_value=np.nan), nan=7.0).clip(min=0)
+        safety, ordering, holding = (
+            a.ravel() for a in np.broadcast_arrays(
+                np.atleast_1d(np.asarray(safety_factors, dtype="float64")),
+                np.atleast_1d(np.asarray(ordering_costs, dtype="float64")),
+                np.atleast_1d(np.asarray(holding_costs, dtype="float64")),
+            )
+        )
+
+        daily_demand = stock / 30
+        result = np.empty((len(SCENARIO_METRICS), safety.size, stock.size), dtype=dtype)
+        # Each metric is an outer product of a per-scenario and a per-item factor
+        np.multiply.outer(safety, np.sqrt(lead_time) * daily_demand, out=result[0])
+        np.add(result[0], daily_demand * lead_time, out=result[1])
+        np.multiply.outer(np.sqrt(ordering / holding), np.sqrt(2 * daily_demand), out=result[2])
+        return result
+    except Exception as e:
+        raise ValueError(f"Error calculating scenarios: {e}")
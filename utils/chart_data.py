@@ -0,0 +1,78 @@
+# File: utils/chart_data.py
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+# Most bars or slices drawn per chart; everything else goes into "Other"
+MAX_CHART_ITEMS = 30
+
+# Bins used for distribution charts
+HISTOGRAM_BINS = 40
+
+OTHER_LABEL = "Other"
+
+
+def top_items(data, label, value, n=MAX_CHART_ITEMS, color=None):
+    """Rows of the n labels with the largest absolute value, plus "Other" rows.
+
+    Labels are ranked by their largest |value| so negative profits are kept.
+    The remaining rows are summed into one "Other" row, or one per color
+    group when color is given. Returns a small frame sorted by value.
+    """
+    columns = [label, value] + ([color] if color else [])
+    frame = data[columns]
+    scores = frame[value].abs().groupby(frame[label], sort=False, observed=True).max()
+    if len(scores) <= n:
+        return frame.sort_values(value, ascending=False)
+
+    in_top = frame[label].isin(scores.nlargest(n).index).to_numpy()
+    top = frame[in_top].sort_values(value, ascending=False)
+    rest = frame[~in_top]
+    other_label = f"{OTHER_LABEL} ({rest[label].nunique()} items)"
+    if color:
+        other = rest.groupby(color, sort=False, observed=True)[value].sum().reset_index()
+        other[label] = other_label
+    else:
+        other = pd.DataFrame({label: [other_label], value: [rest[value].sum()]})
+    return pd.concat([top.astype({label: object}), other[columns]], ignore_index=True)
+
+
+def category_rollup(data, category, value, n=MAX_CHART_ITEMS):
+    """Total value per category, keeping the n largest categories plus "Other"."""
+    totals = data.groupby(category, sort=False, observed=True)[value].sum().reset_index()
+    return top_items(totals, category, value, n)
+
+
+def binned_counts(data, column, bins=HISTOGRAM_BINS):
+    """Histogram of a numeric column as a frame of bin ranges and item counts."""
+    values = data[column].to_numpy(dtype="float64", na_value=np.nan)
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    return pd.DataFrame({
+        column: (edges[:-1] + edges[1:]) / 2,
+        "Items": counts,
+        "Range": [f"{lo:,.2f} - {hi:,.2f}" for lo, hi in zip(edges[:-1], edges[1:])],
+    })
+
+
+def item_bar_chart(data, x, y, title, color=None, n=MAX_CHART_ITEMS, **kwargs):
+    """Bar chart of the top n items by y, with the rest rolled into "Other"."""
+    frame = top_items(data, x, y, n, color)
+    return px.bar(frame, x=x, y=y, color=color, title=title, **kwargs)
+
+
+def category_bar_chart(data, category, value, title, **kwargs):
+    """Bar chart of value summed per category."""
+    return px.bar(category_rollup(data, category, value), x=category, y=value, title=title, **kwargs)
+
+
+def category_pie_chart(data, category, value, title, **kwargs):
+    """Pie chart of value summed per category."""
+    return px.pie(category_rollup(data, category, value), values=value, names=category, title=title, **kwargs)
+
+
+def histogram_chart(data, column, title, bins=HISTOGRAM_BINS):
+    """Distribution of a numeric column, binned on the server."""
+    frame = binned_counts(data, column, bins)
+    return px.bar(frame, x=column, y="Items", hover_data=["Range"], title=title)
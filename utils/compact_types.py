@@ -0,0 +1,91 @@
+# File: utils/compact_types.py
+
+import numpy as np
+import pandas as pd
+
+# Text columns with at most this share of distinct values become categoricals
+CATEGORY_MAX_RATIO = 0.5
+
+# Narrowest integer type used, so stock x price products and sales history sums cannot wrap
+MIN_INTEGER_DTYPE = np.int32
+
+
+def column_bytes(df):
+    """Bytes held by each column, including the contents of strings."""
+    return df.memory_usage(index=False, deep=True)
+
+
+def _compact_int(values):
+    """values as MIN_INTEGER_DTYPE, or int64 when they need it; unchanged if neither holds them."""
+    limits = np.iinfo(MIN_INTEGER_DTYPE)
+    if not len(values) or (values.min() >= limits.min and values.max() <= limits.max):
+        return values.astype(MIN_INTEGER_DTYPE)
+    if values.min() >= -(2.0 ** 63) and values.max() < 2.0 ** 63:
+        return values.astype(np.int64)
+    return values
+
+
+def _compact_float(values):
+    """Smallest dtype that holds every value of a float column exactly."""
+    finite = values[~np.isnan(values)]
+    if len(finite) == len(values) and len(values) and np.array_equal(finite, np.round(finite)):
+        return _compact_int(values)
+    as_float32 = values.astype("float32")
+    if np.array_equal(as_float32.astype("float64"), values, equal_nan=True):
+        return as_float32
+    return values
+
+
+def compact_column(series, max_category_ratio=CATEGORY_MAX_RATIO):
+    """Return series in a smaller dtype when no value changes, otherwise unchanged.
+
+    Floats become integers when they are all whole numbers, or float32 when
+    every value survives the round trip; integers narrow no further than
+    MIN_INTEGER_DTYPE; text with few distinct values becomes a categorical.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+        return series
+    if pd.api.types.is_float_dtype(dtype) and isinstance(dtype, np.dtype):
+        return pd.Series(_compact_float(series.to_numpy()), index=series.index, name=series.name)
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        return pd.Series(_compact_int(series.to_numpy()), index=series.index, name=series.name)
+    if pd.api.types.is_string_dtype(dtype) or dtype == object:
+        if len(series) and series.nunique(dropna=True) <= len(series) * max_category_ratio:
+            return series.astype("category")
+    return series
+
+
+def memory_report(df, before):
+    """Each column's dtype and bytes in before (a compact_types report) and in df now.
+
+    Columns added to df since then have no "Before" figures. Returns a frame
+    with a "Total" row, so it can be rebuilt whenever df's columns change.
+    """
+    before = before.drop(index="Total", errors="ignore")
+    after_bytes = column_bytes(df)
+    report = pd.DataFrame({
+        "Before dtype": before["Before dtype"].reindex(df.columns).fillna(""),
+        "After dtype": df.dtypes.astype(str),
+        "Before bytes": before["Before bytes"].reindex(df.columns),
+        "After bytes": after_bytes,
+    })
+    report.loc["Total"] = ["", "", report["Before bytes"].sum(), after_bytes.sum()]
+    return report
+
+
+def compact_types(df, max_category_ratio=CATEGORY_MAX_RATIO):
+    """Shrink the column types of df in place and report the memory saved.
+
+    Returns (df, report) where report lists each column's dtype and bytes
+    before and after, with a "Total" row.
+    """
+    try:
+        before = pd.DataFrame({"Before dtype": df.dtypes.astype(str), "Before bytes": column_bytes(df)})
+        for col in df.columns:
+            compacted = compact_column(df[col], max_category_ratio)
+            if compacted is not df[col]:
+                df[col] = compacted
+        return df, memory_report(df, before)
+    except Exception as e:
+        raise ValueError(f"Error compacting column types: {e}")
@@ -5,3 +5,43 @@ UPLOAD_DIR = "uploaded_files"
 
 # Path to the client logo
 CLIENT_LOGO = "uploaded_files/superpharm_logo.png"
+
+# Directory for the processed Parquet copies of uploaded workbooks
+CACHE_DIR = "uploaded_files/cache"
+
+# Upper bound on the total size of CACHE_DIR before old entries are evicted
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Directory for fitted forecasting model parameters, reused across uploads
+MODEL_CACHE_DIR = "uploaded_files/models"
+
+# Unicode TrueType fonts tried in order for PDF reports; the first one found is used
+PDF_FONT_CANDIDATES = [
+    "uploaded_files/fonts/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
+    "/Library/Fonts/Arial Unicode.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+]
+
+# Precomputed bcrypt hashes of dashboard users ({"username": "$2b$..."})
+CREDENTIALS_FILE = "credentials.json"
+
+# Environment variable holding the key that signs session tokens
+SESSION_SECRET_ENV = "INVENTORY_SESSION_SECRET"
+
+# Seconds a session token stays valid after login
+SESSION_TTL = 12 * 60 * 60
+
+# Column added to consolidated data naming the store (workbook) each row came from
+STORE_COLUMN = "Store"
+
+# Date-partitioned Parquet history of processed uploads, one partition per store and date
+SNAPSHOT_DIR = "uploaded_files/snapshots"
+
+# JSON-lines log of pipeline stage timings recorded by utils.instrumentation
+PERF_LOG = "uploaded_files/perf_log.jsonl"
+
+# Set to 1 to trace memory (process-wide, slows every session) while performance is recorded
+PERF_TRACE_MEMORY_ENV = "INVENTORY_TRACE_MEMORY"
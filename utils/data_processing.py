@@ -1,21 +1,52 @@
 # File: utils/data_processing.py
 
-import pandas as pd
+import re
+
+from utils.excel_reader import read_excel_projected
+
+# Hebrew source headers and the English names used throughout the dashboard
+COLUMN_MAPPINGS = {
+    "משפחה": "Category",
+    "תאור פריט": "Item",
+    "מלאי נוכחי": "Stock Level",
+    "עלות פריט": "Purchase Price",
+    "מחיר מכירה": "Selling Price",
+    "זמן אספקה בימים": "Lead Time",
+    "מקדם אלפא למעריכית": "Smoothing Alpha",
+}
+
+# Columns that are read as floats; anything else is kept as text
+NUMERIC_COLUMNS = [
+    "Stock Level",
+    "Purchase Price",
+    "Selling Price",
+    "Lead Time",
+    "Reorder Point",
+    "Safety Factor",
+    "Months of Inventory",
+    "Smoothing Alpha",
+]
+
+# Monthly sales headers are either dates ("2023-01-01 00:00:00") or period numbers ("1".."24")
+_HISTORY_HEADER = re.compile(r"^(\d{4}-\d{2}-\d{2}( 00:00:00)?|[1-9]|1\d|2[0-4])$")
+
+def is_history_column(name):
+    """Return True if a column header names a monthly sales period."""
+    return bool(_HISTORY_HEADER.match(str(name)))
+
+def history_columns(columns):
+    """Return the monthly sales columns in sheet (chronological) order."""
+    return [col for col in columns if is_history_column(col)]
+
+def is_numeric_column(name):
+    """Return True for columns read as floats: known numeric fields and sales history."""
+    return name in NUMERIC_COLUMNS or is_history_column(name)
 
 def load_and_process_data(file_path):
     """Load and process the uploaded Excel file."""
     try:
-        df = pd.read_excel(file_path)
-        df.columns = df.columns.map(str)  # Ensure all column names are strings
-        column_mappings = {
-            "משפחה": "Category",
-            "תאור פריט": "Item",
-            "מלאי נוכחי": "Stock Level",
-            "עלות פריט": "Purchase Price",
-            "מחיר מכירה": "Selling Price",
-            "זמן אספקה בימים": "Lead Time",
-        }
-        df.rename(columns=column_mappings, inplace=True)
-        return df
+        return read_excel_projected(
+            file_path, COLUMN_MAPPINGS, keep=is_history_column, numeric_columns=is_numeric_column
+        )
     except Exception as e:
-        raise ValueError(f"Error loading and processing data: {e}")
\ No newline at end of file
+        raise ValueError(f"Error loading and processing data: {e}")
@@ -0,0 +1,141 @@
+# File: utils/demand_history.py
+
+import numpy as np
+import pandas as pd
+
+from utils.config import STORE_COLUMN
+
+# Columns that identify a SKU across snapshots, when present
+KEY_COLUMNS = (STORE_COLUMN, "Item")
+
+# Valid intervals an item needs before its observed demand replaces the Stock Level / 30 proxy
+MIN_DEMAND_INTERVALS = 2
+
+
+def _key_codes(frame, keys):
+    """Integer code per row for the combination of key columns (hash-based factorize)."""
+    codes = np.zeros(len(frame), dtype="int64")
+    for key in keys:
+        key_codes, uniques = pd.factorize(frame[key], use_na_sentinel=False)
+        codes = codes * len(uniques) + key_codes
+    return pd.factorize(codes)
+
+
+def repeated_snapshots(snapshots, receipts_column=None):
+    """Row mask of snapshots whose items and stock equal the same store's previous snapshot.
+
+    Such a snapshot is the same workbook uploaded again, not a period in
+    which nothing was sold.
+    """
+    store = snapshots[STORE_COLUMN] if STORE_COLUMN in snapshots.columns else pd.Series(0, index=snapshots.index)
+    content = [c for c in ("Item", "Stock Level", receipts_column) if c is not None and c in snapshots.columns]
+    row_hashes = pd.util.hash_pandas_object(snapshots[content], index=False).to_numpy()
+    days = pd.to_datetime(snapshots["Snapshot Date"]).to_numpy().astype("datetime64[D]")
+    groups = pd.DataFrame({"store": store.to_numpy(), "day": days}).groupby(["store", "day"], sort=True).indices
+
+    repeated = np.zeros(len(snapshots), dtype=bool)
+    previous_store, previous_content = None, None
+    for (group_store, _), rows in groups.items():
+        group_content = np.sort(row_hashes[rows])
+        if group_store == previous_store and np.array_equal(group_content, previous_content):
+            repeated[rows] = True
+        previous_store, previous_content = group_store, group_content
+    return repeated
+
+
+def derive_demand(snapshots, receipts_column=None):
+    """Per-SKU daily demand from consecutive stock snapshots.
+
+    snapshots is a long frame (e.g. from load_snapshots) with Snapshot Date,
+    Item, Stock Level and optionally Store. Rows are aligned per SKU by
+    hashing the key columns, sorted by date, and each pair of consecutive
+    snapshots gives the stock consumed over the days between them. Intervals
+    where stock rose (a receipt) are skipped unless receipts_column gives the
+    quantity received since the previous snapshot, in which case it is added
+    back; intervals starting out of stock are skipped because demand there
+    is censored. Snapshots identical to their store's previous one
+    (repeated_snapshots) are dropped, so the interval runs on to the next
+    snapshot that differs.
+
+    Returns one row per SKU with the key columns, Snapshots, Intervals,
+    Observed Daily Demand (consumption / days), and Daily Demand Variance
+    and Std (the per-day spread implied by the interval rates, NaN with
+    fewer than two intervals).
+    """
+    try:
+        snapshots = snapshots[~repeated_snapshots(snapshots, receipts_column)]
+        keys = [k for k in KEY_COLUMNS if k in snapshots.columns]
+        codes, uniques = _key_codes(snapshots, keys)
+        days = pd.to_datetime(snapshots["Snapshot Date"]).to_numpy().astype("datetime64[D]").astype("int64")
+        stock = snapshots["Stock Level"].to_numpy(dtype="float64", na_value=np.nan)
+
+        order = np.lexsort((days, codes))
+        codes_sorted, days = codes[order], days[order]
+        # An item listed more than once in a snapshot counts once, with its stock summed
+        first_of_run = np.ones(len(codes_sorted), dtype=bool)
+        first_of_run[1:] = (codes_sorted[1:] != codes_sorted[:-1]) | (days[1:] != days[:-1])
+        starts = np.flatnonzero(first_of_run)
+        codes_sorted, days = codes_sorted[starts], days[starts]
+        stock = np.add.reduceat(stock[order], starts) if len(starts) else stock
+        consumption = stock[:-1] - stock[1:]
+        if receipts_column is not None:
+            received = snapshots[receipts_column].to_numpy(dtype="float64", na_value=np.nan)[order]
+            received = np.add.reduceat(np.nan_to_num(received), starts) if len(starts) else received
+            consumption = consumption + received[1:]
+        gap = days[1:] - days[:-1]
+        valid = (
+            (codes_sorted[1:] == codes_sorted[:-1]) & (gap > 0)
+            & (consumption >= 0) & (stock[:-1] > 0)  # NaN comparisons are False, so gaps drop out too
+        )
+
+        n = len(uniques)
+        sku = codes_sorted[1:][valid]
+        quantity = consumption[valid]
+        interval_days = gap[valid].astype("float64")
+        intervals = np.bincount(sku, minlength=n)
+        total_days = np.bincount(sku, interval_days, minlength=n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.bincount(sku, quantity, minlength=n) / total_days
+            # An interval of d days has rate variance sigma^2 / d, so weight squared deviations by d
+            spread = np.bincount(sku, interval_days * (quantity / interval_days - mean[sku]) ** 2, minlength=n)
+            variance = np.where(intervals > 1, spread / (intervals - 1), np.nan)
+
+        first = np.full(n, -1, dtype="int64")
+        first[codes[::-1]] = np.arange(len(codes))[::-1]  # First row of each SKU, for its key values
+        result = pd.DataFrame({k: snapshots[k].iloc[first].to_numpy() for k in keys})
+        result["Snapshots"] = np.bincount(codes_sorted, minlength=n)
+        result["Intervals"] = intervals
+        result["Observed Daily Demand"] = mean
+        result["Daily Demand Variance"] = variance
+        result["Daily Demand Std"] = np.sqrt(variance)
+        return result
+    except Exception as e:
+        raise ValueError(f"Error deriving demand from snapshots: {e}")
+
+
+def attach_demand(data, demand, columns=("Observed Daily Demand", "Daily Demand Std"), store_key=None,
+                  min_intervals=MIN_DEMAND_INTERVALS):
+    """Copy demand columns onto data, matching rows on the shared key columns.
+
+    store_key, if given, maps the Store values of data to the stores of
+    demand (e.g. utils.snapshot_store.snapshot_store_key for file labels).
+    Items without history, or with fewer than min_intervals valid intervals,
+    get NaN, which the observed-demand rules in utils.derived_columns
+    replace with the Stock Level / 30 proxy.
+    """
+    keys = [k for k in KEY_COLUMNS if k in data.columns and k in demand.columns]
+    if not keys:
+        raise ValueError("Error attaching demand: no shared key columns")
+    index = pd.MultiIndex.from_frame(demand[keys].astype(str))
+    lookup = data[keys].astype(str)
+    if store_key is not None and STORE_COLUMN in keys:
+        lookup[STORE_COLUMN] = lookup[STORE_COLUMN].map(store_key)
+    positions = index.get_indexer(pd.MultiIndex.from_frame(lookup))
+    found = positions >= 0
+    if "Intervals" in demand.columns:
+        found[found] = demand["Intervals"].to_numpy()[positions[found]] >= min_intervals
+    for col in columns:
+        values = np.full(len(data), np.nan)
+        values[found] = demand[col].to_numpy(dtype="float64", na_value=np.nan)[positions[found]]
+        data[col] = values
+    return data
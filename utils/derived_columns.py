@@ -0,0 +1,130 @@
+# File: utils/derived_columns.py
+
+from collections import namedtuple
+
+import numpy as np
+
+# A derived column: the columns and parameters it reads, and how to compute it
+Rule = namedtuple("Rule", ["inputs", "params", "func"])
+
+DEFAULT_PARAMS = {
+    "safety_factor": 1.65,
+    "ordering_cost": 100,
+    "holding_cost": 10,
+    "value_column": "Selling Price",
+}
+
+
+def _column(data, name, fill):
+    return np.nan_to_num(data[name].to_numpy(dtype="float64", na_value=np.nan), nan=fill).clip(min=0)
+
+
+def _cumulative_percentage(data, params):
+    """Share of total value covered by items at least as valuable, in original row order."""
+    values = np.nan_to_num(data["Total Value"].to_numpy(dtype="float64", na_value=np.nan))
+    order = np.argsort(-values, kind="stable")
+    total = values.sum()
+    result = np.empty_like(values)
+    result[order] = np.cumsum(values[order]) / (total if total else 1) * 100
+    return result
+
+
+# Rules are listed in dependency order: every input is a base column or an earlier rule.
+# An input named after one of the rule's parameters means "the column that parameter names".
+DERIVED_RULES = {
+    "Average Daily Demand": Rule(
+        ("Stock Level",), (),
+        lambda data, p: _column(data, "Stock Level", 0) / 30,
+    ),
+    "Lead Time Demand": Rule(
+        ("Average Daily Demand", "Lead Time"), (),
+        lambda data, p: data["Average Daily Demand"].to_numpy() * _column(data, "Lead Time", 7),
+    ),
+    "Safety Stock": Rule(
+        ("Average Daily Demand", "Lead Time"), ("safety_factor",),
+        lambda data, p: p["safety_factor"] * np.sqrt(_column(data, "Lead Time", 7)) * data["Average Daily Demand"].to_numpy(),
+    ),
+    "Reorder Point": Rule(
+        ("Lead Time Demand", "Safety Stock"), (),
+        lambda data, p: data["Lead Time Demand"].to_numpy() + data["Safety Stock"].to_numpy(),
+    ),
+    "EOQ": Rule(
+        ("Average Daily Demand",), ("ordering_cost", "holding_cost"),
+        lambda data, p: np.sqrt(2 * data["Average Daily Demand"].to_numpy() * p["ordering_cost"] / p["holding_cost"]),
+    ),
+    "Total Value": Rule(
+        ("Stock Level", "value_column"), ("value_column",),
+        lambda data, p: _column(data, "Stock Level", 0) * _column(data, p["value_column"], 0),
+    ),
+    "Cumulative Percentage": Rule(("Total Value",), (), _cumulative_percentage),
+}
+
+
+def _observed_daily_demand(data, params):
+    """Demand measured from snapshots (utils.demand_history), else the Stock Level / 30 proxy."""
+    observed = data["Observed Daily Demand"].to_numpy(dtype="float64", na_value=np.nan)
+    return np.where(np.isfinite(observed), observed, _column(data, "Stock Level", 0) / 30)
+
+
+def _safety_stock_from_std(data, params):
+    """Safety stock from the measured daily demand spread, else from the average as before."""
+    std = data["Daily Demand Std"].to_numpy(dtype="float64", na_value=np.nan)
+    spread = np.where(np.isfinite(std), std, data["Average Daily Demand"].to_numpy())
+    return params["safety_factor"] * np.sqrt(_column(data, "Lead Time", 7)) * spread
+
+
+# The same graph for data with snapshot history attached by utils.demand_history.attach_demand
+OBSERVED_DEMAND_RULES = dict(
+    DERIVED_RULES,
+    **{
+        "Average Daily Demand": Rule(("Stock Level", "Observed Daily Demand"), (), _observed_daily_demand),
+        "Safety Stock": Rule(
+            ("Average Daily Demand", "Daily Demand Std", "Lead Time"), ("safety_factor",), _safety_stock_from_std
+        ),
+    },
+)
+
+
+class DerivedColumns:
+    """Keep the derived columns of a frame current, recomputing only stale ones.
+
+    Each derived column remembers the versions of its inputs and the parameter
+    values it was last computed with. update() walks the rules in order and
+    recomputes a column only when one of those changed, so moving the holding
+    cost recomputes EOQ and nothing else.
+    """
+
+    def __init__(self, data, rules=DERIVED_RULES, params=None):
+        self.data = data
+        self.rules = rules
+        self.params = dict(DEFAULT_PARAMS, **(params or {}))
+        self._versions = {}
+        self._signatures = {}
+
+    def invalidate(self, *columns):
+        """Mark base columns as edited so everything downstream is recomputed."""
+        for col in columns:
+            self._versions[col] = self._versions.get(col, 0) + 1
+
+    def _inputs(self, rule):
+        return [self.params[col] if col in rule.params else col for col in rule.inputs]
+
+    def update(self, **params):
+        """Apply new parameter values and return the names of recomputed columns."""
+        self.params.update(params)
+        recomputed = []
+        for name, rule in self.rules.items():
+            inputs = self._inputs(rule)
+            if not all(col in self.data.columns for col in inputs):
+                continue  # Source data lacks a required column
+            signature = (
+                tuple(self._versions.get(col, 0) for col in inputs),
+                tuple(self.params[p] for p in rule.params),
+            )
+            if name in self.data.columns and self._signatures.get(name) == signature:
+                continue
+            self.data[name] = rule.func(self.data, self.params)
+            self._signatures[name] = signature
+            self.invalidate(name)
+            recomputed.append(name)
+        return recomputed
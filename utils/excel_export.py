@@ -0,0 +1,89 @@
+# File: utils/excel_export.py
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+# Rows converted to Python values at a time while streaming a sheet
+EXPORT_CHUNK_ROWS = 10000
+
+# Columns of each sheet in the Final_Results-style workbook
+DETAILED_COLUMNS = ["Item", "Category", "Stock Level", "Lead Time", "Average Daily Demand",
+                    "Safety Stock", "Reorder Point", "EOQ", "Forecast Model", "Forecasted Demand"]
+ABC_COLUMNS = ["Item", "Category", "Total Value", "Cumulative Percentage"]
+FINANCIAL_COLUMNS = ["Item", "Adjusted Selling Price", "Adjusted Demand", "Adjusted Cost", "Profit"]
+
+
+def _chunk_values(values, start, stop):
+    """One chunk of a column as a list of cell values; missing values become blanks."""
+    chunk = values.iloc[start:stop].to_numpy() if hasattr(values, "iloc") else np.asarray(values[start:stop])
+    if chunk.dtype.kind == "M":
+        chunk = pd.DatetimeIndex(chunk).to_pydatetime().astype(object)
+    elif chunk.dtype.kind in "fc" or chunk.dtype == object:
+        chunk = chunk.astype(object)
+    else:
+        return chunk.tolist()
+    chunk[pd.isna(chunk)] = None
+    return chunk.tolist()
+
+
+def _write_sheet(workbook, name, columns, chunk_rows):
+    sheet = workbook.add_worksheet(name[:31])
+    sheet.write_row(0, 0, list(columns))
+    arrays = list(columns.values())
+    n_rows = len(arrays[0]) if arrays else 0
+    for start in range(0, n_rows, chunk_rows):
+        stop = min(start + chunk_rows, n_rows)
+        for offset, row in enumerate(zip(*(_chunk_values(a, start, stop) for a in arrays))):
+            sheet.write_row(start + offset + 1, 0, row)
+
+
+def final_results_sheets(data, warnings=None, abc=None, financial=None):
+    """Sheet layout of the analysis workbook as {sheet: {header: column}}.
+
+    Columns reference the source frames and results directly (no copies are
+    made); sheets whose inputs are missing are left out.
+    """
+    def pick(frame, names):
+        return {c: frame[c] for c in names if c in frame.columns}
+
+    sheets = {"Detailed Analysis": pick(data, DETAILED_COLUMNS)}
+    if warnings is not None:
+        sheets["Warnings"] = {
+            **pick(data, ["Item", "Stock Level", "Reorder Point"]),
+            "Status": warnings.status, "Risk": warnings.risk, "Priority": warnings.priority,
+        }
+    if abc is not None:
+        sheets["ABC"] = {**pick(data, ABC_COLUMNS), "ABC Classification": abc}
+    if financial is not None:
+        sheets["Financial"] = pick(financial, FINANCIAL_COLUMNS)
+    return sheets
+
+
+def export_workbook(sheets, path=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Stream sheets ({sheet: {header: column}}) into an xlsx file and return its path.
+
+    XlsxWriter runs in constant_memory mode, so each row is flushed to disk
+    once the next one starts and memory stays flat regardless of row count.
+    The workbook is written to a temp file first and renamed into place;
+    without a path the temp file itself is returned and the caller removes it.
+    """
+    directory = os.path.dirname(path) if path else None
+    fd, tmp_path = tempfile.mkstemp(dir=directory or None, suffix=".xlsx")
+    os.close(fd)
+    try:
+        workbook = xlsxwriter.Workbook(tmp_path, {"constant_memory": True})
+        for name, columns in sheets.items():
+            _write_sheet(workbook, name, columns, chunk_rows)
+        workbook.close()
+        if path:
+            os.replace(tmp_path, path)
+            return path
+        return tmp_path
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise ValueError(f"Error exporting workbook: {e}")
@@ -0,0 +1,98 @@
+# File: utils/excel_reader.py
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+# Number of rows buffered per column before a chunk is sealed
+CHUNK_ROWS = 16384
+
+
+def _to_float(value):
+    """Convert a worksheet cell value to float, using NaN for blanks and text."""
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _matcher(spec):
+    """Turn a collection of names or a predicate into a predicate."""
+    if callable(spec):
+        return spec
+    names = set(spec)
+    return names.__contains__
+
+
+def _projection(header, column_mappings, keep):
+    """Map worksheet column positions to output names for the columns we keep."""
+    mapped = set(column_mappings.values())
+    keep = _matcher(keep)
+    projection = {}
+    for position, name in enumerate(header):
+        if name is None:
+            continue
+        name = str(name)
+        target = column_mappings.get(name, name if name in mapped or keep(name) else None)
+        if target is not None and target not in projection.values():
+            projection[position] = target
+    return projection
+
+
+def read_excel_projected(source, column_mappings, keep=(), numeric_columns=(), chunk_size=CHUNK_ROWS):
+    """Stream the first worksheet and return only the mapped columns, renamed.
+
+    The workbook is opened in openpyxl read-only mode and read row by row.
+    Only columns whose header is a key of column_mappings, one of its values
+    or matched by keep are retained. keep and numeric_columns may be a
+    collection of names or a predicate on the name. Numeric columns are collected into
+    float64 arrays and the rest into object arrays, chunk_size rows at a
+    time, so memory grows with the projected columns rather than the sheet.
+    Rows in which every projected cell is blank are skipped.
+    """
+    try:
+        wb = load_workbook(source, read_only=True, data_only=True)
+    except Exception as e:
+        raise ValueError(f"Error opening Excel file: {e}")
+
+    try:
+        ws = wb.worksheets[0]
+        ws.reset_dimensions()  # Saved dimensions are unreliable; read to the last row
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame(columns=list(column_mappings.values()))
+
+        projection = _projection(header, column_mappings, keep)
+        positions = list(projection)
+        names = [projection[p] for p in positions]
+        is_numeric = _matcher(numeric_columns)
+        numeric = [is_numeric(name) for name in names]
+
+        def new_buffers():
+            return [np.empty(chunk_size, dtype="float64" if is_num else object) for is_num in numeric]
+
+        chunks = [[] for _ in names]
+        buffers = new_buffers()
+        filled = 0
+        for row in rows:
+            values = [row[p] if p < len(row) else None for p in positions]
+            if all(v is None for v in values):
+                continue
+            for i, value in enumerate(values):
+                buffers[i][filled] = _to_float(value) if numeric[i] else value
+            filled += 1
+            if filled == chunk_size:
+                for i, buf in enumerate(buffers):
+                    chunks[i].append(buf)
+                buffers = new_buffers()
+                filled = 0
+        for i, buf in enumerate(buffers):
+            chunks[i].append(buf[:filled])
+
+        columns = {name: np.concatenate(chunks[i]) for i, name in enumerate(names)}
+        return pd.DataFrame(columns, columns=names)
+    finally:
+        wb.close()
@@ -1,11 +1,143 @@
 # File: utils/file_management.py
 
+import hashlib
+import json
 import os
+import tempfile
+import threading
+import time
+
+from utils.config import SESSION_TTL
+
+# Uploads are stored once per distinct content under <upload_dir>/blobs
+BLOB_SUBDIR = "blobs"
+INDEX_FILE = "index.json"
+
+# Sessions kept in the index; the least recently active are dropped beyond this
+MAX_SESSIONS = 1000
+
+_CHUNK_SIZE = 1024 * 1024
+_index_lock = threading.Lock()
+
+
+def _blob_path(upload_dir, file_hash, extension):
+    return os.path.join(upload_dir, BLOB_SUBDIR, f"{file_hash}{extension}")
+
+
+def _iter_chunks(view):
+    for start in range(0, len(view), _CHUNK_SIZE):
+        yield view[start:start + _CHUNK_SIZE]
+
+
+def _write_atomic(chunks, target):
+    """Write chunks to a temp file next to target, then rename it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_index(upload_dir):
+    """Return the upload index: blob metadata plus per-session display names.
+
+    Each session is {"updated": <unix time>, "files": {display name: hash}}.
+    """
+    path = os.path.join(upload_dir, INDEX_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"blobs": {}, "sessions": {}}
+
+
+def prune_index(index, now=None, ttl=SESSION_TTL, max_sessions=MAX_SESSIONS):
+    """Drop expired sessions, sessions beyond max_sessions and entries of deleted blobs.
+
+    A session expires ttl seconds after its last new upload, like a login
+    token. Blobs whose file is gone (e.g. removed to free space) are removed
+    along with every session mapping that points at them. Returns True if
+    anything was dropped.
+    """
+    now = time.time() if now is None else now
+    blobs, sessions = index["blobs"], index["sessions"]
+    gone = [h for h, blob in blobs.items() if not os.path.exists(blob["path"])]
+    for file_hash in gone:
+        del blobs[file_hash]
+
+    changed = bool(gone)
+    for session_id, session in list(sessions.items()):
+        if not isinstance(session.get("files"), dict) or now - session.get("updated", 0) > ttl:
+            del sessions[session_id]  # Expired, or written before sessions carried a timestamp
+            changed = True
+            continue
+        stale = [name for name, file_hash in session["files"].items() if file_hash not in blobs]
+        for name in stale:
+            del session["files"][name]
+        if not session["files"]:
+            del sessions[session_id]
+        changed |= bool(stale)
+    if len(sessions) > max_sessions:
+        newest = sorted(sessions, key=lambda s: sessions[s]["updated"], reverse=True)[:max_sessions]
+        index["sessions"] = {s: sessions[s] for s in newest}
+        changed = True
+    return changed
+
+
+def _record_upload(upload_dir, file_hash, blob_path, display_name, size, session_id):
+    """Add the upload to the index, rewriting it only when something changed."""
+    with _index_lock:
+        index = load_index(upload_dir)
+        blob = index["blobs"].setdefault(file_hash, {"path": blob_path, "size": size, "names": []})
+        changed = blob["path"] != blob_path or display_name not in blob["names"]
+        blob["path"] = blob_path
+        if display_name not in blob["names"]:
+            blob["names"].append(display_name)
+        if session_id is not None:
+            now = time.time()
+            session = index["sessions"].get(session_id)
+            if not isinstance(session, dict) or not isinstance(session.get("files"), dict):
+                session = index["sessions"][session_id] = {"updated": now, "files": {}}
+            if session["files"].get(display_name) != file_hash:
+                session["files"][display_name] = file_hash
+                session["updated"] = now
+                changed = True
+        if changed:
+            # Pruned on every write, so the index stays bounded
+            prune_index(index)
+            payload = json.dumps(index, ensure_ascii=False, indent=2).encode("utf-8")
+            _write_atomic([payload], os.path.join(upload_dir, INDEX_FILE))
+
+
+def store_upload(uploaded_file, upload_dir, session_id=None):
+    """Store an upload by content hash and return (file_hash, file_path).
+
+    Identical uploads share one blob, and nothing is written when the blob
+    already exists. The display name and session are recorded in the index.
+    """
+    os.makedirs(os.path.join(upload_dir, BLOB_SUBDIR), exist_ok=True)
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    view = memoryview(uploaded_file.getbuffer())
+    file_hash = hashlib.sha256(view).hexdigest()
+    file_path = _blob_path(upload_dir, file_hash, extension)
+    if not os.path.exists(file_path):
+        _write_atomic(_iter_chunks(view), file_path)
+    _record_upload(upload_dir, file_hash, file_path, uploaded_file.name, len(view), session_id)
+    return file_hash, file_path
+
+
+def resolve_upload(upload_dir, session_id, display_name):
+    """Return the stored path of a file a session uploaded earlier, or None."""
+    index = load_index(upload_dir)
+    file_hash = index["sessions"].get(session_id, {}).get("files", {}).get(display_name)
+    blob = index["blobs"].get(file_hash)
+    return blob["path"] if blob is not None else None
+
 
 def save_uploaded_file(uploaded_file, upload_dir):
     """Save the uploaded file to the specified directory."""
-    os.makedirs(upload_dir, exist_ok=True)  # Ensure the directory exists
-    file_path = os.path.join(upload_dir, uploaded_file.name)
-    with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())  # Save the file content
-    return file_path
+    return store_upload(uploaded_file, upload_dir)[1]
@@ -0,0 +1,171 @@
+# File: utils/forecasting.py
+
+import numpy as np
+import pandas as pd
+
+from utils.config import STORE_COLUMN
+from utils.data_processing import history_columns
+
+# Model names, in the order of the index returned by forecast_demand
+FORECAST_MODELS = ("Simple Exponential Smoothing", "Holt", "Holt-Winters")
+
+
+def _prepare(history):
+    """Return the SKU x period history as float64, with missing months as zero sales."""
+    y = np.asarray(history, dtype="float64")
+    if y.ndim == 1:
+        y = y[np.newaxis, :]
+    return np.nan_to_num(y, nan=0.0)
+
+
+def _smoothing_weight(value, n_items):
+    """Broadcast a scalar or per-SKU smoothing weight to shape (n_items,)."""
+    w = np.broadcast_to(np.asarray(value, dtype="float64"), (n_items,))
+    return np.where(np.isfinite(w), w, 0.3).clip(0.0, 1.0)
+
+
+def simple_smoothing(history, alpha=0.3, horizon=1, score_from=1):
+    """Simple exponential smoothing for every SKU at once.
+
+    history is an (n_items, n_periods) array. Returns (forecast, mse), where
+    forecast has shape (n_items, horizon) and mse is the mean squared
+    one-step-ahead error per SKU over the periods from score_from on.
+    """
+    y = _prepare(history)
+    n_items, n_periods = y.shape
+    alpha = _smoothing_weight(alpha, n_items)
+    level = y[:, 0].copy()
+    sse = np.zeros(n_items)
+    score_from = max(score_from, 1)
+    for t in range(1, n_periods):
+        error = y[:, t] - level
+        if t >= score_from:
+            sse += error ** 2
+        level += alpha * error
+    forecast = np.repeat(level[:, np.newaxis], horizon, axis=1)
+    return forecast.clip(min=0), sse / max(n_periods - score_from, 1)
+
+
+def holt_smoothing(history, alpha=0.3, beta=0.1, horizon=1, score_from=1):
+    """Holt's linear-trend exponential smoothing for every SKU at once."""
+    y = _prepare(history)
+    n_items, n_periods = y.shape
+    alpha = _smoothing_weight(alpha, n_items)
+    beta = _smoothing_weight(beta, n_items)
+    if n_periods < 2:
+        return simple_smoothing(y, alpha, horizon, score_from)
+
+    level = y[:, 0].copy()
+    trend = y[:, 1] - y[:, 0]
+    sse = np.zeros(n_items)
+    score_from = max(score_from, 1)
+    for t in range(1, n_periods):
+        expected = level + trend
+        if t >= score_from:
+            sse += (y[:, t] - expected) ** 2
+        previous_level = level
+        level = alpha * y[:, t] + (1 - alpha) * expected
+        trend = beta * (level - previous_level) + (1 - beta) * trend
+    steps = np.arange(1, horizon + 1)
+    forecast = level[:, np.newaxis] + trend[:, np.newaxis] * steps
+    return forecast.clip(min=0), sse / max(n_periods - score_from, 1)
+
+
+def holt_winters_smoothing(history, alpha=0.3, beta=0.1, gamma=0.1, season_length=12, horizon=1):
+    """Additive Holt-Winters smoothing for every SKU at once.
+
+    Needs at least two full seasons of history; returns (None, None) otherwise.
+    """
+    y = _prepare(history)
+    n_items, n_periods = y.shape
+    if n_periods < 2 * season_length:
+        return None, None
+    alpha = _smoothing_weight(alpha, n_items)
+    beta = _smoothing_weight(beta, n_items)
+    gamma = _smoothing_weight(gamma, n_items)
+
+    first = y[:, :season_length].mean(axis=1)
+    second = y[:, season_length:2 * season_length].mean(axis=1)
+    level = first
+    trend = (second - first) / season_length
+    season = y[:, :season_length] - first[:, np.newaxis]
+    sse = np.zeros(n_items)
+    for t in range(season_length, n_periods):
+        s = season[:, t % season_length]
+        expected = level + trend + s
+        sse += (y[:, t] - expected) ** 2
+        previous_level = level
+        level = alpha * (y[:, t] - s) + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous_level) + (1 - beta) * trend
+        season[:, t % season_length] = gamma * (y[:, t] - level) + (1 - gamma) * s
+
+    steps = np.arange(1, horizon + 1)
+    seasonal = season[:, (n_periods + steps - 1) % season_length]
+    forecast = level[:, np.newaxis] + trend[:, np.newaxis] * steps + seasonal
+    return forecast.clip(min=0), sse / (n_periods - season_length)
+
+
+def forecast_demand(history, horizon=1, alpha=0.3, beta=0.1, gamma=0.1, season_length=12):
+    """Fit every smoothing model to every SKU and keep the best one per SKU.
+
+    Returns (forecast, model_index): forecast has shape (n_items, horizon) and
+    model_index points into FORECAST_MODELS for the model with the lowest
+    in-sample error. All models are scored on the same periods: from
+    season_length on when Holt-Winters can be fitted, otherwise from the
+    second period.
+    """
+    seasonal = holt_winters_smoothing(history, alpha, beta, gamma, season_length, horizon)
+    score_from = season_length if seasonal[0] is not None else 1
+    fits = [
+        simple_smoothing(history, alpha, horizon, score_from),
+        holt_smoothing(history, alpha, beta, horizon, score_from),
+        seasonal,
+    ]
+    fits = [(f, e) for f, e in fits if f is not None]
+    forecasts = np.stack([f for f, _ in fits])
+    errors = np.stack([e for _, e in fits])
+    model_index = errors.argmin(axis=0)
+    forecast = np.take_along_axis(forecasts, model_index[np.newaxis, :, np.newaxis], axis=0)[0]
+    return forecast, model_index
+
+
+def forecast_frame(data, horizon=1):
+    """Forecast next-period demand for every item in a processed inventory frame.
+
+    Uses the monthly sales columns as history and the per-item "Smoothing
+    Alpha" when the workbook provides one. Consolidated frames (with a
+    Store column) are forecast store by store, each on the periods its own
+    workbook has, so stores with different history headers do not see each
+    other's periods as zero sales. Returns None if the frame has no sales
+    history.
+    """
+    history = history_columns(data.columns)
+    if not history:
+        return None
+    alpha = np.full(len(data), 0.3)
+    if "Smoothing Alpha" in data.columns:
+        alpha = data["Smoothing Alpha"].to_numpy(dtype="float64", na_value=np.nan)
+    values = data[history].to_numpy(dtype="float64", na_value=np.nan)
+
+    if STORE_COLUMN in data.columns:
+        codes = pd.factorize(data[STORE_COLUMN], use_na_sentinel=False)[0]
+        groups = [np.flatnonzero(codes == code) for code in range(codes.max() + 1)] if len(codes) else []
+    else:
+        groups = [np.arange(len(data))]
+
+    forecast = np.full(len(data), np.nan)
+    models = np.full(len(data), None, dtype=object)
+    for rows in groups:
+        block = values[rows]
+        if len(groups) > 1:
+            block = block[:, ~np.isnan(block).all(axis=0)]  # Periods this store's workbook lacks
+        if block.shape[1] == 0:
+            continue
+        group_forecast, model_index = forecast_demand(block, horizon=horizon, alpha=alpha[rows])
+        forecast[rows] = group_forecast[:, 0]
+        models[rows] = np.asarray(FORECAST_MODELS, dtype=object)[model_index]
+    return pd.DataFrame({
+        "Item": data["Item"].to_numpy() if "Item" in data.columns else data.index,
+        "Model": models,
+        "Forecasted Demand": forecast.round(2),
+    }, index=data.index)
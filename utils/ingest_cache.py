@@ -0,0 +1,122 @@
+# File: utils/ingest_cache.py
+
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+from utils.config import CACHE_DIR, CACHE_MAX_BYTES
+from utils.data_processing import COLUMN_MAPPINGS, NUMERIC_COLUMNS, load_and_process_data
+
+# Bump when the on-disk layout of cached frames changes
+CACHE_VERSION = 3
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def content_hash(source):
+    """Return the SHA-256 of an uploaded file, raw bytes or a path on disk."""
+    sha = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        sha.update(source)
+    elif hasattr(source, "getbuffer"):
+        sha.update(source.getbuffer())
+    else:
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                sha.update(chunk)
+    return sha.hexdigest()
+
+
+def mapping_fingerprint(column_mappings=COLUMN_MAPPINGS):
+    """Short hash of the column mapping, so editing it invalidates old entries."""
+    payload = json.dumps(
+        {"version": CACHE_VERSION, "mappings": column_mappings, "numeric": NUMERIC_COLUMNS},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def cache_path(file_hash, cache_dir=CACHE_DIR):
+    """Path of the Parquet file for a given upload hash and the current mapping."""
+    return os.path.join(cache_dir, f"{file_hash}-{mapping_fingerprint()}.parquet")
+
+
+def normalize_types(df):
+    """Give the renamed frame stable column types so it round-trips through Parquet."""
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+    for col in df.columns:
+        if df[col].dtype == object:
+            # Excel columns often mix numbers and text; store them as strings
+            df[col] = df[col].astype("string")
+    return df
+
+
+def evict(cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """Delete least recently used cache files until the directory fits in max_bytes."""
+    if not os.path.isdir(cache_dir):
+        return 0
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".parquet"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+def load_cached_data(file_path, file_hash=None, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """Load an inventory workbook, reusing its processed Parquet copy when available.
+
+    The first load of a given file parses the workbook with load_and_process_data
+    and writes the renamed, typed frame to cache_dir. Later loads of the same
+    bytes read the Parquet file instead. Pass file_hash when the caller
+    already knows it (e.g. from store_upload) to skip rehashing the file.
+    """
+    path = cache_path(file_hash or content_hash(file_path), cache_dir)
+    if os.path.exists(path):
+        try:
+            df = pd.read_parquet(path)
+            os.utime(path)  # Mark as recently used for eviction
+            return df
+        except Exception:
+            # Corrupt or unreadable entry: rebuild it below
+            pass
+
+    df = normalize_types(load_and_process_data(file_path))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        evict(cache_dir, max_bytes)
+    except Exception:
+        # The cache is an optimization; a failed write must not break the upload
+        pass
+    return df
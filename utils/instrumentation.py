@@ -0,0 +1,141 @@
+# File: utils/instrumentation.py
+
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+import tracemalloc
+
+import pandas as pd
+
+from utils.config import PERF_LOG, PERF_TRACE_MEMORY_ENV
+
+# Returned by stage() when recording is off, so a disabled profiler costs one method call
+_DISABLED = contextlib.nullcontext()
+
+# tracemalloc is process-wide: profilers that trace memory share it through a reference count
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_started_tracing = False
+
+
+class _Frame:
+    __slots__ = ("name", "wall", "cpu", "memory", "peak")
+
+    def __init__(self, name, tracing):
+        self.name = name
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        self.memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+        self.peak = 0
+
+
+def memory_tracing_requested():
+    """Memory tracing slows every session in the process, so it is opted into per process."""
+    return os.environ.get(PERF_TRACE_MEMORY_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _acquire_tracing():
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        _tracing_users += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+
+
+def _release_tracing():
+    """Stop tracemalloc once the last profiler using it is closed, if it was started here."""
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        _tracing_users = max(_tracing_users - 1, 0)
+        if _tracing_users == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+class Profiler:
+    """Record wall time, CPU time and peak traced memory of named pipeline stages.
+
+    Use `with profiler.stage("load"):` around each stage. Stages may nest;
+    a stage's peak includes its children. When disabled, stage() returns a
+    shared no-op context and nothing is measured. close() ends recording
+    and releases memory tracing, so call it in a finally block; the records
+    stay available to frame() and flush(), which appends them to a
+    JSON-lines log.
+
+    CPU time and traced memory are process-wide: with several sessions
+    running at once they include the other sessions' work. Memory is only
+    traced when PERF_TRACE_MEMORY_ENV is set; peak_mb is NaN otherwise.
+    """
+
+    def __init__(self, enabled=False, log_path=PERF_LOG, context=None, trace_memory=None):
+        self.enabled = enabled
+        self.log_path = log_path
+        self.context = dict(context or {})
+        self.records = []
+        self._stack = []
+        self.trace_memory = enabled and (memory_tracing_requested() if trace_memory is None else trace_memory)
+        if self.trace_memory:
+            _acquire_tracing()
+
+    def close(self):
+        """Release memory tracing; the profiler records nothing afterwards."""
+        if self.trace_memory:
+            self.trace_memory = False
+            _release_tracing()
+        self.enabled = False
+
+    def stage(self, name):
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    @contextlib.contextmanager
+    def _measure(self, name):
+        tracing = self.trace_memory
+        if tracing:
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame = _Frame(name, tracing)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            if tracing:
+                frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            if tracing:
+                if self._stack:
+                    self._stack[-1].peak = max(self._stack[-1].peak, frame.peak)
+                tracemalloc.reset_peak()
+            self.records.append({
+                "stage": "/".join([f.name for f in self._stack] + [name]),
+                "wall_s": time.perf_counter() - frame.wall,
+                "cpu_s": time.process_time() - frame.cpu,
+                "peak_mb": max(frame.peak - frame.memory, 0) / 1e6 if tracing else math.nan,
+            })
+
+    def frame(self):
+        """Records of this run as a DataFrame, in completion order."""
+        return pd.DataFrame(self.records, columns=["stage", "wall_s", "cpu_s", "peak_mb"])
+
+    def flush(self):
+        """Append this run's records to the JSON-lines log and clear them."""
+        if not self.records:
+            return
+        timestamp = time.time()
+        try:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                for record in self.records:
+                    record = {k: None if isinstance(v, float) and math.isnan(v) else v for k, v in record.items()}
+                    f.write(json.dumps({"ts": timestamp, **self.context, **record}, ensure_ascii=False) + "\n")
+        except OSError:
+            # Instrumentation must never break the dashboard
+            pass
+        self.records = []
@@ -0,0 +1,131 @@
+# File: utils/pdf_report.py
+
+import os
+import re
+
+import pandas as pd
+from fpdf import FPDF
+
+from utils.config import PDF_FONT_CANDIDATES
+
+# Rows formatted into strings at a time; only one batch of text is alive at once
+BATCH_ROWS = 500
+
+# Tables with more columns than this are printed in landscape
+PORTRAIT_MAX_COLUMNS = 5
+
+FONT_FAMILY = "ReportSans"
+FONT_SIZE = 8
+ROW_HEIGHT = 6
+
+_HEBREW = re.compile("[֐-׿]")
+
+try:
+    from bidi.algorithm import get_display
+except ImportError:
+    def get_display(text):
+        # Without python-bidi, reverse the whole string so Hebrew reads right to left
+        return text[::-1]
+
+
+def find_unicode_font(candidates=PDF_FONT_CANDIDATES):
+    """Return the first existing font path from candidates, or None."""
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def _visual(text):
+    """Reorder Hebrew text for left-to-right rendering."""
+    return get_display(text) if _HEBREW.search(text) else text
+
+
+def _latin1(text):
+    return text.encode("latin1", "replace").decode("latin1")
+
+
+def _format_column(values):
+    """Format one batch of a column as strings; numbers get thousands separators."""
+    if values.dtype.kind in "iub":
+        return [f"{v:,}" for v in values.tolist()]
+    if values.dtype.kind == "f":
+        return ["" if v != v else f"{v:,.2f}" for v in values.tolist()]
+    return ["" if v is None or v is pd.NA or v != v else str(v) for v in values.tolist()]
+
+
+class TableReport(FPDF):
+    """A PDF whose pages carry a title and repeat the table header."""
+
+    def __init__(self, title, columns, orientation="P", font_path=None):
+        super().__init__(orientation=orientation, unit="mm", format="A4")
+        self.title_text = title
+        self.columns = list(columns)
+        self.unicode_font = False
+        if font_path:
+            try:
+                self.add_font(FONT_FAMILY, "", font_path, uni=True)
+                self.unicode_font = True
+            except Exception:
+                self.unicode_font = False
+        self.font_name = FONT_FAMILY if self.unicode_font else "Arial"
+        self.set_auto_page_break(True, margin=15)
+        self.col_width = (self.w - self.l_margin - self.r_margin) / max(len(self.columns), 1)
+        # Rough character budget per cell so text is clipped without measuring every string
+        self.max_chars = max(4, int(self.col_width / (FONT_SIZE * 0.18)))
+
+    def fit_text(self, value):
+        """Prepare a string for the selected font."""
+        value = _visual(value)
+        if len(value) > self.max_chars:
+            value = value[:self.max_chars - 1] + "~"
+        return value if self.unicode_font else _latin1(value)
+
+    def header(self):
+        self.set_font(self.font_name, "", 12)
+        self.cell(0, 8, self.fit_text(self.title_text), 0, 1, "C")
+        self.set_font(self.font_name, "", FONT_SIZE)
+        self.set_fill_color(230, 230, 230)
+        for column in self.columns:
+            self.cell(self.col_width, ROW_HEIGHT, self.fit_text(str(column)), 1, 0, "C", 1)
+        self.ln(ROW_HEIGHT)
+
+    def footer(self):
+        self.set_y(-12)
+        self.set_font(self.font_name, "", FONT_SIZE)
+        self.cell(0, 6, f"Page {self.page_no()}", 0, 0, "C")
+
+    def add_rows(self, rows, aligns):
+        for row in rows:
+            for value, align in zip(row, aligns):
+                self.cell(self.col_width, ROW_HEIGHT, self.fit_text(value), 1, 0, align)
+            self.ln(ROW_HEIGHT)
+
+
+def build_pdf_report(frame, columns=None, title="Report", batch_rows=BATCH_ROWS, font_path=None):
+    """Render frame[columns] as a paginated PDF table and return the bytes.
+
+    Each column is extracted once as an array and rows are formatted and
+    written batch_rows at a time, so no per-row Series are built. Pages
+    repeat the title and header row. Hebrew text uses the first unicode font
+    from PDF_FONT_CANDIDATES (or font_path); without one the core Arial font
+    is used with latin1 replacement.
+    """
+    try:
+        columns = list(frame.columns) if columns is None else list(columns)
+        orientation = "L" if len(columns) > PORTRAIT_MAX_COLUMNS else "P"
+        pdf = TableReport(title, columns, orientation, font_path or find_unicode_font())
+        pdf.add_page()
+        pdf.set_font(pdf.font_name, "", FONT_SIZE)
+
+        arrays = [frame[c].to_numpy() for c in columns]
+        aligns = ["R" if a.dtype.kind in "iufb" else "L" for a in arrays]
+        for start in range(0, len(frame), batch_rows):
+            batch = [_format_column(a[start:start + batch_rows]) for a in arrays]
+            pdf.add_rows(zip(*batch), aligns)
+
+        output = pdf.output(dest="S")
+        # fpdf 1.7 returns a latin1 str, fpdf2 a bytearray
+        return output.encode("latin1") if isinstance(output, str) else bytes(output)
+    except Exception as e:
+        raise ValueError(f"Error building PDF report: {e}")
@@ -0,0 +1,87 @@
+# File: utils/simulation.py
+
+import numpy as np
+import pandas as pd
+
+# Demand multipliers for the scenarios shown in the Decision-Making Tools tab
+DEMAND_SCENARIOS = {
+    "High Demand": 1.3,
+    "Normal Demand": 1.0,
+    "Low Demand": 0.7,
+}
+
+# Memory allowed for the sample arrays of one simulation chunk
+CHUNK_BYTES = 256 * 1024 * 1024
+
+# Number of float64 (simulations x items) arrays alive at once inside a chunk
+_ARRAYS_PER_CHUNK = 6
+
+
+def _column(data, name, fill):
+    if name not in data.columns:
+        return np.full(len(data), fill, dtype="float64")
+    return np.nan_to_num(data[name].to_numpy(dtype="float64", na_value=np.nan), nan=fill).clip(min=0)
+
+
+def _gamma(rng, mean, cv, size):
+    """Gamma samples with the given per-item mean and coefficient of variation."""
+    shape = 1.0 / cv ** 2
+    return rng.gamma(shape, np.maximum(mean, 1e-12) / shape, size=size) * (mean > 0)
+
+
+def simulate_inventory(data, n_simulations=1000, horizon_days=30, demand_multiplier=1.0,
+                       demand_cv=0.3, lead_time_cv=0.2, holding_rate=0.25, seed=None,
+                       chunk_bytes=CHUNK_BYTES):
+    """Monte Carlo simulation of profit, stockouts and overstock for every item.
+
+    Demand over horizon_days and lead times are drawn from gamma distributions
+    around each item's average daily demand (Stock Level / 30, scaled by
+    demand_multiplier) and Lead Time. Samples are drawn as (simulations x
+    items) arrays, a chunk of simulations at a time sized so the chunk's arrays
+    fit in chunk_bytes, and reduced per item as they go.
+
+    Returns a DataFrame aligned to data with Expected Profit, Profit Std,
+    Stockout Probability (lead-time demand above the reorder point) and
+    Expected Overstock Cost (holding cost of stock left after the horizon).
+    """
+    try:
+        stock = _column(data, "Stock Level", 0)
+        lead_time = _column(data, "Lead Time", 7)
+        cost = _column(data, "Purchase Price", 0)
+        margin = _column(data, "Selling Price", 0) - cost
+        daily_demand = stock / 30 * demand_multiplier
+        reorder_point = _column(data, "Reorder Point", np.nan)
+        reorder_point = np.where(np.isnan(reorder_point), stock, reorder_point)
+        n_items = len(stock)
+
+        rng = np.random.default_rng(seed)
+        chunk = max(1, int(chunk_bytes // (_ARRAYS_PER_CHUNK * 8 * max(n_items, 1))))
+        profit_sum = np.zeros(n_items)
+        profit_sq_sum = np.zeros(n_items)
+        stockouts = np.zeros(n_items)
+        overstock_sum = np.zeros(n_items)
+
+        for start in range(0, n_simulations, chunk):
+            size = (min(chunk, n_simulations - start), n_items)
+            demand = _gamma(rng, daily_demand * horizon_days, demand_cv, size)
+            sales = np.minimum(demand, stock)
+            leftover = stock - sales
+            profit = margin * sales - holding_rate * cost * leftover
+            profit_sum += profit.sum(axis=0)
+            profit_sq_sum += np.square(profit).sum(axis=0)
+            overstock_sum += (holding_rate * cost * leftover).sum(axis=0)
+
+            # Demand during a sampled lead time, at the same daily rate
+            lead_demand = demand / horizon_days * _gamma(rng, lead_time, lead_time_cv, size)
+            stockouts += (lead_demand > reorder_point).sum(axis=0)
+
+        mean_profit = profit_sum / n_simulations
+        variance = np.maximum(profit_sq_sum / n_simulations - mean_profit ** 2, 0)
+        return pd.DataFrame({
+            "Expected Profit": mean_profit,
+            "Profit Std": np.sqrt(variance),
+            "Stockout Probability": stockouts / n_simulations,
+            "Expected Overstock Cost": overstock_sum / n_simulations,
+        }, index=data.index)
+    except Exception as e:
+        raise ValueError(f"Error running inventory simulation: {e}")
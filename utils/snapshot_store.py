@@ -0,0 +1,184 @@
+# File: utils/snapshot_store.py
+
+import datetime
+import os
+import re
+import tempfile
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from utils.config import SNAPSHOT_DIR, STORE_COLUMN
+
+# Columns kept for every item in a snapshot
+SNAPSHOT_COLUMNS = ["Item", "Category", "Stock Level", "Purchase Price", "Selling Price", "Lead Time"]
+
+# Rows per Parquet row group; partitions are sorted by Item so scans for a
+# few items skip most row groups
+ROW_GROUP_ROWS = 8192
+
+# Parquet metadata key holding the content hash of the upload a snapshot was taken from
+_HASH_KEY = b"content_hash"
+
+_PARTITIONING = ds.partitioning(pa.schema([("store", pa.string()), ("date", pa.date32())]), flavor="hive")
+
+# Dates in file names such as "קובץ לטעינה 23.6.2024" or "12.12 פלרם" (day.month[.year])
+_NAME_DATE = re.compile(r"(?<!\d)(\d{1,2})\.(\d{1,2})(?:\.(\d{2,4}))?(?!\d)")
+
+
+def snapshot_store_key(name):
+    """Store a file's snapshots belong to: its name without the date.
+
+    "קובץ לטעינה 23.6.2024" and "קובץ לטעינה 23.7.2024" are the same store,
+    so their snapshots share one history. Names that are only a date are
+    kept whole.
+    """
+    key = " ".join(_NAME_DATE.sub(" ", name).split()).strip(" -_.")
+    return key or name
+
+
+def snapshot_date_from_name(name, today=None):
+    """Snapshot date encoded in a file name, or None if it has none.
+
+    Names without a year ("12.12") get the latest such date on or before
+    today, so a December file uploaded in January falls in the previous year.
+    """
+    match = _NAME_DATE.search(name)
+    if not match:
+        return None
+    day, month, year = (int(g) if g else None for g in match.groups())
+    if year is not None:
+        try:
+            return datetime.date(year + 2000 if year < 100 else year, month, day)
+        except ValueError:
+            return None
+    today = today or datetime.date.today()
+    for candidate_year in (today.year, today.year - 1):
+        try:
+            candidate = datetime.date(candidate_year, month, day)
+        except ValueError:
+            continue
+        if candidate <= today:
+            return candidate
+    return None
+
+
+def partition_path(store, snapshot_date, snapshot_dir=SNAPSHOT_DIR):
+    """Directory of one store's snapshot on one date."""
+    return os.path.join(snapshot_dir, f"store={quote(str(store), safe='')}", f"date={snapshot_date.isoformat()}")
+
+
+def _partition_file(store, snapshot_date, snapshot_dir=SNAPSHOT_DIR):
+    return os.path.join(partition_path(store, snapshot_date, snapshot_dir), "part-0.parquet")
+
+
+def append_snapshot(data, store, snapshot_date, snapshot_dir=SNAPSHOT_DIR, content_hash=None):
+    """Write the items of one processed upload as a zstd-compressed partition.
+
+    Writing the same store and date again replaces that partition. The file
+    is written to a temp name and renamed into place, so readers never see
+    a partial snapshot. content_hash (e.g. from store_upload) is kept with
+    the partition; when it matches the store's latest snapshot, the upload
+    is the same workbook again and nothing is written. Returns the date the
+    snapshot is recorded under.
+    """
+    try:
+        if content_hash is not None:
+            latest = latest_snapshot(store, snapshot_dir)
+            if latest is not None and latest[1] == content_hash:
+                return latest[0]
+
+        columns = [c for c in SNAPSHOT_COLUMNS if c in data.columns]
+        frame = data[columns]
+        if "Item" in columns:
+            frame = frame.sort_values("Item", kind="stable")
+        # Fixed types so every partition shares one schema, whatever the upload's dtypes
+        frame = frame.astype({c: ("string" if c in ("Item", "Category") else "float64") for c in columns})
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if content_hash is not None:
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), _HASH_KEY: content_hash.encode("utf-8")})
+
+        target = _partition_file(store, snapshot_date, snapshot_dir)
+        directory = os.path.dirname(target)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")  # Hidden from scans
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path, compression="zstd", row_group_size=ROW_GROUP_ROWS)
+            os.replace(tmp_path, target)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return snapshot_date
+    except Exception as e:
+        raise ValueError(f"Error saving snapshot: {e}")
+
+
+def list_snapshots(snapshot_dir=SNAPSHOT_DIR):
+    """Stores and dates available, from the partition directories only."""
+    if not os.path.isdir(snapshot_dir):
+        return pd.DataFrame({STORE_COLUMN: pd.Series(dtype="string"), "Snapshot Date": pd.Series(dtype="object")})
+    dataset = ds.dataset(snapshot_dir, format="parquet", partitioning=_PARTITIONING)
+    rows = []
+    for fragment in dataset.get_fragments():
+        keys = ds.get_partition_keys(fragment.partition_expression)
+        rows.append((keys["store"], keys["date"]))
+    frame = pd.DataFrame(rows, columns=[STORE_COLUMN, "Snapshot Date"]).drop_duplicates()
+    return frame.sort_values([STORE_COLUMN, "Snapshot Date"], ignore_index=True)
+
+
+def previous_snapshot_date(store, snapshot_date, snapshot_dir=SNAPSHOT_DIR):
+    """Latest snapshot date of store strictly before snapshot_date, or None."""
+    snapshots = list_snapshots(snapshot_dir)
+    dates = snapshots.loc[(snapshots[STORE_COLUMN] == store) & (snapshots["Snapshot Date"] < snapshot_date), "Snapshot Date"]
+    return dates.max() if len(dates) else None
+
+
+def latest_snapshot(store, snapshot_dir=SNAPSHOT_DIR):
+    """(date, content hash) of store's most recent snapshot, or None if it has none.
+
+    The hash is None for snapshots written without one.
+    """
+    snapshots = list_snapshots(snapshot_dir)
+    dates = snapshots.loc[snapshots[STORE_COLUMN] == str(store), "Snapshot Date"]
+    if not len(dates):
+        return None
+    latest = dates.max()
+    content_hash = (pq.read_schema(_partition_file(store, latest, snapshot_dir)).metadata or {}).get(_HASH_KEY)
+    return latest, content_hash.decode("utf-8") if content_hash else None
+
+
+def load_snapshots(stores=None, start=None, end=None, items=None, categories=None, columns=None,
+                   snapshot_dir=SNAPSHOT_DIR):
+    """Scan the snapshot history, reading only matching partitions and row groups.
+
+    stores, items and categories are collections of values to keep; start and
+    end bound the snapshot date (inclusive). Store and date filters prune
+    whole partitions; item and category filters are pushed down to the
+    Parquet scan, where item filters also skip row groups by their statistics. Returns a frame with Store and
+    Snapshot Date columns followed by the item columns.
+    """
+    try:
+        if not os.path.isdir(snapshot_dir):
+            return pd.DataFrame(columns=[STORE_COLUMN, "Snapshot Date"] + (columns or SNAPSHOT_COLUMNS))
+        dataset = ds.dataset(snapshot_dir, format="parquet", partitioning=_PARTITIONING)
+        condition = None
+        for expression in (
+            ds.field("store").isin(pa.array([str(s) for s in stores], pa.string())) if stores is not None else None,
+            ds.field("date") >= pa.scalar(start, pa.date32()) if start is not None else None,
+            ds.field("date") <= pa.scalar(end, pa.date32()) if end is not None else None,
+            ds.field("Item").isin(pa.array([str(i) for i in items], pa.string())) if items is not None else None,
+            ds.field("Category").isin(pa.array([str(c) for c in categories], pa.string()))
+            if categories is not None else None,
+        ):
+            if expression is not None:
+                condition = expression if condition is None else condition & expression
+        wanted = [c for c in (columns or SNAPSHOT_COLUMNS) if c in dataset.schema.names]
+        table = dataset.to_table(columns=["store", "date"] + wanted, filter=condition)
+        frame = table.to_pandas(date_as_object=False)
+        return frame.rename(columns={"store": STORE_COLUMN, "date": "Snapshot Date"})
+    except Exception as e:
+        raise ValueError(f"Error loading snapshots: {e}")
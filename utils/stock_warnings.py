@@ -0,0 +1,91 @@
+# File: utils/stock_warnings.py
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# A warning rule: labels to assign and a condition over the column arrays
+WarningRule = namedtuple("WarningRule", ["status", "risk", "priority", "condition"])
+
+# Checked in order; the first matching rule wins. Statuses must be unique.
+WARNING_RULES = [
+    WarningRule(
+        "Out of Stock", "High", "Order Now - Out of Stock",
+        lambda c, p: c["Stock Level"] <= 0,
+    ),
+    WarningRule(
+        "Low Stock", "High", "Order Now - Below Reorder Point",
+        lambda c, p: c["Stock Level"] < c["Reorder Point"],
+    ),
+    WarningRule(
+        "Overstock", "Medium", "Delayed Order - Overstock",
+        lambda c, p: c["Stock Level"] > c["Reorder Point"] * p["overstock_factor"],
+    ),
+]
+
+# Labels for items that match no rule
+DEFAULT_WARNING = WarningRule("Normal", "Low", "No Action", None)
+
+RISK_LEVELS = ["High", "Medium", "Low"]
+
+
+class _Columns(dict):
+    """Column arrays converted to float64 the first time a rule reads them."""
+
+    def __init__(self, data):
+        super().__init__()
+        self.data = data
+
+    def __missing__(self, name):
+        values = self.data[name].to_numpy(dtype="float64", na_value=np.nan)
+        self[name] = values
+        return values
+
+
+class WarningResult:
+    """Per-item warning labels as categoricals aligned to the source frame."""
+
+    def __init__(self, codes, rules):
+        self.codes = codes
+        self.rules = rules
+        statuses = [r.status for r in rules]
+        self.status = pd.Categorical.from_codes(codes, statuses)
+        self.priority = pd.Categorical.from_codes(codes, [r.priority for r in rules])
+        risk_codes = np.array([RISK_LEVELS.index(r.risk) for r in rules])
+        self.risk = pd.Categorical.from_codes(risk_codes[codes], RISK_LEVELS)
+
+    def positions(self, status=None, risk=None):
+        """Row positions of items with the given status and/or risk level."""
+        mask = np.ones(len(self.codes), dtype=bool)
+        if status is not None:
+            mask &= self.status.codes == self.status.categories.get_loc(status)
+        if risk is not None:
+            mask &= self.risk.codes == RISK_LEVELS.index(risk)
+        return np.flatnonzero(mask)
+
+    def counts(self):
+        """Number of items per status."""
+        return pd.Series(np.bincount(self.codes, minlength=len(self.rules)), index=self.status.categories)
+
+
+def evaluate_warnings(data, rules=WARNING_RULES, overstock_factor=2.0):
+    """Evaluate the warning rules over every item in one vectorized pass.
+
+    Each rule reads the columns it needs (the defaults use "Stock Level" and
+    "Reorder Point"); every column is converted once. Missing values never match a
+    rule, so those items fall through to DEFAULT_WARNING. Returns a
+    WarningResult; use its positions() to select rows instead of building
+    filtered copies of the frame.
+    """
+    try:
+        columns = _Columns(data)
+        params = {"overstock_factor": overstock_factor}
+        codes = np.select(
+            [rule.condition(columns, params) for rule in rules],
+            np.arange(len(rules)),
+            default=len(rules),
+        )
+        return WarningResult(codes, list(rules) + [DEFAULT_WARNING])
+    except Exception as e:
+        raise ValueError(f"Error evaluating warnings: {e}")
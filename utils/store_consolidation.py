@@ -0,0 +1,67 @@
+# File: utils/store_consolidation.py
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.config import STORE_COLUMN
+from utils.ingest_cache import load_cached_data
+
+
+def store_name(path):
+    """Store label of a workbook: its file name without the extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def discover_workbooks(*directories):
+    """All .xlsx workbooks in the given directories, skipping Excel lock files."""
+    paths = []
+    for directory in directories:
+        for path in sorted(glob.glob(os.path.join(directory, "*.xlsx"))):
+            if not os.path.basename(path).startswith("~$"):
+                paths.append(path)
+    return paths
+
+
+def _load_store(path):
+    """Load one workbook in a worker process (parsed once, then served from the Parquet cache)."""
+    try:
+        return load_cached_data(path)
+    except Exception as e:
+        raise ValueError(f"{os.path.basename(path)}: {e}")
+
+
+def load_stores(paths, names=None, max_workers=None):
+    """Load several store workbooks in parallel into one frame with a Store column.
+
+    Each workbook is parsed in its own process with the shared column
+    mapping. The frames are concatenated in the order given and tagged with
+    a categorical STORE_COLUMN built from the names (defaults to the file
+    names), so per-store views can group or filter on it cheaply. Sales
+    history periods missing from a store are left empty; forecast_frame
+    forecasts each store on its own periods only.
+    """
+    paths = list(paths)
+    names = [store_name(p) for p in paths] if names is None else list(names)
+    if len(names) != len(paths):
+        raise ValueError("Error loading stores: one name is needed per workbook")
+    if len(set(names)) != len(names):
+        raise ValueError("Error loading stores: store names must be unique")
+
+    try:
+        if len(paths) <= 1 or max_workers == 1:
+            # Not worth starting worker processes
+            frames = [_load_store(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                frames = list(pool.map(_load_store, paths))
+    except Exception as e:
+        raise ValueError(f"Error loading stores: {e}")
+
+    data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    codes = np.repeat(np.arange(len(frames), dtype="int32"), [len(f) for f in frames])
+    data.insert(0, STORE_COLUMN, pd.Categorical.from_codes(codes, names))
+    return data
@@ -0,0 +1,61 @@
+# File: utils/table_format.py
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Cell styles for warning risk levels
+RISK_BACKGROUNDS = {
+    "High": "background-color: red;",
+    "Medium": "background-color: orange;",
+    "Low": "background-color: green;",
+}
+RISK_TEXT_COLORS = {
+    "High": "color: red;",
+    "Medium": "color: orange;",
+}
+
+# Display formats passed to st.dataframe as column configuration
+NUMBER_FORMATS = {
+    "EOQ": "%.2f",
+    "Reorder Point": "%.2f",
+    "Safety Stock": "%.2f",
+    "Forecasted Demand": "%.2f",
+    "Total Value": "%.2f",
+    "Cumulative Percentage": "%.1f%%",
+    "Stockout Probability": "%.3f",
+}
+
+
+def css_where(mask, css):
+    """CSS per row: css (a string or per-row array) where mask is true, nothing elsewhere."""
+    return np.where(np.asarray(mask, dtype=bool), css, "")
+
+
+def css_by_category(categorical, styles):
+    """CSS per row looked up from a Categorical's codes in one take."""
+    categorical = pd.Categorical(categorical)
+    lookup = np.array([styles.get(c, "") for c in categorical.categories] + [""], dtype=object)
+    return lookup[categorical.codes]  # Code -1 (missing) picks the trailing ""
+
+
+def column_config(columns):
+    """Number formats for the columns that have one."""
+    return {
+        col: st.column_config.NumberColumn(format=NUMBER_FORMATS[col])
+        for col in columns if col in NUMBER_FORMATS
+    }
+
+
+def style_page(page_frame, positions, cell_styles):
+    """Apply precomputed per-row CSS arrays to the rows of one page.
+
+    cell_styles maps a column to a CSS array aligned to the full frame; only
+    the entries for this page's positions are used, so no Python code runs
+    per cell.
+    """
+    css = pd.DataFrame("", index=page_frame.index, columns=page_frame.columns)
+    for col, styles in cell_styles.items():
+        if col in css.columns:
+            css[col] = np.asarray(styles, dtype=object)[positions]
+    return page_frame.style.apply(lambda _: css, axis=None)
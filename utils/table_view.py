@@ -0,0 +1,93 @@
+# File: utils/table_view.py
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.table_format import column_config, style_page
+
+PAGE_SIZE = 50
+
+
+def _sort_positions(values, positions, limit, descending):
+    """Order positions by values, fully sorting only when the page is deep."""
+    keys = values[positions]
+    if keys.dtype.kind in "fiub":
+        keys = keys.astype("float64")
+        if descending:
+            keys = -keys  # NaN stays NaN and sorts last either way
+        if limit < len(keys) // 2:
+            head = np.argpartition(keys, limit - 1)[:limit]
+            return positions[head[np.argsort(keys[head], kind="stable")]]
+        return positions[np.argsort(keys, kind="stable")]
+    order = pd.Series(keys).astype(str).argsort(kind="stable").to_numpy()
+    return positions[order[::-1] if descending else order]
+
+
+def filter_positions(data, filter_column=None, filter_text=None, rows=None):
+    """Row positions (within rows, if given) whose filter_column contains filter_text."""
+    positions = np.arange(len(data)) if rows is None else np.asarray(rows)
+    if filter_column is None or not filter_text:
+        return positions
+    matches = data[filter_column].iloc[positions].astype(str).str.contains(filter_text, case=False, regex=False)
+    return positions[matches.to_numpy(dtype=bool, na_value=False)]
+
+
+def page_positions(data, positions, page=0, page_size=PAGE_SIZE, sort_by=None, descending=False):
+    """Return the row positions of one page of the view, sorted if asked.
+
+    Sorting works on row positions, so the frame itself is never sorted or
+    copied.
+    """
+    start = page * page_size
+    end = min(start + page_size, len(positions))
+    if sort_by is not None and len(positions):
+        column = data[sort_by]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # Sort categoricals in category order (e.g. High, Medium, Low), missing last
+            values = column.cat.codes.to_numpy(dtype="float64")
+            values[values < 0] = np.nan
+        else:
+            values = column.to_numpy()
+        positions = _sort_positions(values, positions, end, descending)
+    return positions[start:end]
+
+
+def page_slice(data, positions, page=0, page_size=PAGE_SIZE, sort_by=None, descending=False):
+    """Return the rows of one page; only these rows are materialized."""
+    return data.iloc[page_positions(data, positions, page, page_size, sort_by, descending)]
+
+
+def render_table(data, key, columns=None, page_size=PAGE_SIZE, sort_by=None, descending=False,
+                 rows=None, cell_styles=None):
+    """Show a frame one page at a time with server-side sorting and filtering.
+
+    rows restricts the view to some row positions (e.g. one warning status)
+    without copying the frame. cell_styles maps columns to per-row CSS arrays
+    from utils.table_format, applied to the visible page only.
+    """
+    labels = list(data.columns) if columns is None else list(columns)
+
+    filter_col, text_col, sort_col, order_col = st.columns([2, 3, 2, 1])
+    filter_column = filter_col.selectbox("Filter column", labels, format_func=str, key=f"{key}_filter_column")
+    filter_text = text_col.text_input("Contains", key=f"{key}_filter_text")
+    sort_options = [None] + labels
+    sort_choice = sort_col.selectbox(
+        "Sort by", sort_options,
+        index=sort_options.index(sort_by) if sort_by in labels else 0,
+        format_func=lambda c: "(none)" if c is None else str(c),
+        key=f"{key}_sort_by",
+    )
+    descending = order_col.checkbox("Desc", value=descending, key=f"{key}_descending")
+
+    positions = filter_positions(data, filter_column, filter_text, rows)
+    total = len(positions)
+    pages = max(1, -(-total // page_size))
+    page = st.number_input(f"Page (of {pages:,})", 1, pages, 1, key=f"{key}_page") - 1
+
+    shown = page_positions(data, positions, page, page_size, sort_choice, descending)
+    page_frame = data.iloc[shown][labels]
+    styled = style_page(page_frame, shown, cell_styles) if cell_styles else page_frame
+    st.dataframe(styled, use_container_width=True, column_config=column_config(labels))
+    first = page * page_size + 1 if total else 0
+    st.caption(f"Rows {first:,}-{page * page_size + len(shown):,} of {total:,} (catalog: {len(data):,})")